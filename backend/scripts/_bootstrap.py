@@ -0,0 +1,63 @@
+"""
+Shared start-up helpers for the manual test scripts.
+
+The scripts run as ``python scripts/<name>.py``, so this directory is on
+sys.path and they import these helpers with ``from _bootstrap import ...``.
+"""
+
+import asyncio
+import os
+
+
+def disable_tracing() -> None:
+    """
+    Turn off LangSmith/OpenTelemetry export unless VOXY_TEST_TRACE is set.
+
+    Smoke tests don't need every node transition shipped over HTTPS. Must run
+    after the src config modules load .env (they use override=True).
+    """
+    if os.getenv("VOXY_TEST_TRACE"):
+        return
+    os.environ["LANGCHAIN_TRACING_V2"] = "false"
+    os.environ["LANGSMITH_TRACING"] = "false"
+    os.environ["OTEL_SDK_DISABLED"] = "true"
+
+
+def install_uvloop() -> None:
+    """Use uvloop's event loop policy when installed (optional speedup)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def message_text(message) -> str:
+    """
+    Text of a graph message, without falling back to repr().
+
+    Messages without string content (dicts, tool payloads) are serialized as
+    compact JSON instead of str(), which walks every nested field and can
+    leak metadata into the output.
+
+    Args:
+        message: Last message from the graph state
+
+    Returns:
+        Message content, or its JSON serialization
+    """
+    content = getattr(message, "content", message)
+    if isinstance(content, str):
+        return content
+
+    def fallback(obj):
+        return getattr(obj, "__dict__", str(obj))
+
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.dumps(content, default=fallback, ensure_ascii=False)
+    return orjson.dumps(content, default=fallback).decode()
@@ -25,20 +25,42 @@ Uso:
     # Benchmark de performance
     poetry run python scripts/test_agent.py calculator \\
         --expression "2+2" \\
-        --benchmark --iterations 5
+        --benchmark --iterations 5 --concurrency 2
+
+    # Benchmark com cache/rate limit ativos (iterações sequenciais)
+    poetry run python scripts/test_agent.py --no-bypass-cache \\
+        --benchmark calculator --expression "2+2"
+
+    # Opcional: uvloop é usado automaticamente se estiver instalado
+    pip install uvloop
 """
 
 import argparse
 import asyncio
 import json
+import math
+import os
+import statistics
 import sys
-from datetime import datetime
-from pathlib import Path
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from voxy_agents.utils.test_subagents import SubagentTester
+import threading
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from contextlib import ExitStack, asynccontextmanager, nullcontext
+from dataclasses import dataclass, field
+
+from _bootstrap import install_uvloop
+
+# Add src to path for imports (plain string ops; skipped if already present,
+# e.g. when the module is re-imported)
+SRC_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src")
+)
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+# NOTE: SubagentTester is imported inside the functions that use it, so
+# --help, --list and argument errors don't pay the agents stack import cost.
 
 # ============================================================================
 # Colors for terminal output
@@ -58,17 +80,370 @@ class Colors:
     BOLD = "\033[1m"
     UNDERLINE = "\033[4m"
 
+    # Pre-built color + bold combinations
+    HEADER_BOLD = HEADER + BOLD
+    BLUE_BOLD = OKBLUE + BOLD
+    CYAN_BOLD = OKCYAN + BOLD
+    GREEN_BOLD = OKGREEN + BOLD
+    FAIL_BOLD = FAIL + BOLD
+
+
+# Piped to a file or CI log: drop ANSI codes entirely instead of writing them
+USE_COLOR = sys.stdout.isatty()
+if not USE_COLOR:
+    for _name, _value in vars(Colors).copy().items():
+        if isinstance(_value, str) and _value.startswith("\033"):
+            setattr(Colors, _name, "")
+
+HEADER_BAR = "=" * 70
+
+
+def colored(text: str, color: str = Colors.ENDC) -> str:
+    """Wrap text in a color (plain text when stdout is not a TTY)."""
+    return color + text + Colors.ENDC if USE_COLOR else text
+
 
 def print_colored(text: str, color: str = Colors.ENDC):
     """Print text with color."""
-    print(f"{color}{text}{Colors.ENDC}")
+    sys.stdout.write(colored(text, color) + "\n")
+
+
+def write_lines(lines: list[str]):
+    """Write a block of lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_header(text: str):
     """Print header with formatting."""
-    print_colored(f"\n{'=' * 70}", Colors.HEADER)
-    print_colored(f"  {text}", Colors.HEADER + Colors.BOLD)
-    print_colored(f"{'=' * 70}\n", Colors.HEADER)
+    print_colored(f"\n{HEADER_BAR}", Colors.HEADER)
+    print_colored(f"  {text}", Colors.HEADER_BOLD)
+    print_colored(f"{HEADER_BAR}\n", Colors.HEADER)
+
+
+# ============================================================================
+# Benchmark Helpers
+# ============================================================================
+
+
+@asynccontextmanager
+async def shared_llm_session(max_connections: int):
+    """
+    Share one HTTPX AsyncClient with LiteLLM across benchmark iterations.
+
+    LiteLLM creates its own HTTP client per call unless aclient_session is
+    set; a shared client keeps connections (and TLS sessions) alive between
+    iterations. Only for LangGraph runs (graph.ainvoke / astream_events):
+    every model call, tools included, then stays on this event loop, which
+    an AsyncClient requires. The previous session is restored on exit.
+
+    Args:
+        max_connections: Pool size (matches benchmark concurrency)
+    """
+    import httpx
+    import litellm
+
+    limits = httpx.Limits(
+        max_connections=max_connections, max_keepalive_connections=max_connections
+    )
+    previous = litellm.aclient_session
+    async_client = httpx.AsyncClient(limits=limits)
+    litellm.aclient_session = async_client
+
+    try:
+        yield
+    finally:
+        litellm.aclient_session = previous
+        await async_client.aclose()
+
+
+async def run_iterations(run_once, args, describe=None, share_llm_session=False):
+    """
+    Run benchmark iterations concurrently, bounded by a semaphore.
+
+    Warmup iterations run sequentially first and are discarded, so one-time
+    costs (connection pool, TLS handshake, lazy imports) don't skew timings.
+    Progress lines are written without flushing (stdout is flushed once at
+    the end), so terminal I/O doesn't interleave with the measured calls.
+    With --ndjson-path, each iteration is appended as one JSON line as soon
+    as it completes, so partial results survive a crash.
+
+    Args:
+        run_once: Coroutine function receiving the iteration index
+        args: Command line arguments (iterations, concurrency, quiet, warmup,
+            ndjson_path)
+        describe: Optional function mapping a result to extra NDJSON fields
+        share_llm_session: Reuse one LiteLLM AsyncClient across iterations
+            (LangGraph engine only; see shared_llm_session)
+
+    Returns:
+        List of (elapsed_seconds, result) tuples, in iteration order
+    """
+    iterations = args.iterations
+    # Concurrent iterations would race on the cache / rate limiter, so only
+    # overlap them when both are bypassed; a reused thread is one checkpoint,
+    # so its iterations always run one at a time
+    can_overlap = args.bypass_cache and args.bypass_rate_limit and not args.reuse_thread
+    concurrency = max(1, args.concurrency) if can_overlap else 1
+    semaphore = asyncio.Semaphore(concurrency)
+    write = sys.stdout.write
+    # Built once per benchmark; the loops only format the index
+    iteration_line = colored(f"Iteration {{}}/{iterations}...", Colors.OKBLUE).format
+    warmup_line = colored(f"Warmup {{}}/{args.warmup}...", Colors.OKBLUE).format
+
+    with ExitStack() as stack:
+        ndjson = (
+            stack.enter_context(open(args.ndjson_path, "a", buffering=1))
+            if args.ndjson_path
+            else None
+        )
+
+        async def timed(i: int):
+            async with semaphore:
+                if not args.quiet:
+                    write(iteration_line(i + 1) + "\n")
+                start = time.perf_counter_ns()
+                result = await run_once(i)
+                elapsed = (time.perf_counter_ns() - start) / 1e9
+
+            if ndjson:
+                record = {"iter": i, "elapsed": elapsed}
+                if describe:
+                    record.update(describe(result))
+                ndjson.write(json.dumps(record, default=str) + "\n")
+
+            return elapsed, result
+
+        session = (
+            shared_llm_session(concurrency) if share_llm_session else nullcontext()
+        )
+        async with session:
+            for w in range(args.warmup):
+                if not args.quiet:
+                    write(warmup_line(w + 1) + "\n")
+                # Indexes past the measured range keep warmup thread IDs unique
+                await run_once(iterations + w)
+
+            runs = await asyncio.gather(*(timed(i) for i in range(iterations)))
+
+    sys.stdout.flush()
+    return runs
+
+
+@dataclass
+class GraphRun:
+    """Outcome of a streamed LangGraph execution."""
+
+    result: dict
+    ttfb: float | None = None
+    node_times: dict[str, float] = field(default_factory=dict)
+
+
+async def stream_graph(graph, state, config) -> GraphRun:
+    """
+    Execute graph via astream_events, capturing TTFB and per-node durations.
+
+    TTFB is only available when the underlying chat model streams tokens
+    (on_chat_model_stream events); otherwise it stays None.
+
+    Args:
+        graph: Compiled LangGraph
+        state: Initial VoxyState
+        config: Checkpoint config
+
+    Returns:
+        GraphRun with final state, TTFB and per-node elapsed seconds
+    """
+    start = time.perf_counter_ns()
+    run = GraphRun(result={})
+    node_starts: dict[str, int] = {}
+
+    async for event in graph.astream_events(state, config=config, version="v2"):
+        kind = event["event"]
+        node = event.get("metadata", {}).get("langgraph_node")
+
+        if run.ttfb is None and kind == "on_chat_model_stream":
+            run.ttfb = (time.perf_counter_ns() - start) / 1e9
+        elif kind == "on_chain_start" and event["name"] == node:
+            node_starts[node] = time.perf_counter_ns()
+        elif kind == "on_chain_end":
+            if event["name"] == node and node in node_starts:
+                elapsed_ns = time.perf_counter_ns() - node_starts.pop(node)
+                run.node_times[node] = elapsed_ns / 1e9
+            elif not event.get("parent_ids"):
+                # Root graph finished: its output is the final state
+                run.result = event["data"]["output"]
+
+    return run
+
+
+def print_stream_stats(graph_runs):
+    """Print TTFB percentiles and average per-node durations for streamed runs."""
+    lines = []
+    ttfbs = [run.ttfb for run in graph_runs if run.ttfb is not None]
+    if ttfbs:
+        lines.append(colored("\n⚡ Time To First Token:", Colors.CYAN_BOLD))
+        if len(ttfbs) > 1:
+            percentiles = statistics.quantiles(ttfbs, n=100)
+            lines.append(f"  p50:     {percentiles[49]:.3f}s")
+            lines.append(f"  p95:     {percentiles[94]:.3f}s")
+        else:
+            lines.append(f"  TTFB:    {ttfbs[0]:.3f}s")
+
+    node_totals: dict[str, list[float]] = {}
+    for run in graph_runs:
+        for node, elapsed in run.node_times.items():
+            node_totals.setdefault(node, []).append(elapsed)
+
+    if node_totals:
+        lines.append(colored("\n🧩 Node Timing (average):", Colors.CYAN_BOLD))
+        for node, node_times in node_totals.items():
+            lines.append(f"  {node}: {statistics.fmean(node_times):.3f}s")
+
+    if lines:
+        write_lines(lines)
+
+
+def message_content(message) -> str:
+    """Return a message's content, falling back to its string form."""
+    content = getattr(message, "content", None)
+    return str(message) if content is None else content
+
+
+def describe_graph_run(graph_run) -> dict:
+    """NDJSON fields for a streamed LangGraph run."""
+    return {
+        "ttfb": graph_run.ttfb,
+        "route": graph_run.result.get("context", {}).get("route_taken"),
+        "node_times": graph_run.node_times,
+    }
+
+
+def describe_test_result(result) -> dict:
+    """NDJSON fields for a SubagentTester/VOXY TestResult."""
+    metadata = result.metadata
+    return {
+        "success": result.success,
+        "cost": metadata.cost,
+        "cache_hit": metadata.cache_hit,
+        "tools": metadata.tools_used,
+    }
+
+
+# Labels for the route_taken marker set by vision_bypass/supervisor nodes
+ROUTE_LABELS = {
+    "PATH_1": "PATH1 (vision_bypass)",
+    "PATH_2": "PATH2 (supervisor)",
+}
+
+
+def get_route_label(ctx) -> str:
+    """Return a display label for the route recorded in the state context."""
+    route_taken = ctx.get("route_taken")
+    return ROUTE_LABELS.get(route_taken, route_taken or "unknown")
+
+
+def clone_state(base_state, thread_id=None):
+    """
+    Copy a pre-built VoxyState template for a new benchmark iteration.
+
+    Only the mutable containers are copied, so each iteration avoids
+    rebuilding the full initial state.
+
+    Args:
+        base_state: State created once via create_initial_state
+        thread_id: Thread ID for this iteration (default: keep template's)
+
+    Returns:
+        Independent VoxyState ready for graph.ainvoke
+    """
+    context = base_state["context"]
+    return {
+        **base_state,
+        "messages": list(base_state["messages"]),
+        "context": {
+            **context,
+            "thread_id": thread_id or context["thread_id"],
+            "tool_invocations": [],
+            "metadata": {},
+        },
+    }
+
+
+def print_timing_stats(times, warmup=0):
+    """Print min/max/average/total and latency percentiles for benchmark times."""
+    total = math.fsum(times)
+    lines = [
+        colored("⏱️  Timing Statistics:", Colors.CYAN_BOLD),
+        f"  Warmup:  {warmup} iteration(s) discarded",
+        f"  Min:     {min(times):.3f}s",
+        f"  Max:     {max(times):.3f}s",
+        f"  Average: {statistics.fmean(times):.3f}s",
+        f"  Total:   {total:.3f}s",
+    ]
+
+    # Cold/warm split and percentiles need at least two samples
+    if len(times) > 1:
+        percentiles = statistics.quantiles(times, n=100)
+        lines += (
+            f"  Cold:    {times[0]:.3f}s",
+            f"  Warm:    {statistics.fmean(times[1:]):.3f}s",
+            f"  p50:     {percentiles[49]:.3f}s",
+            f"  p90:     {percentiles[89]:.3f}s",
+            f"  p95:     {percentiles[94]:.3f}s",
+            f"  p99:     {percentiles[98]:.3f}s",
+        )
+
+    write_lines(lines)
+
+
+def print_counts(title: str, counts: Counter):
+    """Print occurrence counts (routes, tools), most frequent first."""
+    lines = [colored(title, Colors.CYAN_BOLD)]
+    for key, count in counts.most_common():
+        lines.append(f"  {key}: {count} times")
+    write_lines(lines)
+
+
+class RunningStats:
+    """Single-pass min/max/total accumulator with O(1) memory."""
+
+    __slots__ = ("count", "total", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float):
+        """Fold one sample into the running statistics."""
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        """Average of the samples seen so far."""
+        return self.total / self.count if self.count else 0.0
+
+    def __bool__(self) -> bool:
+        return self.count > 0
+
+
+def print_cost_stats(costs: RunningStats):
+    """Print min/max/average/total for benchmark costs."""
+    write_lines(
+        [
+            colored("\n💰 Cost Statistics:", Colors.CYAN_BOLD),
+            f"  Min:     ${costs.min:.6f}",
+            f"  Max:     ${costs.max:.6f}",
+            f"  Average: ${costs.mean:.6f}",
+            f"  Total:   ${costs.total:.6f}",
+        ]
+    )
 
 
 # ============================================================================
@@ -95,7 +470,7 @@ async def test_translator_langgraph(args):
     print_header("Testing TRANSLATOR (LangGraph Engine)")
 
     # Print input data
-    print_colored("📝 Input Data:", Colors.OKCYAN + Colors.BOLD)
+    print_colored("📝 Input Data:", Colors.CYAN_BOLD)
     print(f"  text: {args.text}")
     print(f"  target_language: {args.target_language}")
     if args.source_language:
@@ -132,72 +507,73 @@ async def test_translator_langgraph(args):
             f"🏁 Benchmark Mode: {args.iterations} iterations\n", Colors.WARNING
         )
 
-        times = []
-        for i in range(args.iterations):
-            print_colored(f"Iteration {i + 1}/{args.iterations}...", Colors.OKBLUE)
+        # Build state template and config once; iterations only copy them
+        base_state = create_initial_state(
+            messages=[{"role": "user", "content": prompt}], thread_id="test-bench"
+        )
+        shared_config = get_checkpoint_config(thread_id="test-bench")
+
+        async def run_once(i):
+            if args.reuse_thread:
+                return await stream_graph(graph, clone_state(base_state), shared_config)
 
-            start = datetime.now()
             thread_id = f"test-{i}"
+            state = clone_state(base_state, thread_id)
             config = get_checkpoint_config(thread_id=thread_id)
+            return await stream_graph(graph, state, config)
 
-            state = create_initial_state(
-                messages=[{"role": "user", "content": prompt}], thread_id=thread_id
-            )
-
-            result = graph.invoke(state, config=config)
-            elapsed = (datetime.now() - start).total_seconds()
-            times.append(elapsed)
+        runs = await run_iterations(
+            run_once, args, describe_graph_run, share_llm_session=True
+        )
+        times = [elapsed for elapsed, _ in runs]
+        result = runs[-1][1].result
 
         # Print benchmark results
         print_header("Benchmark Results")
-        print_colored("⏱️  Timing Statistics:", Colors.OKCYAN + Colors.BOLD)
-        print(f"  Min:     {min(times):.3f}s")
-        print(f"  Max:     {max(times):.3f}s")
-        print(f"  Average: {sum(times) / len(times):.3f}s")
-        print(f"  Total:   {sum(times):.3f}s")
+        print_timing_stats(times, args.warmup)
+        print_stream_stats([graph_run for _, graph_run in runs])
 
         return result
 
     # Single test execution
     print_colored("⚡ Running test...\n", Colors.WARNING)
 
-    start_time = datetime.now()
-    thread_id = f"test-{start_time.timestamp()}"
+    thread_id = f"test-{time.time_ns()}"
+    start_time = time.perf_counter_ns()
     config = get_checkpoint_config(thread_id=thread_id)
 
     state = create_initial_state(
         messages=[{"role": "user", "content": prompt}], thread_id=thread_id
     )
 
-    result = graph.invoke(state, config=config)
-    total_time = (datetime.now() - start_time).total_seconds()
+    graph_run = await stream_graph(graph, state, config)
+    result = graph_run.result
+    total_time = (time.perf_counter_ns() - start_time) / 1e9
 
     # Print results
     print_header("Results")
+    ctx = result.get("context", {})
+    msgs = result.get("messages", [])
 
-    print_colored("✅ Status:", Colors.OKGREEN + Colors.BOLD)
+    print_colored("✅ Status:", Colors.GREEN_BOLD)
     print("  Success: True")
     print()
 
-    print_colored("🤖 Response:", Colors.OKCYAN + Colors.BOLD)
+    print_colored("🤖 Response:", Colors.CYAN_BOLD)
     # Extract response from messages
-    if result["messages"]:
-        last_message = result["messages"][-1]
-        response_text = (
-            last_message.content
-            if hasattr(last_message, "content")
-            else str(last_message)
-        )
-        print(f"  {response_text}")
+    if msgs:
+        print(f"  {message_content(msgs[-1])}")
     print()
 
-    print_colored("⏱️  Performance:", Colors.OKCYAN + Colors.BOLD)
+    print_colored("⏱️  Performance:", Colors.CYAN_BOLD)
     print(f"  Processing time: {total_time:.3f}s")
+    if graph_run.ttfb is not None:
+        print(f"  Time to first token: {graph_run.ttfb:.3f}s")
     print()
 
-    print_colored("📊 Context:", Colors.OKCYAN + Colors.BOLD)
-    print(f"  Thread ID: {result['context']['thread_id']}")
-    print(f"  Message count: {len(result['messages'])}")
+    print_colored("📊 Context:", Colors.CYAN_BOLD)
+    print(f"  Thread ID: {ctx['thread_id']}")
+    print(f"  Message count: {len(msgs)}")
     print()
 
     return result
@@ -209,13 +585,13 @@ async def test_voxy_langgraph(args):
         CheckpointerType,
         get_checkpoint_config,
     )
-    from voxy_agents.langgraph.graph_builder import create_phase3_graph
+    from voxy_agents.langgraph.graph_builder import get_or_build_graph
     from voxy_agents.langgraph.graph_state import create_initial_state
 
     print_header("Testing VOXY ORCHESTRATOR (LangGraph Engine - Phase 3)")
 
     # Print input data
-    print_colored("📝 Input Data:", Colors.OKCYAN + Colors.BOLD)
+    print_colored("📝 Input Data:", Colors.CYAN_BOLD)
     print(f"  message: {args.message}")
     if args.image_url:
         display_url = args.image_url
@@ -238,7 +614,7 @@ async def test_voxy_langgraph(args):
     print("  └─ All 5 subagents: translator, calculator, corrector, weather, vision")
     print()
 
-    graph = create_phase3_graph(checkpointer_type=CheckpointerType.MEMORY)
+    graph = get_or_build_graph(checkpointer_type=CheckpointerType.MEMORY)
 
     print_colored("✅ Graph compiled successfully\n", Colors.OKGREEN)
 
@@ -248,62 +624,52 @@ async def test_voxy_langgraph(args):
             f"🏁 Benchmark Mode: {args.iterations} iterations\n", Colors.WARNING
         )
 
-        times = []
-        routes_taken = []
+        # Build state template and config once; iterations only copy them
+        base_state = create_initial_state(
+            messages=[{"role": "user", "content": args.message}],
+            thread_id="test-voxy-bench",
+            image_url=args.image_url,
+        )
+        shared_config = get_checkpoint_config(thread_id="test-voxy-bench")
 
-        for i in range(args.iterations):
-            print_colored(f"Iteration {i + 1}/{args.iterations}...", Colors.OKBLUE)
+        async def run_once(i):
+            if args.reuse_thread:
+                return await stream_graph(graph, clone_state(base_state), shared_config)
 
-            start = datetime.now()
             thread_id = f"test-voxy-{i}"
+            state = clone_state(base_state, thread_id)
             config = get_checkpoint_config(thread_id=thread_id)
+            return await stream_graph(graph, state, config)
 
-            # Build context
-            context = {}
-            if args.image_url:
-                context["image_url"] = args.image_url
-
-            state = create_initial_state(
-                messages=[{"role": "user", "content": args.message}],
-                thread_id=thread_id,
-            )
-            state["context"].update(context)
-
-            result = graph.invoke(state, config=config)
-            elapsed = (datetime.now() - start).total_seconds()
+        runs = await run_iterations(
+            run_once, args, describe_graph_run, share_llm_session=True
+        )
+        times = []
+        route_counts = Counter()
 
+        for elapsed, graph_run in runs:
+            result = graph_run.result
             times.append(elapsed)
 
-            # Determine route taken (heuristic based on response and context)
-            if result.get("context", {}).get("vision_analysis"):
-                routes_taken.append("PATH1 (vision_bypass)")
-            else:
-                routes_taken.append("PATH2 (supervisor)")
+            # Route taken is recorded in context by the routing nodes
+            route_counts[get_route_label(result.get("context", {}))] += 1
 
         # Print benchmark results
         print_header("Benchmark Results")
 
-        print_colored("⏱️  Timing Statistics:", Colors.OKCYAN + Colors.BOLD)
-        print(f"  Min:     {min(times):.3f}s")
-        print(f"  Max:     {max(times):.3f}s")
-        print(f"  Average: {sum(times) / len(times):.3f}s")
-        print(f"  Total:   {sum(times):.3f}s")
-
-        if routes_taken:
-            from collections import Counter
+        print_timing_stats(times, args.warmup)
+        print_stream_stats([graph_run for _, graph_run in runs])
 
-            route_counts = Counter(routes_taken)
-            print_colored("\n🛤️  Routes Taken:", Colors.OKCYAN + Colors.BOLD)
-            for route, count in route_counts.most_common():
-                print(f"  {route}: {count} times")
+        if route_counts:
+            print_counts("\n🛤️  Routes Taken:", route_counts)
 
         return result
 
     # Single test execution
     print_colored("⚡ Running test...\n", Colors.WARNING)
 
-    start_time = datetime.now()
-    thread_id = f"test-voxy-{start_time.timestamp()}"
+    thread_id = f"test-voxy-{time.time_ns()}"
+    start_time = time.perf_counter_ns()
     config = get_checkpoint_config(thread_id=thread_id)
 
     # Build context
@@ -317,50 +683,45 @@ async def test_voxy_langgraph(args):
     )
     state["context"].update(context)
 
-    result = graph.invoke(state, config=config)
-    total_time = (datetime.now() - start_time).total_seconds()
+    graph_run = await stream_graph(graph, state, config)
+    result = graph_run.result
+    total_time = (time.perf_counter_ns() - start_time) / 1e9
 
     # Print results
     print_header("Results")
+    ctx = result.get("context", {})
+    msgs = result.get("messages", [])
 
-    print_colored("✅ Status:", Colors.OKGREEN + Colors.BOLD)
+    print_colored("✅ Status:", Colors.GREEN_BOLD)
     print("  Success: True")
     print()
 
-    print_colored("🤖 Response:", Colors.OKCYAN + Colors.BOLD)
-    if result["messages"]:
-        last_message = result["messages"][-1]
-        response_text = (
-            last_message.content
-            if hasattr(last_message, "content")
-            else str(last_message)
-        )
-        print(f"  {response_text}")
+    print_colored("🤖 Response:", Colors.CYAN_BOLD)
+    if msgs:
+        print(f"  {message_content(msgs[-1])}")
     print()
 
-    # Determine route taken
-    route_taken = "unknown"
-    if result.get("context", {}).get("vision_analysis"):
-        route_taken = "PATH1 (vision_bypass)"
-        vision_analysis = result["context"]["vision_analysis"]
-    else:
-        route_taken = "PATH2 (supervisor)"
+    # Route taken is recorded in context by the routing nodes
+    route_taken = get_route_label(ctx)
+    vision_analysis = ctx.get("vision_analysis")
 
-    print_colored("🛤️  Routing:", Colors.OKCYAN + Colors.BOLD)
+    print_colored("🛤️  Routing:", Colors.CYAN_BOLD)
     print(f"  Route taken: {route_taken}")
-    if result.get("context", {}).get("vision_analysis"):
+    if vision_analysis:
         print(
             f"  Vision analysis: Present ({vision_analysis.get('analysis_type', 'unknown')})"
         )
     print()
 
-    print_colored("⏱️  Performance:", Colors.OKCYAN + Colors.BOLD)
+    print_colored("⏱️  Performance:", Colors.CYAN_BOLD)
     print(f"  Processing time: {total_time:.3f}s")
+    if graph_run.ttfb is not None:
+        print(f"  Time to first token: {graph_run.ttfb:.3f}s")
     print()
 
-    print_colored("📊 Context:", Colors.OKCYAN + Colors.BOLD)
-    print(f"  Thread ID: {result['context']['thread_id']}")
-    print(f"  Message count: {len(result['messages'])}")
+    print_colored("📊 Context:", Colors.CYAN_BOLD)
+    print(f"  Thread ID: {ctx['thread_id']}")
+    print(f"  Message count: {len(msgs)}")
     print()
 
     return result
@@ -389,15 +750,13 @@ async def test_calculator(args):
 
 async def test_vision(args):
     """Test vision agent."""
+    # analysis_type/detail_level always have argparse defaults
     input_data = {
         "image_url": args.image_url,
         "query": args.query,
+        "analysis_type": args.analysis_type,
+        "detail_level": args.detail_level,
     }
-    if args.analysis_type:
-        input_data["analysis_type"] = args.analysis_type
-    if args.detail_level:
-        input_data["detail_level"] = args.detail_level
-
     return await run_test("vision", input_data, args)
 
 
@@ -412,7 +771,7 @@ async def test_voxy(args):
     print_header("Testing VOXY ORCHESTRATOR (SDK)")
 
     # Print input data
-    print_colored("📝 Input Data:", Colors.OKCYAN + Colors.BOLD)
+    print_colored("📝 Input Data:", Colors.CYAN_BOLD)
     print(f"  message: {args.message}")
     if args.image_url:
         # Truncate long URLs
@@ -429,70 +788,52 @@ async def test_voxy(args):
             f"🏁 Benchmark Mode: {args.iterations} iterations\n", Colors.WARNING
         )
 
-        times = []
-        costs = []
-        tools_used_list = []
-
-        for i in range(args.iterations):
-            print_colored(f"Iteration {i + 1}/{args.iterations}...", Colors.OKBLUE)
-
-            start = datetime.now()
-            result = await test_voxy_orchestrator(
+        async def run_once(i):
+            return await test_voxy_orchestrator(
                 message=args.message,
-                image_url=args.image_url if hasattr(args, "image_url") else None,
+                image_url=args.image_url,
                 bypass_cache=args.bypass_cache,
                 bypass_rate_limit=args.bypass_rate_limit,
                 include_tools_metadata=True,
             )
-            elapsed = (datetime.now() - start).total_seconds()
 
+        runs = await run_iterations(run_once, args, describe_test_result)
+        times = []
+        costs = RunningStats()
+        tool_counts = Counter()
+
+        for elapsed, result in runs:
             times.append(elapsed)
             if result.metadata.cost:
-                costs.append(result.metadata.cost)
+                costs.add(result.metadata.cost)
             if result.metadata.tools_used:
-                tools_used_list.append(result.metadata.tools_used)
+                tool_counts.update(result.metadata.tools_used)
 
         # Print benchmark results
         print_header("Benchmark Results")
 
-        print_colored("⏱️  Timing Statistics:", Colors.OKCYAN + Colors.BOLD)
-        print(f"  Min:     {min(times):.3f}s")
-        print(f"  Max:     {max(times):.3f}s")
-        print(f"  Average: {sum(times) / len(times):.3f}s")
-        print(f"  Total:   {sum(times):.3f}s")
+        print_timing_stats(times, args.warmup)
 
         if costs:
-            print_colored("\n💰 Cost Statistics:", Colors.OKCYAN + Colors.BOLD)
-            print(f"  Min:     ${min(costs):.6f}")
-            print(f"  Max:     ${max(costs):.6f}")
-            print(f"  Average: ${sum(costs) / len(costs):.6f}")
-            print(f"  Total:   ${sum(costs):.6f}")
-
-        if tools_used_list:
-            # Count tool usage frequency
-            from collections import Counter
-
-            all_tools = [tool for tools in tools_used_list for tool in tools]
-            tool_counts = Counter(all_tools)
+            print_cost_stats(costs)
 
-            print_colored("\n🔧 Tools Usage:", Colors.OKCYAN + Colors.BOLD)
-            for tool, count in tool_counts.most_common():
-                print(f"  {tool}: {count} times")
+        if tool_counts:
+            print_counts("\n🔧 Tools Usage:", tool_counts)
 
         return result  # Return last result
 
     # Single test execution
     print_colored("⚡ Running test...\n", Colors.WARNING)
 
-    start_time = datetime.now()
+    start_time = time.perf_counter_ns()
     result = await test_voxy_orchestrator(
         message=args.message,
-        image_url=args.image_url if hasattr(args, "image_url") else None,
+        image_url=args.image_url,
         bypass_cache=args.bypass_cache,
         bypass_rate_limit=args.bypass_rate_limit,
         include_tools_metadata=True,
     )
-    total_time = (datetime.now() - start_time).total_seconds()
+    total_time = (time.perf_counter_ns() - start_time) / 1e9
 
     # Print results
     print_results(result, total_time)
@@ -504,6 +845,17 @@ async def test_voxy(args):
     return result
 
 
+# Agent name -> test function (used by main dispatch)
+HANDLERS: dict[str, Callable[..., Awaitable]] = {
+    "translator": test_translator,
+    "corrector": test_corrector,
+    "weather": test_weather,
+    "calculator": test_calculator,
+    "vision": test_vision,
+    "voxy": test_voxy,
+}
+
+
 async def run_test(agent_name: str, input_data: dict, args):
     """
     Run test for specified agent.
@@ -516,6 +868,8 @@ async def run_test(agent_name: str, input_data: dict, args):
     Returns:
         TestResult from the agent
     """
+    from voxy_agents.utils.test_subagents import SubagentTester
+
     # Create tester with bypass configuration
     tester = SubagentTester(
         bypass_cache=args.bypass_cache,
@@ -525,7 +879,7 @@ async def run_test(agent_name: str, input_data: dict, args):
     print_header(f"Testing {agent_name.upper()} Agent")
 
     # Print input data
-    print_colored("📝 Input Data:", Colors.OKCYAN + Colors.BOLD)
+    print_colored("📝 Input Data:", Colors.CYAN_BOLD)
     for key, value in input_data.items():
         # Truncate long values
         display_value = str(value)
@@ -537,14 +891,14 @@ async def run_test(agent_name: str, input_data: dict, args):
 
     # Benchmark mode
     if args.benchmark:
-        return await run_benchmark(tester, agent_name, input_data, args.iterations)
+        return await run_benchmark(tester, agent_name, input_data, args)
 
     # Single test execution
     print_colored("⚡ Running test...\n", Colors.WARNING)
 
-    start_time = datetime.now()
+    start_time = time.perf_counter_ns()
     result = await tester.test_subagent(agent_name, input_data)
-    total_time = (datetime.now() - start_time).total_seconds()
+    total_time = (time.perf_counter_ns() - start_time) / 1e9
 
     # Print results
     print_results(result, total_time)
@@ -556,7 +910,7 @@ async def run_test(agent_name: str, input_data: dict, args):
     return result
 
 
-async def run_benchmark(tester, agent_name, input_data, iterations):
+async def run_benchmark(tester, agent_name, input_data, args):
     """
     Run benchmark with multiple iterations.
 
@@ -564,148 +918,153 @@ async def run_benchmark(tester, agent_name, input_data, iterations):
         tester: SubagentTester instance
         agent_name: Name of agent to test
         input_data: Input data for agent
-        iterations: Number of iterations to run
+        args: Command line arguments (iterations, concurrency, quiet, warmup)
 
     Returns:
         Final TestResult
     """
+    iterations = args.iterations
+
     print_colored(f"🏁 Benchmark Mode: {iterations} iterations\n", Colors.WARNING)
 
+    async def run_once(i):
+        return await tester.test_subagent(agent_name, input_data)
+
+    runs = await run_iterations(run_once, args, describe_test_result)
     times = []
-    costs = []
+    costs = RunningStats()
     cache_hits = 0
 
-    for i in range(iterations):
-        print_colored(f"Iteration {i + 1}/{iterations}...", Colors.OKBLUE)
-
-        start = datetime.now()
-        result = await tester.test_subagent(agent_name, input_data)
-        elapsed = (datetime.now() - start).total_seconds()
-
+    for elapsed, result in runs:
         times.append(elapsed)
         if result.metadata.cost:
-            costs.append(result.metadata.cost)
+            costs.add(result.metadata.cost)
         if result.metadata.cache_hit:
             cache_hits += 1
 
     # Print benchmark results
     print_header("Benchmark Results")
 
-    print_colored("⏱️  Timing Statistics:", Colors.OKCYAN + Colors.BOLD)
-    print(f"  Min:     {min(times):.3f}s")
-    print(f"  Max:     {max(times):.3f}s")
-    print(f"  Average: {sum(times) / len(times):.3f}s")
-    print(f"  Total:   {sum(times):.3f}s")
+    print_timing_stats(times, args.warmup)
 
     if costs:
-        print_colored("\n💰 Cost Statistics:", Colors.OKCYAN + Colors.BOLD)
-        print(f"  Min:     ${min(costs):.6f}")
-        print(f"  Max:     ${max(costs):.6f}")
-        print(f"  Average: ${sum(costs) / len(costs):.6f}")
-        print(f"  Total:   ${sum(costs):.6f}")
+        print_cost_stats(costs)
 
     if agent_name == "vision":
-        print_colored("\n📊 Cache Statistics:", Colors.OKCYAN + Colors.BOLD)
-        print(f"  Cache Hits: {cache_hits}/{iterations}")
-        print(f"  Hit Rate:   {(cache_hits / iterations) * 100:.1f}%")
+        write_lines(
+            [
+                colored("\n📊 Cache Statistics:", Colors.CYAN_BOLD),
+                f"  Cache Hits: {cache_hits}/{iterations}",
+                f"  Hit Rate:   {(cache_hits / iterations) * 100:.1f}%",
+            ]
+        )
 
     return result  # Return last result
 
 
 def print_results(result, total_time=None):
-    """Print test results with formatting."""
+    """Print test results with formatting (one stdout write per result)."""
+    lines = []
+    add = lines.append
+    metadata = result.metadata
+
     if result.success:
-        print_colored("✅ TEST SUCCESS", Colors.OKGREEN + Colors.BOLD)
+        add(colored("✅ TEST SUCCESS", Colors.GREEN_BOLD))
     else:
-        print_colored("❌ TEST FAILED", Colors.FAIL + Colors.BOLD)
+        add(colored("❌ TEST FAILED", Colors.FAIL_BOLD))
 
-    print()
+    add("")
 
     # Response
-    print_colored("💬 Response:", Colors.OKCYAN + Colors.BOLD)
-    print(f"  {result.response}\n")
+    add(colored("💬 Response:", Colors.CYAN_BOLD))
+    add(f"  {result.response}\n")
 
     # Metadata - Hierarchical format
-    print_colored("📊 Metadata:", Colors.OKCYAN + Colors.BOLD)
+    add(colored("📊 Metadata:", Colors.CYAN_BOLD))
 
     # Check if this is a VOXY Orchestrator test (has raw_metadata with orchestrator info)
-    is_voxy_test = result.metadata.raw_metadata and result.metadata.raw_metadata.get(
+    is_voxy_test = metadata.raw_metadata and metadata.raw_metadata.get(
         "orchestrator_model"
     )
 
     if is_voxy_test:
         # VOXY Orchestrator + Subagent flow
-        raw_meta = result.metadata.raw_metadata
+        raw_meta = metadata.raw_metadata
         orchestrator_model = raw_meta.get("orchestrator_model", "unknown")
         subagent_name = result.agent_name
 
         # Extract subagent model from tools_used or metadata
-        subagent_model = result.metadata.model_used
-        tools_used = result.metadata.tools_used or []
+        subagent_model = metadata.model_used
+        tools_used = metadata.tools_used or []
 
-        print("   ├─ 🤖 VOXY Orchestrator")
-        print(f"   │  ├─ Model: {orchestrator_model}")
-        print("   │  ├─ Reasoning: medium")
-        print("   │  └─ Orchestration: ~0.5s")
-        print("   │")
-        print(f"   ├─ 🔧 Subagent: {subagent_name.title()}")
-        print(f"   │  ├─ Model: {subagent_model}")
+        add("   ├─ 🤖 VOXY Orchestrator")
+        add(f"   │  ├─ Model: {orchestrator_model}")
+        add("   │  ├─ Reasoning: medium")
+        add("   │  └─ Orchestration: ~0.5s")
+        add("   │")
+        add(f"   ├─ 🔧 Subagent: {subagent_name.title()}")
+        add(f"   │  ├─ Model: {subagent_model}")
 
         if tools_used:
             tools_str = ", ".join(tools_used)
-            print(f"   │  ├─ Tools: {tools_str}")
+            add(f"   │  ├─ Tools: {tools_str}")
 
         # Estimate subagent time (total - orchestration overhead)
-        subagent_time = result.metadata.processing_time - 0.5
+        subagent_time = metadata.processing_time - 0.5
         if subagent_time < 0:
-            subagent_time = result.metadata.processing_time
-        print(f"   │  └─ Execution Time: {subagent_time:.2f}s")
-        print("   │")
-        print("   └─ 📈 Performance")
-        print(f"      ├─ Total Time: {result.metadata.processing_time:.3f}s")
+            subagent_time = metadata.processing_time
+        add(f"   │  └─ Execution Time: {subagent_time:.2f}s")
+        add("   │")
+        add("   └─ 📈 Performance")
+        add(f"      ├─ Total Time: {metadata.processing_time:.3f}s")
 
-        if result.metadata.cost:
-            print(f"      ├─ Cost: ${result.metadata.cost:.6f}")
+        if metadata.cost:
+            add(f"      ├─ Cost: ${metadata.cost:.6f}")
 
-        if result.metadata.tokens_used:
-            tokens = result.metadata.tokens_used
+        if metadata.tokens_used:
+            tokens = metadata.tokens_used
             total = tokens.get("total_tokens", "N/A")
-            print(f"      ├─ Tokens: {total}")
+            add(f"      ├─ Tokens: {total}")
 
-        print(f"      └─ Cache Hit: {result.metadata.cache_hit}")
+        add(f"      └─ Cache Hit: {metadata.cache_hit}")
 
     else:
         # Standard agent test (no orchestrator)
-        print(f"   ├─ Agent: {result.agent_name.title()}")
-        print(f"   ├─ Model: {result.metadata.model_used}")
-        print(f"   ├─ Processing Time: {result.metadata.processing_time:.3f}s")
+        add(f"   ├─ Agent: {result.agent_name.title()}")
+        add(f"   ├─ Model: {metadata.model_used}")
+        add(f"   ├─ Processing Time: {metadata.processing_time:.3f}s")
 
         if total_time:
-            print(f"   ├─ Total Time: {total_time:.3f}s")
+            add(f"   ├─ Total Time: {total_time:.3f}s")
 
-        if result.metadata.cost:
-            print(f"   ├─ Cost: ${result.metadata.cost:.6f}")
+        if metadata.cost:
+            add(f"   ├─ Cost: ${metadata.cost:.6f}")
 
-        if result.metadata.tokens_used:
-            tokens = result.metadata.tokens_used
-            print(f"   ├─ Tokens: {tokens.get('total_tokens', 'N/A')}")
+        if metadata.tokens_used:
+            tokens = metadata.tokens_used
+            add(f"   ├─ Tokens: {tokens.get('total_tokens', 'N/A')}")
 
-        print(f"   └─ Cache Hit: {result.metadata.cache_hit}")
+        add(f"   └─ Cache Hit: {metadata.cache_hit}")
 
         # Vision-specific metadata
         if result.agent_name == "vision":
-            if result.metadata.confidence:
-                print(f"   ├─ Confidence: {result.metadata.confidence:.1%}")
-            if result.metadata.analysis_type:
-                print(f"   ├─ Analysis Type: {result.metadata.analysis_type}")
-            if result.metadata.reasoning_level:
-                print(f"   └─ Reasoning Level: {result.metadata.reasoning_level}")
+            if metadata.confidence:
+                add(f"   ├─ Confidence: {metadata.confidence:.1%}")
+            if metadata.analysis_type:
+                add(f"   ├─ Analysis Type: {metadata.analysis_type}")
+            if metadata.reasoning_level:
+                add(f"   └─ Reasoning Level: {metadata.reasoning_level}")
 
     # Error
     if result.error:
-        print_colored(f"\n⚠️  Error: {result.error}", Colors.FAIL)
+        add(colored(f"\n⚠️  Error: {result.error}", Colors.FAIL))
 
-    print()
+    add("")
+    write_lines(lines)
+
+
+# 1 MiB write buffer for result exports
+EXPORT_BUFFER_SIZE = 1 << 20
 
 
 def export_results(result, export_path):
@@ -718,26 +1077,43 @@ def export_results(result, export_path):
     """
     try:
         if export_path.endswith(".json"):
-            # Export as JSON
-            with open(export_path, "w") as f:
-                json.dump(result.dict(), f, indent=2, default=str)
+            # Export as JSON: orjson (transitive dependency) when available,
+            # otherwise Pydantic's own serializer. Both write in one call.
+            try:
+                import orjson
+            except ImportError:
+                with open(export_path, "w", buffering=EXPORT_BUFFER_SIZE) as f:
+                    f.write(result.model_dump_json(indent=2))
+            else:
+                with open(export_path, "wb", buffering=EXPORT_BUFFER_SIZE) as f:
+                    f.write(
+                        orjson.dumps(
+                            result.model_dump(),
+                            option=orjson.OPT_INDENT_2,
+                            default=str,
+                        )
+                    )
 
             print_colored(f"💾 Results exported to {export_path}", Colors.OKGREEN)
 
         elif export_path.endswith(".csv"):
-            # Export as CSV
+            # Export as CSV (only the fields written, no full model dump)
             import csv
 
-            with open(export_path, "w", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(["Field", "Value"])
-                writer.writerow(["Success", result.success])
-                writer.writerow(["Agent", result.agent_name])
-                writer.writerow(["Response", result.response])
-                writer.writerow(["Processing Time", result.metadata.processing_time])
-                writer.writerow(["Model", result.metadata.model_used])
-                writer.writerow(["Cost", result.metadata.cost])
-                writer.writerow(["Cache Hit", result.metadata.cache_hit])
+            with open(export_path, "w", newline="", buffering=EXPORT_BUFFER_SIZE) as f:
+                metadata = result.metadata
+                csv.writer(f).writerows(
+                    (
+                        ("Field", "Value"),
+                        ("Success", result.success),
+                        ("Agent", result.agent_name),
+                        ("Response", result.response),
+                        ("Processing Time", metadata.processing_time),
+                        ("Model", metadata.model_used),
+                        ("Cost", metadata.cost),
+                        ("Cache Hit", metadata.cache_hit),
+                    )
+                )
 
             print_colored(f"💾 Results exported to {export_path}", Colors.OKGREEN)
 
@@ -753,14 +1129,53 @@ def export_results(result, export_path):
 # ============================================================================
 
 
+async def ainput(prompt: str = "") -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+
+    Uses a daemon thread (instead of the default executor) so a pending
+    read never keeps the process alive after Ctrl+C.
+
+    Args:
+        prompt: Prompt text written before reading
+
+    Returns:
+        Line read from stdin (without trailing newline)
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(setter, value):
+        if not future.done():
+            setter(value)
+
+    def read():
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            loop.call_soon_threadsafe(resolve, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(resolve, future.set_result, line)
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
 async def interactive_mode():
     """Run interactive testing mode."""
+    from voxy_agents.utils.test_subagents import SubagentTester
+
     print_header("VOXY Subagent Tester - Interactive Mode")
 
     tester = SubagentTester(bypass_cache=True, bypass_rate_limit=True)
 
+    # Fetched once: the agent list and per-agent info don't change mid-session
+    agents = tester.get_available_agents()
+    available = frozenset(agents)
+    info_cache = {}
+
     print("Available agents:")
-    for agent in tester.get_available_agents():
+    for agent in agents:
         print(f"  - {agent}")
 
     print("\nType 'quit' or 'exit' to quit\n")
@@ -768,15 +1183,15 @@ async def interactive_mode():
     while True:
         try:
             # Get agent name
-            agent_name = input(
-                f"{Colors.OKBLUE}Enter agent name:{Colors.ENDC} "
+            agent_name = (
+                await ainput(f"{Colors.OKBLUE}Enter agent name:{Colors.ENDC} ")
             ).strip()
 
             if agent_name.lower() in ["quit", "exit"]:
                 print_colored("\n👋 Goodbye!", Colors.OKGREEN)
                 break
 
-            if agent_name not in tester.get_available_agents():
+            if agent_name not in available:
                 print_colored(f"❌ Unknown agent: {agent_name}", Colors.FAIL)
                 continue
 
@@ -784,15 +1199,15 @@ async def interactive_mode():
             if agent_name == "voxy":
                 from voxy_agents.utils.test_subagents import test_voxy_orchestrator
 
-                print_colored("\n📋 VOXY Orchestrator", Colors.OKCYAN + Colors.BOLD)
+                print_colored("\n📋 VOXY Orchestrator", Colors.CYAN_BOLD)
                 print("  Test strategy: orchestrator_direct")
                 print("  Required params: message")
                 print("  Optional params: image_url")
 
                 # Get input data
                 print()
-                message = input("  message: ").strip()
-                image_url = input("  image_url (optional): ").strip()
+                message = (await ainput("  message: ")).strip()
+                image_url = (await ainput("  image_url (optional): ")).strip()
 
                 # Run test
                 print()
@@ -806,8 +1221,10 @@ async def interactive_mode():
                 print_results(result)
             else:
                 # Get agent info for standard subagents
-                info = tester.get_agent_info(agent_name)
-                print_colored(f"\n📋 {agent_name} Agent", Colors.OKCYAN + Colors.BOLD)
+                info = info_cache.get(agent_name)
+                if info is None:
+                    info = info_cache[agent_name] = tester.get_agent_info(agent_name)
+                print_colored(f"\n📋 {agent_name} Agent", Colors.CYAN_BOLD)
                 print(f"  Model: {info['model']}")
                 print(
                     f"  Required params: {', '.join(info.get('required_params', []))}"
@@ -817,11 +1234,11 @@ async def interactive_mode():
                 input_data = {}
                 print()
                 for param in info.get("required_params", []):
-                    value = input(f"  {param}: ").strip()
+                    value = (await ainput(f"  {param}: ")).strip()
                     input_data[param] = value
 
                 for param in info.get("optional_params", []):
-                    value = input(f"  {param} (optional): ").strip()
+                    value = (await ainput(f"  {param} (optional): ")).strip()
                     if value:
                         input_data[param] = value
 
@@ -830,7 +1247,7 @@ async def interactive_mode():
                 result = await tester.test_subagent(agent_name, input_data)
                 print_results(result)
 
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError, asyncio.CancelledError):
             print_colored("\n\n👋 Goodbye!", Colors.OKGREEN)
             break
         except Exception as e:
@@ -842,8 +1259,109 @@ async def interactive_mode():
 # ============================================================================
 
 
-def create_parser():
-    """Create argument parser."""
+# Agent -> (subparser help, option specs as (flag, add_argument kwargs)).
+# Single source for the agent subparsers built by create_parser.
+AGENT_ARG_SPECS = {
+    "translator": (
+        "Test translator",
+        (
+            ("--text", {"required": True, "help": "Text to translate"}),
+            ("--target-language", {"required": True, "help": "Target language"}),
+            ("--source-language", {"help": "Source language"}),
+        ),
+    ),
+    "corrector": (
+        "Test corrector",
+        (("--text", {"required": True, "help": "Text to correct"}),),
+    ),
+    "weather": (
+        "Test weather",
+        (
+            ("--city", {"required": True, "help": "City name"}),
+            ("--country", {"help": "Country code (default: BR)"}),
+        ),
+    ),
+    "calculator": (
+        "Test calculator",
+        (("--expression", {"required": True, "help": "Math expression"}),),
+    ),
+    "vision": (
+        "Test vision",
+        (
+            ("--image-url", {"required": True, "help": "Image URL"}),
+            (
+                "--query",
+                {"default": "Analise esta imagem", "help": "Query about image"},
+            ),
+            (
+                "--analysis-type",
+                {
+                    "choices": ["general", "ocr", "technical", "artistic", "document"],
+                    "default": "general",
+                    "help": "Analysis type",
+                },
+            ),
+            (
+                "--detail-level",
+                {
+                    "choices": ["basic", "standard", "detailed", "comprehensive"],
+                    "default": "standard",
+                    "help": "Detail level",
+                },
+            ),
+        ),
+    ),
+    "voxy": (
+        "Test VOXY Orchestrator",
+        (
+            ("--message", {"required": True, "help": "Message to send to VOXY"}),
+            ("--image-url", {"help": "Optional image URL for vision analysis"}),
+        ),
+    ),
+}
+
+
+def add_agent_parser(subparsers, agent_name):
+    """Add the subparser for one agent from its spec."""
+    help_text, options = AGENT_ARG_SPECS[agent_name]
+    agent_parser = subparsers.add_parser(agent_name, help=help_text)
+    for flag, kwargs in options:
+        agent_parser.add_argument(flag, **kwargs)
+
+
+def select_subparsers(argv):
+    """
+    Decide which agent subparsers the command line actually needs.
+
+    Args:
+        argv: Command line arguments (without program name)
+
+    Returns:
+        Agent names whose subparsers should be built:
+        - only the requested agent when one is named
+        - none for --list/--interactive without an agent
+        - all of them otherwise (help output, typos, no arguments)
+    """
+    for token in argv:
+        if token in ("-h", "--help"):
+            return tuple(AGENT_ARG_SPECS)
+        if token in AGENT_ARG_SPECS:
+            return (token,)
+
+    if "--list" in argv or "--interactive" in argv or "-i" in argv:
+        return ()
+
+    return tuple(AGENT_ARG_SPECS)
+
+
+def create_parser(argv=None):
+    """
+    Create argument parser.
+
+    Args:
+        argv: Arguments used to pick which subparsers to build
+            (default: sys.argv[1:])
+    """
     parser = argparse.ArgumentParser(
         description="CLI para Teste Isolado de Subagentes VOXY",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -871,15 +1389,15 @@ def create_parser():
     )
     parser.add_argument(
         "--bypass-cache",
-        action="store_true",
+        action=argparse.BooleanOptionalAction,
         default=True,
-        help="Bypass cache (default: True)",
+        help="Bypass cache (default: True; use --no-bypass-cache to keep it)",
     )
     parser.add_argument(
         "--bypass-rate-limit",
-        action="store_true",
+        action=argparse.BooleanOptionalAction,
         default=True,
-        help="Bypass rate limiting (default: True)",
+        help="Bypass rate limiting (default: True; use --no-bypass-rate-limit to keep it)",
     )
     parser.add_argument(
         "--benchmark",
@@ -893,62 +1411,46 @@ def create_parser():
         help="Number of benchmark iterations (default: 5)",
     )
     parser.add_argument(
-        "--export",
-        type=str,
-        help="Export results to file (.json or .csv)",
+        "--warmup",
+        type=int,
+        default=1,
+        help="Untimed warmup iterations before benchmark (default: 1, "
+        "use 0 when cost-sensitive)",
     )
-
-    # Subparsers for each agent
-    subparsers = parser.add_subparsers(dest="agent", help="Agent to test")
-
-    # Translator
-    translator_parser = subparsers.add_parser("translator", help="Test translator")
-    translator_parser.add_argument("--text", required=True, help="Text to translate")
-    translator_parser.add_argument(
-        "--target-language", required=True, help="Target language"
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=5,
+        help="Maximum concurrent benchmark iterations; forced to 1 unless "
+        "cache and rate limit are bypassed, and with --reuse-thread (default: 5)",
     )
-    translator_parser.add_argument("--source-language", help="Source language")
-
-    # Corrector
-    corrector_parser = subparsers.add_parser("corrector", help="Test corrector")
-    corrector_parser.add_argument("--text", required=True, help="Text to correct")
-
-    # Weather
-    weather_parser = subparsers.add_parser("weather", help="Test weather")
-    weather_parser.add_argument("--city", required=True, help="City name")
-    weather_parser.add_argument("--country", help="Country code (default: BR)")
-
-    # Calculator
-    calculator_parser = subparsers.add_parser("calculator", help="Test calculator")
-    calculator_parser.add_argument(
-        "--expression", required=True, help="Math expression"
+    parser.add_argument(
+        "--quiet",
+        "-q",
+        action="store_true",
+        help="Suppress per-iteration progress output in benchmark mode",
     )
-
-    # Vision
-    vision_parser = subparsers.add_parser("vision", help="Test vision")
-    vision_parser.add_argument("--image-url", required=True, help="Image URL")
-    vision_parser.add_argument(
-        "--query", default="Analise esta imagem", help="Query about image"
+    parser.add_argument(
+        "--reuse-thread",
+        action="store_true",
+        help="Reuse a single LangGraph thread across benchmark iterations "
+        "(history accumulates in the checkpointer; iterations run one at a time)",
     )
-    vision_parser.add_argument(
-        "--analysis-type",
-        choices=["general", "ocr", "technical", "artistic", "document"],
-        default="general",
-        help="Analysis type",
+    parser.add_argument(
+        "--ndjson-path",
+        type=str,
+        help="Append one JSON line per benchmark iteration to this file",
     )
-    vision_parser.add_argument(
-        "--detail-level",
-        choices=["basic", "standard", "detailed", "comprehensive"],
-        default="standard",
-        help="Detail level",
+    parser.add_argument(
+        "--export",
+        type=str,
+        help="Export results to file (.json or .csv)",
     )
 
-    # VOXY Orchestrator
-    voxy_parser = subparsers.add_parser("voxy", help="Test VOXY Orchestrator")
-    voxy_parser.add_argument("--message", required=True, help="Message to send to VOXY")
-    voxy_parser.add_argument(
-        "--image-url", help="Optional image URL for vision analysis"
-    )
+    # Subparsers for each agent (built lazily, see select_subparsers)
+    subparsers = parser.add_subparsers(dest="agent", help="Agent to test")
+    for agent_name in select_subparsers(sys.argv[1:] if argv is None else argv):
+        add_agent_parser(subparsers, agent_name)
 
     return parser
 
@@ -965,11 +1467,14 @@ async def main():
 
     # List agents
     if args.list:
-        tester = SubagentTester()
+        # Metadata only: reuse the module-level tester instead of building one
+        from voxy_agents.utils.test_subagents import get_subagent_tester
+
+        tester = get_subagent_tester()
         print_header("Available Agents")
         for agent_name in tester.get_available_agents():
             info = tester.get_agent_info(agent_name)
-            print_colored(f"\n{agent_name}", Colors.OKBLUE + Colors.BOLD)
+            print_colored(f"\n{agent_name}", Colors.BLUE_BOLD)
             print(f"  Model: {info['model']}")
             print(f"  Strategy: {info['test_strategy']}")
             if info.get("capabilities"):
@@ -990,16 +1495,7 @@ async def main():
         return
 
     # Route to appropriate test function
-    test_functions = {
-        "translator": test_translator,
-        "corrector": test_corrector,
-        "weather": test_weather,
-        "calculator": test_calculator,
-        "vision": test_vision,
-        "voxy": test_voxy,
-    }
-
-    test_func = test_functions.get(args.agent)
+    test_func = HANDLERS.get(args.agent)
     if test_func:
         await test_func(args)
     else:
@@ -1008,4 +1504,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -4,21 +4,25 @@ Quick LangGraph Test - Validate feature flag and basic functionality
 
 Usage:
     poetry run python scripts/test_langgraph_quick.py
+    poetry run python scripts/test_langgraph_quick.py --persist
+    VOXY_TEST_TRACE=1 poetry run python scripts/test_langgraph_quick.py
 """
 
+import argparse
 import asyncio
 import os
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import traceback
 
+from _bootstrap import disable_tracing, install_uvloop
 from dotenv import load_dotenv
 
 # Load .env with override to ensure latest values
 load_dotenv(override=True)
 
+# Shared-cache in-memory SQLite: same checkpointer code path, no disk I/O
+MEMORY_DB_PATH = "file:voxy_langgraph_test?mode=memory&cache=shared"
+PERSIST_DB_PATH = "voxy_langgraph_test.db"
+
 
 def check_feature_flag():
     """Check if VOXY_LANGGRAPH_ENABLED is set correctly."""
@@ -39,8 +43,13 @@ def check_feature_flag():
         return False
 
 
-async def test_langgraph_orchestrator():
-    """Test LangGraph orchestrator directly."""
+async def test_langgraph_orchestrator(persist: bool = False):
+    """
+    Test LangGraph orchestrator directly.
+
+    Args:
+        persist: Use an on-disk SQLite file instead of the in-memory database
+    """
     print("\n" + "=" * 60)
     print("🧪 Testing LangGraph Orchestrator")
     print("=" * 60)
@@ -49,12 +58,14 @@ async def test_langgraph_orchestrator():
         from voxy_agents.langgraph.checkpointer import CheckpointerType
         from voxy_agents.langgraph.orchestrator import LangGraphOrchestrator
 
+        disable_tracing()
         print("\n✓ LangGraph imports successful")
 
         # Create orchestrator
         print("\n🔧 Creating LangGraphOrchestrator with SQLite checkpointer...")
         orchestrator = LangGraphOrchestrator(
-            checkpointer_type=CheckpointerType.SQLITE, db_path="voxy_langgraph_test.db"
+            checkpointer_type=CheckpointerType.SQLITE,
+            db_path=PERSIST_DB_PATH if persist else MEMORY_DB_PATH,
         )
         print("✓ Orchestrator created successfully")
 
@@ -86,14 +97,20 @@ async def test_langgraph_orchestrator():
     except Exception as e:
         print("\n❌ LangGraph orchestrator test FAILED!")
         print(f"Error: {e}")
-        import traceback
-
         traceback.print_exc()
         return False
 
 
 async def main():
     """Main test runner."""
+    parser = argparse.ArgumentParser(description="Quick LangGraph test")
+    parser.add_argument(
+        "--persist",
+        action="store_true",
+        help=f"Write checkpoints to {PERSIST_DB_PATH} instead of in-memory SQLite",
+    )
+    args = parser.parse_args()
+
     print("\n" + "=" * 60)
     print("🚀 VOXY LangGraph Quick Test")
     print("=" * 60)
@@ -108,7 +125,7 @@ async def main():
         return
 
     # Test orchestrator
-    success = await test_langgraph_orchestrator()
+    success = await test_langgraph_orchestrator(args.persist)
 
     # Final summary
     print("\n" + "=" * 60)
@@ -127,4 +144,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -19,22 +19,30 @@ Usage:
     poetry run python scripts/test_phase3_e2e.py
     poetry run python scripts/test_phase3_e2e.py --verbose
     poetry run python scripts/test_phase3_e2e.py --test translation
+    poetry run python scripts/test_phase3_e2e.py --concurrency 1
+    poetry run python scripts/test_phase3_e2e.py --batched
+    VOXY_TEST_IMAGE_FILE=/path/to/emoji.png poetry run python scripts/test_phase3_e2e.py
+    VOXY_TEST_TRACE=1 poetry run python scripts/test_phase3_e2e.py
 """
 
 import argparse
 import asyncio
+import base64
+import mimetypes
+import os
 import sys
-from datetime import datetime
-from pathlib import Path
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import time
+import traceback
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from uuid import uuid4
 
+from _bootstrap import disable_tracing, install_uvloop, message_text
 from voxy_agents.langgraph.checkpointer import (
     CheckpointerType,
     get_checkpoint_config,
 )
-from voxy_agents.langgraph.graph_builder import create_phase3_graph
+from voxy_agents.langgraph.graph_builder import get_or_build_graph
 from voxy_agents.langgraph.graph_state import create_initial_state
 
 # ============================================================================
@@ -61,6 +69,11 @@ def print_colored(text: str, color: str = Colors.ENDC):
     print(f"{color}{text}{Colors.ENDC}")
 
 
+def write_report(lines: list[str]):
+    """Write a scenario report as one block (a single stdout write)."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def print_header(text: str):
     """Print header with formatting."""
     print_colored(f"\n{'=' * 80}", Colors.HEADER)
@@ -75,71 +88,229 @@ def print_header(text: str):
 # Test image URL (emoji from user)
 TEST_IMAGE_URL = "https://supabase.gysin.pro/storage/v1/object/public/user-images/users/4a82fdef-cc14-4471-b9b9-9f1238bdd222/uploads/2025/10/20251002130719_95ef4bc8_capturadetela2025-09-21065333.png"
 
-TEST_SCENARIOS = {
-    "translation": {
-        "name": "Translation (translate_text tool)",
-        "message": "Traduza 'Hello world' para português brasileiro",
-        "expected_tool": "translate_text",
-        "expected_route": "PATH2",
-    },
-    "calculation": {
-        "name": "Calculation (calculate tool)",
-        "message": "Quanto é 25 × 4 + 10?",
-        "expected_tool": "calculate",
-        "expected_route": "PATH2",
-    },
-    "correction": {
-        "name": "Correction (correct_text tool)",
-        "message": "Corrija: 'Eu foi na loja ontem e comprou muito coisa'",
-        "expected_tool": "correct_text",
-        "expected_route": "PATH2",
-    },
-    "weather": {
-        "name": "Weather (get_weather tool)",
-        "message": "Como está o clima em São Paulo?",
-        "expected_tool": "get_weather",
-        "expected_route": "PATH2",
-    },
-    "vision_path1": {
-        "name": "Vision PATH1 (vision_bypass direct)",
-        "message": "Qual emoji é este?",
-        "image_url": TEST_IMAGE_URL,
-        "expected_tool": None,  # Direct bypass, no tool call
-        "expected_route": "PATH1",
-    },
-    "vision_path2": {
-        "name": "Vision PATH2 (analyze_image tool)",
-        "message": f"Analise a imagem em {TEST_IMAGE_URL} e descreva o que você vê",
-        "image_url": None,  # No image_url in context, so supervisor extracts from message
-        "expected_tool": "analyze_image",
-        "expected_route": "PATH2",
-    },
-    "multi_tool": {
-        "name": "Multi-Tool (translate + correct)",
-        "message": "Traduza 'Hello world' para português e depois corrija qualquer erro",
-        "expected_tool": ["translate_text", "correct_text"],
-        "expected_route": "PATH2",
-    },
-    "direct_response": {
-        "name": "Direct Response (no tool needed)",
-        "message": "Olá, como vai?",
-        "expected_tool": None,
-        "expected_route": "PATH2",
-    },
+
+def local_image_data_uri(path: str | None) -> str | None:
+    """
+    Encode a local image file as a data URI, read once per run.
+
+    The vision agent sends image_url straight to the model, which accepts
+    data URIs, so PATH1 can skip the provider-side fetch of TEST_IMAGE_URL.
+
+    Args:
+        path: Image file path (VOXY_TEST_IMAGE_FILE), or None
+
+    Returns:
+        data:<mime>;base64,... URI, or None when no path is given
+    """
+    if not path:
+        return None
+
+    mime_type = mimetypes.guess_type(path)[0] or "image/png"
+    with open(path, "rb") as image_file:
+        encoded = base64.b64encode(image_file.read()).decode("ascii")
+    return f"data:{mime_type};base64,{encoded}"
+
+
+# PATH1 gets the image through context, so a local fixture can replace the
+# remote URL; PATH2 keeps the URL because the supervisor extracts it from text
+PATH1_IMAGE_URL = (
+    local_image_data_uri(os.getenv("VOXY_TEST_IMAGE_FILE")) or TEST_IMAGE_URL
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """One end-to-end test scenario."""
+
+    name: str
+    message: str
+    expected_route: str
+    expected_tool: str | tuple[str, ...] | None = None
+    image_url: str | None = None
+
+
+TEST_SCENARIOS: dict[str, Scenario] = {
+    "translation": Scenario(
+        name="Translation (translate_text tool)",
+        message="Traduza 'Hello world' para português brasileiro",
+        expected_tool="translate_text",
+        expected_route="PATH2",
+    ),
+    "calculation": Scenario(
+        name="Calculation (calculate tool)",
+        message="Quanto é 25 × 4 + 10?",
+        expected_tool="calculate",
+        expected_route="PATH2",
+    ),
+    "correction": Scenario(
+        name="Correction (correct_text tool)",
+        message="Corrija: 'Eu foi na loja ontem e comprou muito coisa'",
+        expected_tool="correct_text",
+        expected_route="PATH2",
+    ),
+    "weather": Scenario(
+        name="Weather (get_weather tool)",
+        message="Como está o clima em São Paulo?",
+        expected_tool="get_weather",
+        expected_route="PATH2",
+    ),
+    "vision_path1": Scenario(
+        name="Vision PATH1 (vision_bypass direct)",
+        message="Qual emoji é este?",
+        image_url=PATH1_IMAGE_URL,
+        expected_tool=None,  # Direct bypass, no tool call
+        expected_route="PATH1",
+    ),
+    "vision_path2": Scenario(
+        name="Vision PATH2 (analyze_image tool)",
+        message=f"Analise a imagem em {TEST_IMAGE_URL} e descreva o que você vê",
+        image_url=None,  # No image_url in context, so supervisor extracts from message
+        expected_tool="analyze_image",
+        expected_route="PATH2",
+    ),
+    "multi_tool": Scenario(
+        name="Multi-Tool (translate + correct)",
+        message="Traduza 'Hello world' para português e depois corrija qualquer erro",
+        expected_tool=("translate_text", "correct_text"),
+        expected_route="PATH2",
+    ),
+    "direct_response": Scenario(
+        name="Direct Response (no tool needed)",
+        message="Olá, como vai?",
+        expected_tool=None,
+        expected_route="PATH2",
+    ),
 }
 
 
+# Single-tool PATH2 scenarios that --batched packs into one supervisor request.
+# Vision and multi-tool scenarios need their own routing, so they always run alone.
+BATCHABLE_SCENARIOS = (
+    "translation",
+    "calculation",
+    "correction",
+    "weather",
+    "direct_response",
+)
+
+BATCH_INSTRUCTIONS = (
+    "Handle each numbered request below independently. Reply ONLY with a JSON "
+    'object mapping each request number to its answer, e.g. {"1": "...", "2": "..."}.'
+)
+
+
+# LLM endpoint contacted by the scenarios (LiteLLM → OpenRouter by default)
+LLM_PREWARM_URL = os.getenv("LLM_PREWARM_URL", "https://openrouter.ai/api/v1/models")
+
+
 # ============================================================================
 # Test Execution
 # ============================================================================
 
 
+@asynccontextmanager
+async def prewarmed_llm_client(max_connections: int):
+    """
+    Share one pre-connected HTTPX pool with LiteLLM for the whole test run.
+
+    Issues one cheap request to the LLM endpoint before the first scenario, so
+    DNS, TCP connect and the TLS handshake are not charged to that scenario's
+    duration. The previous LiteLLM session is restored on exit.
+
+    An AsyncClient must stay on the loop that created it: scenarios run the
+    graph with ainvoke / astream_events, so supervisor and tool model calls
+    are all awaited on this loop (no sync graph.invoke or worker-thread
+    loops while the session is installed).
+
+    Args:
+        max_connections: Pool size (matches scenario concurrency)
+    """
+    import httpx
+    import litellm
+
+    limits = httpx.Limits(
+        max_connections=max_connections, max_keepalive_connections=max_connections
+    )
+    previous = litellm.aclient_session
+    client = httpx.AsyncClient(limits=limits)
+    litellm.aclient_session = client
+
+    try:
+        await client.head(LLM_PREWARM_URL)
+    except httpx.HTTPError:
+        # Prewarm is best effort; scenarios will surface real connection errors
+        pass
+
+    try:
+        yield
+    finally:
+        litellm.aclient_session = previous
+        await client.aclose()
+
+
+async def stream_scenario(graph, state, config):
+    """
+    Execute the graph via astream_events, observing tool calls as they happen.
+
+    Args:
+        graph: Compiled LangGraph
+        state: Initial VoxyState
+        config: Checkpoint config
+
+    Returns:
+        Tuple of (final state, names of the tools called, in call order)
+    """
+    result = {}
+    tools_called = []
+
+    async for event in graph.astream_events(state, config=config, version="v2"):
+        kind = event["event"]
+        if kind == "on_tool_start":
+            tools_called.append(event["name"])
+        elif kind == "on_chain_end" and not event.get("parent_ids"):
+            # Root graph finished: its output is the final state
+            result = event["data"]["output"]
+
+    return result, tools_called
+
+
+def tool_validation_errors(
+    expected_tool: str | tuple[str, ...] | None,
+    tools_called: list[str],
+    strict: bool = True,
+) -> list[str]:
+    """
+    Compare a scenario's expected tools with the tools observed.
+
+    Args:
+        expected_tool: Scenario.expected_tool
+        tools_called: Tool names seen in on_tool_start events
+        strict: Also flag tool calls when none were expected (off for batched
+            runs, where every scenario sees the whole batch's calls)
+
+    Returns:
+        Validation error messages (empty if the expectation holds)
+    """
+    expected_tools = (
+        [expected_tool] if isinstance(expected_tool, str) else expected_tool or []
+    )
+    missing_tools = [tool for tool in expected_tools if tool not in tools_called]
+    if missing_tools:
+        return [f"Tools not called: {', '.join(missing_tools)}"]
+    if strict and not expected_tools and tools_called:
+        return [f"Unexpected tool calls: {', '.join(tools_called)}"]
+    return []
+
+
 async def run_test_scenario(
-    scenario_name: str, scenario: dict, graph, verbose: bool = False
+    scenario_name: str, scenario: Scenario, graph, verbose: bool = False
 ):
     """
     Run a single test scenario.
 
+    Output is collected and written as one block when the scenario finishes,
+    so scenarios running concurrently don't interleave their lines.
+
     Args:
         scenario_name: Name of the scenario
         scenario: Scenario configuration
@@ -149,114 +320,116 @@ async def run_test_scenario(
     Returns:
         Test result (success, error message, duration, etc.)
     """
-    print_colored(f"\n{'─' * 80}", Colors.OKCYAN)
-    print_colored(f"  {scenario['name']}", Colors.OKCYAN + Colors.BOLD)
-    print_colored(f"{'─' * 80}", Colors.OKCYAN)
-
-    # Print test info
-    print(f"\n📝 Message: {scenario['message']}")
-    if scenario.get("image_url"):
-        display_url = scenario["image_url"]
+    lines = []
+    add = lines.append
+
+    def add_colored(text: str, color: str):
+        add(f"{color}{text}{Colors.ENDC}")
+
+    add_colored(f"\n{'─' * 80}", Colors.OKCYAN)
+    add_colored(f"  {scenario.name}", Colors.OKCYAN + Colors.BOLD)
+    add_colored(f"{'─' * 80}", Colors.OKCYAN)
+
+    # Test info
+    add(f"\n📝 Message: {scenario.message}")
+    if scenario.image_url:
+        display_url = scenario.image_url
         if len(display_url) > 80:
             display_url = display_url[:80] + "..."
-        print(f"🖼️  Image URL: {display_url}")
-    print(f"🎯 Expected Route: {scenario['expected_route']}")
-    if scenario["expected_tool"]:
-        if isinstance(scenario["expected_tool"], list):
-            print(f"🔧 Expected Tools: {', '.join(scenario['expected_tool'])}")
+        add(f"🖼️  Image URL: {display_url}")
+    add(f"🎯 Expected Route: {scenario.expected_route}")
+    if scenario.expected_tool:
+        if isinstance(scenario.expected_tool, tuple):
+            add(f"🔧 Expected Tools: {', '.join(scenario.expected_tool)}")
         else:
-            print(f"🔧 Expected Tool: {scenario['expected_tool']}")
+            add(f"🔧 Expected Tool: {scenario.expected_tool}")
     else:
-        print("🔧 Expected Tool: None (direct response or bypass)")
+        add("🔧 Expected Tool: None (direct response or bypass)")
 
     # Build state
-    thread_id = f"test-{scenario_name}-{datetime.now().timestamp()}"
+    thread_id = f"test-{scenario_name}-{uuid4().hex}"
     config = get_checkpoint_config(thread_id=thread_id)
 
     state = create_initial_state(
-        messages=[{"role": "user", "content": scenario["message"]}],
+        messages=[{"role": "user", "content": scenario.message}],
         thread_id=thread_id,
     )
 
     # Add image_url to context if present
-    if scenario.get("image_url"):
-        state["context"]["image_url"] = scenario["image_url"]
+    if scenario.image_url:
+        state["context"]["image_url"] = scenario.image_url
 
     # Run test
-    print_colored("\n⚡ Running test...", Colors.WARNING)
-    start_time = datetime.now()
+    print_colored(f"⚡ Running {scenario_name}...", Colors.WARNING)
+    start_ns = time.perf_counter_ns()
 
     try:
-        result = graph.invoke(state, config=config)
-        duration = (datetime.now() - start_time).total_seconds()
+        # Streaming yields to the event loop, so other scenarios run meanwhile
+        result, tools_called = await stream_scenario(graph, state, config)
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
+
+        # Pull what the report needs out of the final state once
+        messages = result.get("messages") or ()
+        context = result.get("context") or {}
+        vision_analysis = context.get("vision_analysis")
 
         # Determine route taken
-        route_taken = "unknown"
-        if result.get("context", {}).get("vision_analysis"):
-            route_taken = "PATH1"
-        else:
-            route_taken = "PATH2"
+        route_taken = "PATH1" if vision_analysis else "PATH2"
 
         # Extract response
-        response_text = "No response"
-        if result["messages"]:
-            last_message = result["messages"][-1]
-            response_text = (
-                last_message.content
-                if hasattr(last_message, "content")
-                else str(last_message)
-            )
+        response_text = message_text(messages[-1]) if messages else "No response"
 
-        # Print results
-        print_colored("\n✅ TEST PASSED", Colors.OKGREEN + Colors.BOLD)
-        print(
+        # Results
+        add_colored("\n✅ TEST PASSED", Colors.OKGREEN + Colors.BOLD)
+        add(
             f"\n🤖 Response: {response_text[:200]}{'...' if len(response_text) > 200 else ''}"
         )
-        print(f"\n🛤️  Route Taken: {route_taken}")
-        print(f"⏱️  Duration: {duration:.3f}s")
+        add(f"\n🛤️  Route Taken: {route_taken}")
+        add(f"🔧 Tools Called: {', '.join(tools_called) or 'None'}")
+        add(f"⏱️  Duration: {duration:.3f}s")
 
-        if verbose and result.get("context", {}).get("vision_analysis"):
-            print_colored("\n📊 Vision Analysis Metadata:", Colors.OKCYAN)
-            vision_analysis = result["context"]["vision_analysis"]
-            print(f"  - Image URL: {vision_analysis.get('image_url', 'N/A')[:60]}...")
-            print(f"  - Analysis Type: {vision_analysis.get('analysis_type', 'N/A')}")
-            print(f"  - Result Length: {len(vision_analysis.get('result', ''))} chars")
+        if verbose and vision_analysis:
+            add_colored("\n📊 Vision Analysis Metadata:", Colors.OKCYAN)
+            add(f"  - Image URL: {vision_analysis.get('image_url', 'N/A')[:60]}...")
+            add(f"  - Analysis Type: {vision_analysis.get('analysis_type', 'N/A')}")
+            add(f"  - Result Length: {len(vision_analysis.get('result', ''))} chars")
 
         # Validate expectations
         validation_errors = []
 
         # Check route
-        if route_taken != scenario["expected_route"]:
+        if route_taken != scenario.expected_route:
             validation_errors.append(
-                f"Route mismatch: expected {scenario['expected_route']}, got {route_taken}"
+                f"Route mismatch: expected {scenario.expected_route}, got {route_taken}"
             )
 
-        # TODO: Check tools used (requires tracking tool calls in state)
-        # This will be implemented when we add tool call tracking to VoxyState
+        # Check tools used (observed through on_tool_start events)
+        validation_errors += tool_validation_errors(
+            scenario.expected_tool, tools_called
+        )
 
         if validation_errors:
-            print_colored("\n⚠️  VALIDATION WARNINGS:", Colors.WARNING)
+            add_colored("\n⚠️  VALIDATION WARNINGS:", Colors.WARNING)
             for error in validation_errors:
-                print(f"  - {error}")
+                add(f"  - {error}")
 
         return {
             "success": True,
             "duration": duration,
             "route": route_taken,
+            "tools": tools_called,
             "response_length": len(response_text),
             "validation_errors": validation_errors,
         }
 
     except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
-        print_colored("\n❌ TEST FAILED", Colors.FAIL + Colors.BOLD)
-        print_colored(f"Error: {str(e)}", Colors.FAIL)
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
+        add_colored("\n❌ TEST FAILED", Colors.FAIL + Colors.BOLD)
+        add_colored(f"Error: {str(e)}", Colors.FAIL)
 
         if verbose:
-            import traceback
-
-            print_colored("\n📋 Full Traceback:", Colors.FAIL)
-            traceback.print_exc()
+            add_colored("\n📋 Full Traceback:", Colors.FAIL)
+            add(traceback.format_exc())
 
         return {
             "success": False,
@@ -264,13 +437,139 @@ async def run_test_scenario(
             "duration": duration,
         }
 
+    finally:
+        write_report(lines)
+
+
+def parse_batched_reply(text: str) -> dict:
+    """
+    Extract the {number: answer} JSON object from a batched supervisor reply.
+
+    Tolerates prose or markdown fences around the object.
+
+    Args:
+        text: Final supervisor message content
+
+    Returns:
+        Parsed answers keyed by request number (empty if no valid object)
+    """
+    import json
+
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end <= start:
+        return {}
+    try:
+        answers = json.loads(text[start : end + 1])
+    except json.JSONDecodeError:
+        return {}
+    return answers if isinstance(answers, dict) else {}
+
+
+async def run_batched_nonvision(graph, verbose: bool = False):
+    """
+    Run the batchable scenarios as one numbered supervisor request.
+
+    Smoke-tests the PATH2 plumbing with a single LLM round-trip instead of one
+    per scenario. Each scenario passes when the reply has an answer for its
+    number; its expected tools are checked against the tools the batch called
+    (on_tool_start events). Per-scenario duration is the batch duration split
+    evenly.
+
+    Args:
+        graph: Compiled LangGraph
+        verbose: Show detailed output
+
+    Returns:
+        Dict of scenario name -> test result (same shape as run_test_scenario)
+    """
+    names = BATCHABLE_SCENARIOS
+    message = "\n".join(
+        [BATCH_INSTRUCTIONS, ""]
+        + [f"{i}. {TEST_SCENARIOS[name].message}" for i, name in enumerate(names, 1)]
+    )
+
+    lines = [
+        f"{Colors.OKCYAN}\n{'─' * 80}{Colors.ENDC}",
+        f"{Colors.OKCYAN}{Colors.BOLD}  Batched: {', '.join(names)}{Colors.ENDC}",
+        f"{Colors.OKCYAN}{'─' * 80}{Colors.ENDC}",
+    ]
+
+    thread_id = f"test-batched-{uuid4().hex}"
+    config = get_checkpoint_config(thread_id=thread_id)
+    state = create_initial_state(
+        messages=[{"role": "user", "content": message}],
+        thread_id=thread_id,
+    )
+
+    print_colored("⚡ Running batched scenarios...", Colors.WARNING)
+    start_ns = time.perf_counter_ns()
+
+    try:
+        result, tools_called = await stream_scenario(graph, state, config)
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
+    except Exception as e:
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
+        lines.append(f"{Colors.FAIL}{Colors.BOLD}\n❌ BATCH FAILED{Colors.ENDC}")
+        lines.append(f"{Colors.FAIL}Error: {str(e)}{Colors.ENDC}")
+        write_report(lines)
+        return {
+            name: {"success": False, "error": str(e), "duration": duration / len(names)}
+            for name in names
+        }
+
+    messages = result.get("messages") or ()
+    response_text = message_text(messages[-1]) if messages else ""
+    answers = parse_batched_reply(response_text)
+
+    results = {}
+    for i, name in enumerate(names, 1):
+        answer = str(answers.get(str(i), ""))
+        if answer:
+            validation_errors = tool_validation_errors(
+                TEST_SCENARIOS[name].expected_tool, tools_called, strict=False
+            )
+            lines.append(f"\n✅ {TEST_SCENARIOS[name].name}")
+            lines.append(f"🤖 {answer[:200]}{'...' if len(answer) > 200 else ''}")
+            for error in validation_errors:
+                lines.append(f"{Colors.WARNING}  ⚠️  {error}{Colors.ENDC}")
+            results[name] = {
+                "success": True,
+                "duration": duration / len(names),
+                "route": "PATH2",
+                "tools": tools_called,
+                "response_length": len(answer),
+                "validation_errors": validation_errors,
+            }
+        else:
+            lines.append(f"\n❌ {TEST_SCENARIOS[name].name}: no answer in reply")
+            results[name] = {
+                "success": False,
+                "error": f"No answer for request {i} in batched reply",
+                "duration": duration / len(names),
+            }
+
+    if verbose:
+        lines.append(f"\n📋 Raw reply: {response_text}")
+    lines.append(f"\n🔧 Tools Called: {', '.join(tools_called) or 'None'}")
+    lines.append(f"⏱️  Batch Duration: {duration:.3f}s")
+    write_report(lines)
+
+    return results
 
-async def run_all_tests(verbose: bool = False):
+
+async def run_all_tests(
+    verbose: bool = False, concurrency: int = 4, batched: bool = False
+):
     """
     Run all Phase 3 end-to-end tests.
 
+    Scenarios are independent (one thread_id each), so they run concurrently
+    with at most `concurrency` LLM round-trips in flight.
+
     Args:
         verbose: Show detailed output
+        concurrency: Maximum scenarios running at the same time
+        batched: Pack BATCHABLE_SCENARIOS into a single supervisor request
     """
     print_header("Phase 3 End-to-End Tests - LangGraph Full Implementation")
 
@@ -287,21 +586,40 @@ async def run_all_tests(verbose: bool = False):
     print("  └─ All 5 subagents: translator, calculator, corrector, weather, vision")
     print()
 
-    graph = create_phase3_graph(checkpointer_type=CheckpointerType.MEMORY)
+    graph = get_or_build_graph(checkpointer_type=CheckpointerType.MEMORY)
     print_colored("✅ Graph compiled successfully\n", Colors.OKGREEN)
 
     # Run all test scenarios
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_bounded(scenario_name: str, scenario: Scenario):
+        async with semaphore:
+            result = await run_test_scenario(scenario_name, scenario, graph, verbose)
+            return {scenario_name: result}
+
+    async def run_batch():
+        async with semaphore:
+            return await run_batched_nonvision(graph, verbose)
+
+    jobs = [
+        run_bounded(name, scenario)
+        for name, scenario in TEST_SCENARIOS.items()
+        if not (batched and name in BATCHABLE_SCENARIOS)
+    ]
+    if batched:
+        jobs.append(run_batch())
+
     results = {}
-    for scenario_name, scenario in TEST_SCENARIOS.items():
-        results[scenario_name] = await run_test_scenario(
-            scenario_name, scenario, graph, verbose
-        )
+    async with prewarmed_llm_client(max(1, concurrency)):
+        for job_results in await asyncio.gather(*jobs):
+            results.update(job_results)
 
     # Print summary
     print_header("Test Summary")
 
     passed = sum(1 for r in results.values() if r["success"])
     failed = len(results) - passed
+    # Sum of per-scenario durations (wall-clock is lower when run concurrently)
     total_duration = sum(r["duration"] for r in results.values())
 
     print_colored(f"✅ Passed: {passed}/{len(results)}", Colors.OKGREEN)
@@ -315,7 +633,7 @@ async def run_all_tests(verbose: bool = False):
         print_colored("\n❌ Failed Tests:", Colors.FAIL + Colors.BOLD)
         for scenario_name, result in results.items():
             if not result["success"]:
-                print(f"  - {TEST_SCENARIOS[scenario_name]['name']}")
+                print(f"  - {TEST_SCENARIOS[scenario_name].name}")
                 print(f"    Error: {result.get('error', 'Unknown error')}")
 
     # Print validation warnings
@@ -335,27 +653,20 @@ async def run_single_test(test_name: str, verbose: bool = False):
     Run a single test scenario.
 
     Args:
-        test_name: Name of the test to run
+        test_name: Name of the test to run (validated by argparse choices)
         verbose: Show detailed output
     """
-    if test_name not in TEST_SCENARIOS:
-        print_colored(f"❌ Unknown test: {test_name}", Colors.FAIL)
-        print("\nAvailable tests:")
-        for name in TEST_SCENARIOS.keys():
-            print(f"  - {name}")
-        return False
-
-    print_header(f"Phase 3 Test: {TEST_SCENARIOS[test_name]['name']}")
+    scenario = TEST_SCENARIOS[test_name]
+    print_header(f"Phase 3 Test: {scenario.name}")
 
     # Create Phase 3 graph
     print_colored("🏗️  Building Phase 3 LangGraph...", Colors.OKCYAN)
-    graph = create_phase3_graph(checkpointer_type=CheckpointerType.MEMORY)
+    graph = get_or_build_graph(checkpointer_type=CheckpointerType.MEMORY)
     print_colored("✅ Graph compiled successfully\n", Colors.OKGREEN)
 
     # Run test
-    result = await run_test_scenario(
-        test_name, TEST_SCENARIOS[test_name], graph, verbose
-    )
+    async with prewarmed_llm_client(1):
+        result = await run_test_scenario(test_name, scenario, graph, verbose)
 
     return result["success"]
 
@@ -375,7 +686,19 @@ async def main():
     parser.add_argument(
         "--test",
         type=str,
-        help=f"Run a single test (choices: {', '.join(TEST_SCENARIOS.keys())})",
+        choices=tuple(TEST_SCENARIOS),
+        help="Run a single test",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum scenarios running at the same time (default: 4)",
+    )
+    parser.add_argument(
+        "--batched",
+        action="store_true",
+        help="Send the single-tool PATH2 scenarios as one batched request",
     )
     parser.add_argument(
         "--verbose",
@@ -390,11 +713,13 @@ async def main():
     if args.test:
         success = await run_single_test(args.test, args.verbose)
     else:
-        success = await run_all_tests(args.verbose)
+        success = await run_all_tests(args.verbose, args.concurrency, args.batched)
 
     # Exit with appropriate code
     sys.exit(0 if success else 1)
 
 
 if __name__ == "__main__":
+    disable_tracing()
+    install_uvloop()
     asyncio.run(main())
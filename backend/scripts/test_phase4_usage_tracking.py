@@ -7,20 +7,22 @@ Tests the complete usage tracking pipeline:
 - Usage extractor processes state
 - Hierarchical logs appear
 - Cost estimation works
+
+Usage:
+    poetry run python scripts/test_phase4_usage_tracking.py
+    VOXY_TEST_TRACE=1 poetry run python scripts/test_phase4_usage_tracking.py
 """
 
 import asyncio
+import traceback
 from uuid import uuid4
 
+from _bootstrap import disable_tracing, install_uvloop, message_text
 from voxy_agents.langgraph.checkpointer import CheckpointerType
-from voxy_agents.langgraph.graph_builder import create_phase3_graph
+from voxy_agents.langgraph.graph_builder import get_or_build_graph
 from voxy_agents.langgraph.graph_state import create_initial_state
 from voxy_agents.langgraph.usage_callback import UsageCallbackHandler
-from voxy_agents.langgraph.usage_extractor import (
-    aggregate_costs_by_model,
-    extract_tool_invocations,
-    extract_usage_from_state,
-)
+from voxy_agents.langgraph.usage_extractor import walk_state_once
 from voxy_agents.utils.usage_tracker import log_usage_metrics
 
 
@@ -39,7 +41,7 @@ async def test_usage_tracking_integration():
 
     # Create Phase 3 graph with SQLite checkpointer
     print("🔧 Creating Phase 3 graph with SQLite checkpointer...")
-    graph = create_phase3_graph(
+    graph = get_or_build_graph(
         checkpointer_type=CheckpointerType.MEMORY,  # Use memory for test speed
     )
     print("✓ Graph created\n")
@@ -76,22 +78,21 @@ async def test_usage_tracking_integration():
         print("\n✅ Graph execution completed!\n")
 
         # Extract final response
-        response_message = result["messages"][-1]
-        response_text = (
-            response_message.content
-            if hasattr(response_message, "content")
-            else str(response_message)
-        )
+        messages = result.get("messages") or ()
+        response_text = message_text(messages[-1]) if messages else "No response"
 
         print(f"💬 Response: {response_text[:200]}...")
         print()
 
+        # Usage, tools and cost from a single pass over the result messages
+        report = walk_state_once(result, usage_handler)
+
         # ===== VALIDATION 1: Usage Extraction =====
         print("=" * 60)
         print("1️⃣  VALIDATING: Usage Metrics Extraction")
         print("=" * 60 + "\n")
 
-        usage = extract_usage_from_state(result, usage_handler)
+        usage = report.usage
 
         if usage:
             print("✅ Usage metrics extracted successfully!")
@@ -117,7 +118,7 @@ async def test_usage_tracking_integration():
         print("2️⃣  VALIDATING: Tool Invocation Tracking")
         print("=" * 60 + "\n")
 
-        subagents = extract_tool_invocations(result, usage_handler)
+        subagents = report.subagents
 
         if subagents:
             print(f"✅ Found {len(subagents)} tool invocation(s)!")
@@ -139,7 +140,7 @@ async def test_usage_tracking_integration():
         print("3️⃣  VALIDATING: Multi-Model Cost Aggregation")
         print("=" * 60 + "\n")
 
-        total_cost = aggregate_costs_by_model(result, usage_handler)
+        total_cost = report.total_cost
 
         if total_cost is not None:
             print(f"✅ Total cost calculated: ${total_cost:.6f}")
@@ -232,14 +233,14 @@ async def test_usage_tracking_integration():
     except Exception as e:
         print(f"\n❌ ERROR during graph execution: {e}")
         print(f"   Type: {type(e).__name__}")
-        import traceback
-
         print("\nFull traceback:")
         traceback.print_exc()
         return False
 
 
 if __name__ == "__main__":
+    disable_tracing()
+    install_uvloop()
     print("\n🚀 Starting Phase 4 Usage Tracking Validation...\n")
     success = asyncio.run(test_usage_tracking_integration())
 
@@ -5,40 +5,60 @@ Test Vision Agent LangGraph Implementation
 Tests both PATH1 (bypass) and PATH2 (supervisor) to ensure vision analysis
 works correctly without SDK dependencies.
 """
-# ruff: noqa: E402
-# Reason: sys.path modification must happen before imports
 
 import asyncio
 import sys
 from pathlib import Path
+from typing import Any, Callable
 
 # Add backend to path
 backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir / "src"))
 
-from langchain_core.messages import HumanMessage
-from loguru import logger
-from voxy_agents.langgraph.checkpointer import CheckpointerType
-from voxy_agents.langgraph.graph_builder import create_phase3_graph
-from voxy_agents.langgraph.graph_state import create_initial_state
+# LangChain/LiteLLM/voxy_agents imports are deferred to the functions that
+# use them, so importing this module (e.g. test collection) stays cheap
 
 
-async def test_vision_path1_bypass():
+def write_report(lines: list[str]):
+    """Write a test's report as one block (a single stdout write)."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+async def run_buffered(test) -> bool:
+    """
+    Run a test with its output buffered, then write it in one block.
+
+    Tests report through add(line) (print when run on their own), so tests
+    running concurrently don't interleave their lines.
+    """
+    lines: list[str] = []
+    try:
+        return await test(lines.append)
+    finally:
+        write_report(lines)
+
+
+async def test_vision_path1_bypass(add: Callable[[str], Any] = print):
     """Test PATH1: Direct vision bypass (image_url + keywords in message)."""
-    print("\n" + "=" * 70)
-    print("🧪 TEST 1: Vision PATH1 (Bypass) - Direct Image Analysis")
-    print("=" * 70 + "\n")
+    from langchain_core.messages import HumanMessage
+    from voxy_agents.langgraph.checkpointer import CheckpointerType
+    from voxy_agents.langgraph.graph_builder import get_or_build_graph
+    from voxy_agents.langgraph.graph_state import create_initial_state
+
+    add("\n" + "=" * 70)
+    add("🧪 TEST 1: Vision PATH1 (Bypass) - Direct Image Analysis")
+    add("=" * 70 + "\n")
 
     # Test image: Simple emoji
     test_image_url = "https://em-content.zobj.net/source/apple/391/smiling-face-with-smiling-eyes_1f60a.png"
     test_message = "que emoji é esse?"
 
-    print(f"📷 Image URL: {test_image_url}")
-    print(f"💬 Query: {test_message}")
-    print()
+    add(f"📷 Image URL: {test_image_url}")
+    add(f"💬 Query: {test_message}")
+    add("")
 
     # Create graph
-    graph = create_phase3_graph(checkpointer_type=CheckpointerType.MEMORY)
+    graph = get_or_build_graph(checkpointer_type=CheckpointerType.MEMORY)
 
     # Create initial state with image_url (PATH1 trigger)
     thread_id = "test-vision-path1"
@@ -49,27 +69,23 @@ async def test_vision_path1_bypass():
         image_url=test_image_url,  # PATH1: image_url present
     )
 
-    print("🔧 Invoking LangGraph (PATH1 expected)...")
+    add("🔧 Invoking LangGraph (PATH1 expected)...")
     result = await graph.ainvoke(
         initial_state,
         config={"configurable": {"thread_id": thread_id}},
     )
 
-    print("\n" + "-" * 70)
-    print("📊 RESULT:")
-    print("-" * 70)
+    add("\n" + "-" * 70)
+    add("📊 RESULT:")
+    add("-" * 70)
 
     # Extract response
     if result.get("messages"):
-        last_message = result["messages"][-1]
-        response_content = (
-            last_message.content
-            if hasattr(last_message, "content")
-            else str(last_message)
-        )
-        print(f"\n✅ Response:\n{response_content}\n")
+        # Graph state messages are always BaseMessage (add_messages coerces)
+        response_content = result["messages"][-1].content
+        add(f"\n✅ Response:\n{response_content}\n")
     else:
-        print("❌ No messages in result")
+        add("❌ No messages in result")
         return False
 
     # Check context
@@ -77,39 +93,44 @@ async def test_vision_path1_bypass():
     route_taken = context.get("route_taken")
     vision_analysis = context.get("vision_analysis")
 
-    print(f"📍 Route: {route_taken}")
+    add(f"📍 Route: {route_taken}")
     if vision_analysis:
-        print("🔍 Vision Analysis Present: ✅")
-        print(f"   - Type: {vision_analysis.get('analysis_type')}")
-        print(f"   - Result Length: {len(vision_analysis.get('result', ''))}")
+        add("🔍 Vision Analysis Present: ✅")
+        add(f"   - Type: {vision_analysis.get('analysis_type')}")
+        add(f"   - Result Length: {len(vision_analysis.get('result', ''))}")
     else:
-        print("🔍 Vision Analysis Present: ❌")
+        add("🔍 Vision Analysis Present: ❌")
 
     # Validate PATH1
     if route_taken == "PATH_1":
-        print("\n✅ TEST 1 PASSED: Vision PATH1 working correctly!")
+        add("\n✅ TEST 1 PASSED: Vision PATH1 working correctly!")
         return True
     else:
-        print(f"\n❌ TEST 1 FAILED: Expected PATH_1, got {route_taken}")
+        add(f"\n❌ TEST 1 FAILED: Expected PATH_1, got {route_taken}")
         return False
 
 
-async def test_vision_path2_supervisor():
+async def test_vision_path2_supervisor(add: Callable[[str], Any] = print):
     """Test PATH2: Vision via supervisor tool call."""
-    print("\n" + "=" * 70)
-    print("🧪 TEST 2: Vision PATH2 (Supervisor) - Tool Call Analysis")
-    print("=" * 70 + "\n")
+    from langchain_core.messages import HumanMessage
+    from voxy_agents.langgraph.checkpointer import CheckpointerType
+    from voxy_agents.langgraph.graph_builder import get_or_build_graph
+    from voxy_agents.langgraph.graph_state import create_initial_state
+
+    add("\n" + "=" * 70)
+    add("🧪 TEST 2: Vision PATH2 (Supervisor) - Tool Call Analysis")
+    add("=" * 70 + "\n")
 
     # Test: URL in message text (PATH2 trigger)
     test_image_url = "https://em-content.zobj.net/source/apple/391/smiling-face-with-smiling-eyes_1f60a.png"
     test_message = f"Analyze this emoji image: {test_image_url}"
 
-    print(f"💬 Query: {test_message}")
-    print("🔍 Contains URL: ✅ (should trigger PATH2)")
-    print()
+    add(f"💬 Query: {test_message}")
+    add("🔍 Contains URL: ✅ (should trigger PATH2)")
+    add("")
 
     # Create graph
-    graph = create_phase3_graph(checkpointer_type=CheckpointerType.MEMORY)
+    graph = get_or_build_graph(checkpointer_type=CheckpointerType.MEMORY)
 
     # Create initial state WITHOUT image_url param (PATH2 trigger)
     thread_id = "test-vision-path2"
@@ -120,52 +141,49 @@ async def test_vision_path2_supervisor():
         # NO image_url param -> PATH2 (supervisor decides)
     )
 
-    print("🔧 Invoking LangGraph (PATH2 expected)...")
+    add("🔧 Invoking LangGraph (PATH2 expected)...")
     result = await graph.ainvoke(
         initial_state,
         config={"configurable": {"thread_id": thread_id}},
     )
 
-    print("\n" + "-" * 70)
-    print("📊 RESULT:")
-    print("-" * 70)
+    add("\n" + "-" * 70)
+    add("📊 RESULT:")
+    add("-" * 70)
 
     # Extract response
     if result.get("messages"):
-        last_message = result["messages"][-1]
-        response_content = (
-            last_message.content
-            if hasattr(last_message, "content")
-            else str(last_message)
-        )
-        print(f"\n✅ Response:\n{response_content}\n")
+        # Graph state messages are always BaseMessage (add_messages coerces)
+        response_content = result["messages"][-1].content
+        add(f"\n✅ Response:\n{response_content}\n")
     else:
-        print("❌ No messages in result")
+        add("❌ No messages in result")
         return False
 
     # Check context
     context = result.get("context", {})
     route_taken = context.get("route_taken")
 
-    print(f"📍 Route: {route_taken}")
+    add(f"📍 Route: {route_taken}")
 
     # Validate PATH2
     if route_taken == "PATH_2":
-        print("\n✅ TEST 2 PASSED: Vision PATH2 working correctly!")
+        add("\n✅ TEST 2 PASSED: Vision PATH2 working correctly!")
         return True
     else:
-        print(f"\n⚠️  TEST 2: Expected PATH_2, got {route_taken}")
-        print("   (Supervisor may not have called vision tool - check response)")
+        add(f"\n⚠️  TEST 2: Expected PATH_2, got {route_taken}")
+        add("   (Supervisor may not have called vision tool - check response)")
         # Not a hard failure if supervisor chose another approach
         return True
 
 
-async def test_vision_node_standalone():
+async def test_vision_node_standalone(add: Callable[[str], Any] = print):
     """Test vision node function standalone (no graph)."""
-    print("\n" + "=" * 70)
-    print("🧪 TEST 3: Vision Node Standalone - Direct Function Call")
-    print("=" * 70 + "\n")
+    add("\n" + "=" * 70)
+    add("🧪 TEST 3: Vision Node Standalone - Direct Function Call")
+    add("=" * 70 + "\n")
 
+    from langchain_core.messages import HumanMessage
     from voxy_agents.langgraph.nodes.vision_node import create_vision_node
 
     # Create vision node
@@ -174,9 +192,9 @@ async def test_vision_node_standalone():
     test_image_url = "https://em-content.zobj.net/source/apple/391/smiling-face-with-smiling-eyes_1f60a.png"
     test_query = "What emoji is this?"
 
-    print(f"📷 Image URL: {test_image_url}")
-    print(f"💬 Query: {test_query}")
-    print()
+    add(f"📷 Image URL: {test_image_url}")
+    add(f"💬 Query: {test_query}")
+    add("")
 
     # Create state
     state = {
@@ -187,37 +205,36 @@ async def test_vision_node_standalone():
         },
     }
 
-    print("🔧 Invoking vision node directly...")
-    result = vision_node(state)
+    add("🔧 Invoking vision node directly...")
+    result = await vision_node.ainvoke(state)
 
-    print("\n" + "-" * 70)
-    print("📊 RESULT:")
-    print("-" * 70)
+    add("\n" + "-" * 70)
+    add("📊 RESULT:")
+    add("-" * 70)
 
     # Check result
     if result.get("messages"):
-        response = result["messages"][0]
-        content = response.content if hasattr(response, "content") else str(response)
-        print(f"\n✅ Response:\n{content}\n")
-        print(f"📊 Response Length: {len(content)} chars")
+        content = result["messages"][0].content
+        add(f"\n✅ Response:\n{content}\n")
+        add(f"📊 Response Length: {len(content)} chars")
 
         # Basic validation
         if len(content) > 10:
-            print("\n✅ TEST 3 PASSED: Vision node standalone working!")
+            add("\n✅ TEST 3 PASSED: Vision node standalone working!")
             return True
         else:
-            print("\n❌ TEST 3 FAILED: Response too short")
+            add("\n❌ TEST 3 FAILED: Response too short")
             return False
     else:
-        print("❌ No messages in result")
+        add("❌ No messages in result")
         return False
 
 
-async def test_vision_tool_standalone():
+async def test_vision_tool_standalone(add: Callable[[str], Any] = print):
     """Test vision tool (for supervisor) standalone."""
-    print("\n" + "=" * 70)
-    print("🧪 TEST 4: Vision Tool Standalone - Direct Tool Call")
-    print("=" * 70 + "\n")
+    add("\n" + "=" * 70)
+    add("🧪 TEST 4: Vision Tool Standalone - Direct Tool Call")
+    add("=" * 70 + "\n")
 
     from voxy_agents.langgraph.nodes.vision_node import create_vision_tool
 
@@ -227,31 +244,35 @@ async def test_vision_tool_standalone():
     test_image_url = "https://em-content.zobj.net/source/apple/391/smiling-face-with-smiling-eyes_1f60a.png"
     test_query = "Identify this emoji"
 
-    print(f"📷 Image URL: {test_image_url}")
-    print(f"💬 Query: {test_query}")
-    print()
+    add(f"📷 Image URL: {test_image_url}")
+    add(f"💬 Query: {test_query}")
+    add("")
 
-    print("🔧 Invoking vision tool directly...")
-    result = vision_tool.invoke({"image_url": test_image_url, "query": test_query})
+    add("🔧 Invoking vision tool directly...")
+    result = await vision_tool.ainvoke(
+        {"image_url": test_image_url, "query": test_query}
+    )
 
-    print("\n" + "-" * 70)
-    print("📊 RESULT:")
-    print("-" * 70)
+    add("\n" + "-" * 70)
+    add("📊 RESULT:")
+    add("-" * 70)
 
-    print(f"\n✅ Response:\n{result}\n")
-    print(f"📊 Response Length: {len(result)} chars")
+    add(f"\n✅ Response:\n{result}\n")
+    add(f"📊 Response Length: {len(result)} chars")
 
     # Basic validation
     if len(result) > 10:
-        print("\n✅ TEST 4 PASSED: Vision tool standalone working!")
+        add("\n✅ TEST 4 PASSED: Vision tool standalone working!")
         return True
     else:
-        print("\n❌ TEST 4 FAILED: Response too short")
+        add("\n❌ TEST 4 FAILED: Response too short")
         return False
 
 
 async def main():
     """Run all vision tests."""
+    from loguru import logger
+
     print("\n" + "=" * 70)
     print("🧪 VISION AGENT LANGGRAPH TEST SUITE")
     print("=" * 70)
@@ -259,43 +280,27 @@ async def main():
     print("Tests cover: PATH1 (bypass), PATH2 (supervisor), standalone node/tool")
     print()
 
-    results = []
+    # Independent tests (distinct thread_ids): run them concurrently so the
+    # total wall time is the slowest LLM round-trip, not the sum. Each one's
+    # output is buffered and written when it finishes.
+    tests = [
+        ("PATH1 Bypass", test_vision_path1_bypass),
+        ("PATH2 Supervisor", test_vision_path2_supervisor),
+        ("Vision Node Standalone", test_vision_node_standalone),
+        ("Vision Tool Standalone", test_vision_tool_standalone),
+    ]
+    outcomes = await asyncio.gather(
+        *(run_buffered(test) for _, test in tests), return_exceptions=True
+    )
 
-    # Test 1: PATH1 (bypass)
-    try:
-        result = await test_vision_path1_bypass()
-        results.append(("PATH1 Bypass", result))
-    except Exception as e:
-        logger.exception("Test 1 failed with exception")
-        results.append(("PATH1 Bypass", False))
-        print(f"\n❌ TEST 1 EXCEPTION: {e}\n")
-
-    # Test 2: PATH2 (supervisor)
-    try:
-        result = await test_vision_path2_supervisor()
-        results.append(("PATH2 Supervisor", result))
-    except Exception as e:
-        logger.exception("Test 2 failed with exception")
-        results.append(("PATH2 Supervisor", False))
-        print(f"\n❌ TEST 2 EXCEPTION: {e}\n")
-
-    # Test 3: Standalone node
-    try:
-        result = await test_vision_node_standalone()
-        results.append(("Vision Node Standalone", result))
-    except Exception as e:
-        logger.exception("Test 3 failed with exception")
-        results.append(("Vision Node Standalone", False))
-        print(f"\n❌ TEST 3 EXCEPTION: {e}\n")
-
-    # Test 4: Standalone tool
-    try:
-        result = await test_vision_tool_standalone()
-        results.append(("Vision Tool Standalone", result))
-    except Exception as e:
-        logger.exception("Test 4 failed with exception")
-        results.append(("Vision Tool Standalone", False))
-        print(f"\n❌ TEST 4 EXCEPTION: {e}\n")
+    results = []
+    for number, ((test_name, _), outcome) in enumerate(zip(tests, outcomes), 1):
+        if isinstance(outcome, Exception):
+            logger.opt(exception=outcome).error(f"Test {number} failed with exception")
+            results.append((test_name, False))
+            print(f"\n❌ TEST {number} EXCEPTION: {outcome}\n")
+        else:
+            results.append((test_name, outcome))
 
     # Summary
     print("\n" + "=" * 70)
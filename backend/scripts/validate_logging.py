@@ -10,6 +10,31 @@ from pathlib import Path
 # Adicionar src ao PYTHONPATH
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Sink de captura único, compartilhado pelas validações (um logger.add só)
+_captured: list[str] = []
+_capture_handler_id: int | None = None
+
+
+def capture_start() -> int:
+    """
+    Registra o sink de captura na primeira chamada.
+
+    Deve rodar depois de configure_logger(), que remove os handlers
+    existentes. O sink já aplica mask_sensitive_data.
+
+    Returns:
+        Posição em _captured a partir da qual ler as mensagens novas
+    """
+    global _capture_handler_id
+    if _capture_handler_id is None:
+        from loguru import logger
+        from voxy_agents.config.log_filters import mask_sensitive_data
+
+        _capture_handler_id = logger.add(
+            _captured.append, format="{message}", filter=mask_sensitive_data
+        )
+    return len(_captured)
+
 
 def validate_phase_2_intercept():
     """Valida que InterceptHandler captura logs stdlib."""
@@ -24,17 +49,14 @@ def validate_phase_2_intercept():
     configure_logger()
     setup_stdlib_intercept()
 
-    from loguru import logger
-
     # Capturar logs
-    output = []
-    handler_id = logger.add(output.append, format="{message}")
+    start = capture_start()
 
     # Emitir log via stdlib
     stdlib_logger = logging.getLogger("test_stdlib")
     stdlib_logger.info("Test message from stdlib")
 
-    logger.remove(handler_id)
+    output = _captured[start:]
 
     captured = any("Test message from stdlib" in str(log) for log in output)
 
@@ -53,16 +75,13 @@ def validate_phase_2_uvicorn():
     """Valida que logs do Uvicorn são capturados."""
     print("\n🔍 Testando captura Uvicorn logger\n")
 
-    from loguru import logger
-
-    output = []
-    handler_id = logger.add(output.append, format="{message}")
+    start = capture_start()
 
     # Simular log do Uvicorn
     uvicorn_logger = logging.getLogger("uvicorn")
     uvicorn_logger.info("Test uvicorn message")
 
-    logger.remove(handler_id)
+    output = _captured[start:]
 
     captured = any("Test uvicorn message" in str(log) for log in output)
 
@@ -76,12 +95,8 @@ def validate_phase_2_masking():
     print("\n🔍 Testando mascaramento de dados sensíveis\n")
 
     from loguru import logger
-    from voxy_agents.config.log_filters import mask_sensitive_data
 
-    output = []
-    handler_id = logger.add(
-        output.append, format="{message}", filter=mask_sensitive_data
-    )
+    start = capture_start()
 
     # Testar vários padrões sensíveis
     logger.info(
@@ -91,7 +106,7 @@ def validate_phase_2_masking():
     logger.info("Email: user@example.com")
     logger.info("Bearer: Bearer abc123def456")
 
-    logger.remove(handler_id)
+    output = _captured[start:]
 
     # Verificar mascaramento
     logs_text = " ".join(str(log) for log in output)
@@ -4,16 +4,36 @@ Base classes and utilities for VOXY agents.
 This module provides:
 - BaseAgent: Abstract base for agent business logic
 - create_simple_node: Factory for creating LangGraph nodes
+- TextAgent: Shared node/tool machinery for text subagents
+- create_batched_invoke / create_model_invoker: Micro-batched model calls
+- astream_message / stream_message: Streamed model call returning the full message
+- cacheable_system_message: Provider prompt caching for static instructions
 - Utility functions for node management
 """
 
 from .agent import BaseAgent, SyncAgent
-from .node import create_lazy_node, create_simple_node, get_or_create_node
+from .node import (
+    astream_message,
+    cacheable_system_message,
+    create_batched_invoke,
+    create_lazy_node,
+    create_model_invoker,
+    create_simple_node,
+    get_or_create_node,
+    stream_message,
+)
+from .text_agent import TextAgent
 
 __all__ = [
     "BaseAgent",
     "SyncAgent",
+    "TextAgent",
     "create_simple_node",
+    "create_batched_invoke",
+    "create_model_invoker",
     "create_lazy_node",
     "get_or_create_node",
+    "cacheable_system_message",
+    "astream_message",
+    "stream_message",
 ]
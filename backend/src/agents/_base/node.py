@@ -6,18 +6,181 @@ node functions from agent classes, maintaining separation between
 business logic (agents) and infrastructure (LangGraph).
 """
 
+import asyncio
+import hashlib
+import inspect
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable
 from typing import Any, Callable
 
-from langchain_core.messages import AIMessage, SystemMessage
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    message_chunk_to_message,
+)
+from langchain_core.runnables import Runnable, RunnableLambda
 from langchain_litellm import ChatLiteLLM
 from loguru import logger
 
+# Event-bound loggers shared by every node (bind copies extras; do it once)
+_init_logger = logger.bind(event="LANGGRAPH|NODE_INIT")
+_cache_logger = logger.bind(event="NODE_CACHE")
+
+# Reply for empty states, validated once. add_messages assigns ids in place,
+# so callers get a cheap id-less copy rather than the shared instance.
+_EMPTY_RESPONSE = AIMessage(content="No input to process")
+
+
+def _empty_response() -> AIMessage:
+    """Copy of _EMPTY_RESPONSE without id (skips pydantic validation)."""
+    return _EMPTY_RESPONSE.model_copy(update={"id": None})
+
+
+# Exact-match response cache shared by deterministic simple nodes (LRU)
+_RESPONSE_CACHE: OrderedDict[str, AIMessage] = OrderedDict()
+_RESPONSE_CACHE_MAX_SIZE = 256
+_response_cache_lock = threading.Lock()
+
+
+def _response_cache_key(
+    agent_name: str, model_path: str, instructions: str, messages: list[BaseMessage]
+) -> str:
+    """Hash agent name, model, instructions and the full prompt history."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (agent_name, model_path, instructions):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    for message in messages:
+        digest.update(message.type.encode())
+        digest.update(b"\0")
+        digest.update(str(message.content).encode())
+        digest.update(b"\0")
+        # Assistant turns differing only in their tool calls are distinct
+        digest.update(repr(getattr(message, "tool_calls", None)).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+# Strong refs to in-flight warmup tasks (the loop only keeps weak ones)
+_warmup_tasks: set[asyncio.Task] = set()
+
+
+def _warm_llm_connection(litellm_model: ChatLiteLLM, agent_name: str) -> None:
+    """
+    Open the provider connection in the background (VOXY_WARM_LLM=1).
+
+    Sends a one-token request so DNS + TLS are paid before the first real
+    call. Inside a running event loop it uses ainvoke (warming the async
+    client that node_function uses); otherwise a daemon thread calls invoke.
+    Failures are only logged.
+    """
+    warmup_messages = [HumanMessage(content="hi")]
+
+    async def warm_async() -> None:
+        try:
+            await litellm_model.ainvoke(warmup_messages, max_tokens=1)
+        except Exception as e:
+            _init_logger.debug(f"{agent_name} LLM warmup failed: {e}")
+
+    def warm_sync() -> None:
+        try:
+            litellm_model.invoke(warmup_messages, max_tokens=1)
+        except Exception as e:
+            _init_logger.debug(f"{agent_name} LLM warmup failed: {e}")
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        threading.Thread(
+            target=warm_sync, name=f"{agent_name}-llm-warmup", daemon=True
+        ).start()
+        return
+
+    task = loop.create_task(warm_async())
+    _warmup_tasks.add(task)
+    task.add_done_callback(_warmup_tasks.discard)
+
+
+def stream_message(
+    litellm_model: ChatLiteLLM, prompt_messages: list[BaseMessage]
+) -> AIMessage:
+    """Sync astream_message: fold the model's stream() chunks into one message."""
+    response = None
+    for chunk in litellm_model.stream(
+        prompt_messages, stream_options={"include_usage": True}
+    ):
+        response = chunk if response is None else response + chunk
+    if response is None:
+        return AIMessage(content="")
+    return message_chunk_to_message(response)
+
+
+async def astream_message(
+    litellm_model: ChatLiteLLM, prompt_messages: list[BaseMessage]
+) -> AIMessage:
+    """
+    Call the model with astream and return the accumulated message.
+
+    Opt-in path (create_simple_node(streaming=True)): plain ainvoke already
+    streams tokens to astream_events / stream_mode="messages" consumers.
+    The chunks are folded back into an AIMessage. usage_metadata is only
+    present if the provider honors stream_options.include_usage.
+    """
+    response = None
+    async for chunk in litellm_model.astream(
+        prompt_messages, stream_options={"include_usage": True}
+    ):
+        response = chunk if response is None else response + chunk
+    if response is None:
+        return AIMessage(content="")
+    return message_chunk_to_message(response)
+
+
+# Providers that only reuse a prompt prefix explicitly marked cache_control
+_CACHE_CONTROL_PROVIDERS = frozenset({"anthropic", "bedrock"})
+
+
+def cacheable_system_message(message: SystemMessage, llm_config) -> SystemMessage:
+    """
+    Mark static system instructions as a provider-cached prompt prefix.
+
+    Anthropic/Bedrock (and Claude models behind OpenRouter) only cache
+    prefixes tagged with cache_control, so the instructions become a text
+    block carrying {"type": "ephemeral"}. Other providers get the message
+    unchanged (OpenAI caches prefixes >= 1024 tokens automatically).
+    """
+    provider = llm_config.provider
+    is_openrouter_claude = (
+        provider == "openrouter" and "claude" in llm_config.model_name.lower()
+    )
+    if provider not in _CACHE_CONTROL_PROVIDERS and not is_openrouter_claude:
+        return message
+
+    return SystemMessage(
+        content=[
+            {
+                "type": "text",
+                "text": message.content,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+    )
+
 
 def create_simple_node(
     agent_name: str,
     instructions_fn: Callable[[], str],
     llm_config,
-) -> Callable:
+    cache: bool = False,
+    max_concurrency: int | None = None,
+    cache_instructions: bool = False,
+    streaming: bool = False,
+    batched: bool = False,
+) -> RunnableLambda:
     """
     Create a simple LangGraph node from instructions and config.
 
@@ -25,13 +188,32 @@ def create_simple_node(
     state management. Suitable for stateless transformations like
     calculation, translation, correction.
 
+    With cache=True, responses are cached by exact prompt (agent, model,
+    instructions and full message history, tool calls included) when the
+    model is deterministic (temperature == 0); cache hits skip the LLM call
+    and carry no usage_metadata.
+
     Args:
         agent_name: Name of the agent (for logging)
         instructions_fn: Function that returns system instructions
         llm_config: Model configuration object (from models_config.py)
+        cache: Opt in to the response cache (ignored when temperature > 0)
+        max_concurrency: Maximum in-flight LLM calls for this node (unbounded
+            if None)
+        cache_instructions: Call instructions_fn once at creation and reuse
+            the SystemMessage instead of calling it per invocation. Only for
+            static prompts (instructions_fn must return the same text on
+            every call).
+        streaming: Call the model with astream so tokens reach
+            astream_events / stream_mode="messages" consumers as they are
+            generated; the node still returns the complete message.
+        batched: Coalesce concurrent async calls into one abatch() when
+            VOXY_LLM_MICROBATCH=1 (see create_model_invoker); not combined
+            with streaming. The sync path calls the model directly.
 
     Returns:
-        LangGraph node function compatible with StateGraph.add_node()
+        RunnableLambda node (sync invoke and async ainvoke paths) compatible
+        with StateGraph.add_node()
 
     Example:
         >>> def get_calculator_instructions():
@@ -46,77 +228,283 @@ def create_simple_node(
         >>> # Use in graph:
         >>> graph.add_node("calculator", calculator_node)
     """
+    # Per-node constants: computed here, not on every invocation
+    model_path = llm_config.get_litellm_model_path()
+    display_name = agent_name.capitalize()
+    node_logger = logger.bind(event=f"LANGGRAPH|{agent_name.upper()}_NODE")
+
     # Create LiteLLM model instance (once during node creation)
     litellm_model = ChatLiteLLM(
-        model=llm_config.get_litellm_model_path(),
+        model=model_path,
         temperature=llm_config.temperature,
         max_tokens=llm_config.max_tokens,
     )
 
-    logger.bind(event="LANGGRAPH|NODE_INIT").info(
-        f"{agent_name.capitalize()} node created",
-        model=llm_config.get_litellm_model_path(),
+    _init_logger.info(
+        f"{display_name} node created",
+        model=model_path,
         provider=llm_config.provider,
     )
 
-    def node_function(state: dict[str, Any]) -> dict[str, Any]:
-        """
-        LangGraph node function.
+    if os.getenv("VOXY_WARM_LLM") == "1":
+        _warm_llm_connection(litellm_model, agent_name)
 
-        Args:
-            state: Current VoxyState with message history
+    # Sampled outputs are not reproducible, so only cache temperature 0
+    use_cache = cache and llm_config.temperature == 0
 
-        Returns:
-            State update dict with agent response
+    # Bounds provider parallelism when many graph runs share this node
+    # (one bound per path: the async one is per event loop, not thread-safe)
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    sync_semaphore = (
+        threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+    )
+
+    # Static prompts: build the SystemMessage once instead of per call
+    static_system_message = (
+        SystemMessage(content=instructions_fn()) if cache_instructions else None
+    )
+
+    invoke_model = (
+        create_model_invoker(litellm_model, agent_name)
+        if batched
+        else litellm_model.ainvoke
+    )
+
+    def call_model(prompt_messages: list[BaseMessage]) -> AIMessage:
+        """Invoke the model, streaming chunks through callbacks if enabled."""
+        if not streaming:
+            return litellm_model.invoke(prompt_messages)
+
+        return stream_message(litellm_model, prompt_messages)
+
+    async def acall_model(prompt_messages: list[BaseMessage]) -> AIMessage:
+        """Async call_model (micro-batched when batched=True)."""
+        if not streaming:
+            return await invoke_model(prompt_messages)
+
+        return await astream_message(litellm_model, prompt_messages)
+
+    def prepare(
+        state: dict[str, Any],
+    ) -> dict[str, Any] | tuple[list[BaseMessage], str | None]:
+        """
+        State update for empty states and cache hits, else (prompt, cache key).
         """
         # Extract messages
         messages = state.get("messages", [])
         if not messages:
-            logger.bind(event=f"LANGGRAPH|{agent_name.upper()}_NODE").warning(
-                "No messages in state"
-            )
-            return {"messages": [AIMessage(content="No input to process")]}
+            node_logger.warning("No messages in state")
+            return {"messages": [_empty_response()]}
 
         # Build prompt: system instructions + conversation history
-        system_message = SystemMessage(content=instructions_fn())
-        prompt_messages = [system_message] + messages
+        system_message = static_system_message or SystemMessage(
+            content=instructions_fn()
+        )
+        prompt_messages = [system_message, *messages]
+
+        cache_key = None
+        if use_cache:
+            cache_key = _response_cache_key(
+                agent_name, model_path, system_message.content, messages
+            )
+            with _response_cache_lock:
+                cached = _RESPONSE_CACHE.get(cache_key)
+                if cached is not None:
+                    _RESPONSE_CACHE.move_to_end(cache_key)
+            if cached is not None:
+                node_logger.debug(f"{display_name} response cache hit")
+                # Fresh id so add_messages appends; no tokens were spent
+                return {
+                    "messages": [
+                        cached.model_copy(update={"id": None, "usage_metadata": None})
+                    ]
+                }
 
         # Log invocation
-        logger.bind(event=f"LANGGRAPH|{agent_name.upper()}_NODE").debug(
+        node_logger.debug(
             f"Invoking {agent_name} model",
-            model=llm_config.get_litellm_model_path(),
+            model=model_path,
             message_count=len(prompt_messages),
         )
+        return prompt_messages, cache_key
 
-        # Call LLM
-        response = litellm_model.invoke(prompt_messages)
-
-        # Log completion
-        logger.bind(event=f"LANGGRAPH|{agent_name.upper()}_NODE").info(
-            f"{agent_name.capitalize()} completed",
-            response_length=(
-                len(response.content) if hasattr(response, "content") else 0
-            ),
+    def finish(response: AIMessage, cache_key: str | None) -> dict[str, Any]:
+        """Log completion, cache the response and build the state update."""
+        node_logger.info(
+            f"{display_name} completed",
+            response_length=len(response.content),
         )
 
+        if cache_key is not None:
+            with _response_cache_lock:
+                _RESPONSE_CACHE[cache_key] = response
+                if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAX_SIZE:
+                    _RESPONSE_CACHE.popitem(last=False)
+
         # Return state update
         return {"messages": [response]}
 
-    return node_function
+    def node_function(state: dict[str, Any]) -> dict[str, Any]:
+        """
+        LangGraph node function.
 
+        Args:
+            state: Current VoxyState with message history
 
-def create_lazy_node(node_factory: Callable[[], Callable]) -> Callable:
+        Returns:
+            State update dict with agent response
+        """
+        request = prepare(state)
+        if isinstance(request, dict):
+            return request
+
+        prompt_messages, cache_key = request
+        if sync_semaphore is None:
+            response = call_model(prompt_messages)
+        else:
+            with sync_semaphore:
+                response = call_model(prompt_messages)
+        return finish(response, cache_key)
+
+    async def anode_function(state: dict[str, Any]) -> dict[str, Any]:
+        """Async node_function (graph.ainvoke/astream)."""
+        request = prepare(state)
+        if isinstance(request, dict):
+            return request
+
+        prompt_messages, cache_key = request
+        # Async call, so concurrent graph runs overlap their HTTP waits
+        if semaphore is None:
+            response = await acall_model(prompt_messages)
+        else:
+            async with semaphore:
+                response = await acall_model(prompt_messages)
+        return finish(response, cache_key)
+
+    return RunnableLambda(
+        node_function, afunc=anode_function, name=f"{agent_name}_node"
+    )
+
+
+def create_batched_invoke(
+    litellm_model: ChatLiteLLM,
+    agent_name: str,
+    max_batch_size: int = 8,
+    max_wait_ms: float = 20,
+) -> Callable[[list[BaseMessage]], Awaitable[AIMessage]]:
+    """
+    Wrap a model's ainvoke so concurrent calls are coalesced.
+
+    Prompts arriving within max_wait_ms of each other (up to
+    max_batch_size) are sent together through litellm_model.abatch();
+    a lone prompt goes through ainvoke. Each caller awaits its own
+    response (or exception).
+
+    Args:
+        litellm_model: Model shared by the callers
+        agent_name: Name of the agent (for logging)
+        max_batch_size: Maximum prompts per batch
+        max_wait_ms: How long the first prompt waits for others to join
+
+    Returns:
+        Async callable taking a prompt (message list) and returning the reply
+    """
+    batch_logger = logger.bind(event=f"LANGGRAPH|{agent_name.upper()}_BATCH")
+    max_wait = max_wait_ms / 1000
+
+    # Queue and drain task belong to one event loop; rebuilt if it changes
+    batcher: dict[str, Any] = {"loop": None, "queue": None, "task": None}
+
+    async def drain(queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + max_wait
+            while len(batch) < max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            prompts = [prompt for prompt, _ in batch]
+            try:
+                if len(batch) == 1:
+                    responses = [await litellm_model.ainvoke(prompts[0])]
+                else:
+                    batch_logger.debug(
+                        f"Sending batch of {len(batch)} to {agent_name} model"
+                    )
+                    responses = await litellm_model.abatch(
+                        prompts, return_exceptions=True
+                    )
+            except Exception as e:
+                responses = [e] * len(batch)
+
+            for (_, future), response in zip(batch, responses):
+                if future.done():
+                    continue
+                if isinstance(response, Exception):
+                    future.set_exception(response)
+                else:
+                    future.set_result(response)
+
+    def get_queue() -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if batcher["loop"] is not loop:
+            batcher["loop"] = loop
+            batcher["queue"] = asyncio.Queue()
+            batcher["task"] = loop.create_task(drain(batcher["queue"]))
+        return batcher["queue"]
+
+    async def invoke_batched(prompt: list[BaseMessage]) -> AIMessage:
+        future = asyncio.get_running_loop().create_future()
+        await get_queue().put((prompt, future))
+        return await future
+
+    return invoke_batched
+
+
+def create_model_invoker(
+    litellm_model: ChatLiteLLM,
+    agent_name: str,
+    max_batch_size: int = 8,
+    max_wait_ms: float = 10,
+) -> Callable[[list[BaseMessage]], Awaitable[AIMessage]]:
+    """
+    Model call for subagent tools: micro-batched when VOXY_LLM_MICROBATCH=1.
+
+    Otherwise returns litellm_model.ainvoke unchanged.
+    """
+    if os.getenv("VOXY_LLM_MICROBATCH") != "1":
+        return litellm_model.ainvoke
+
+    _init_logger.info(
+        f"{agent_name.capitalize()} tool micro-batching enabled",
+        max_batch_size=max_batch_size,
+        max_wait_ms=max_wait_ms,
+    )
+    return create_batched_invoke(litellm_model, agent_name, max_batch_size, max_wait_ms)
+
+
+def create_lazy_node(node_factory: Callable[[], Callable]) -> RunnableLambda:
     """
     Create a lazy-initialized node wrapper.
 
     Delays node creation until first use, useful for expensive
     initialization or when you want to control when models are loaded.
+    The wrapper has sync and async paths: Runnable nodes are driven with
+    invoke/ainvoke, plain functions are called (and awaited on the async
+    path if they return a coroutine). Async-only functions raise TypeError
+    on the sync path.
 
     Args:
         node_factory: Function that creates the actual node
 
     Returns:
-        Wrapped node function with lazy initialization
+        RunnableLambda with lazy initialization (invoke and ainvoke)
 
     Example:
         >>> def create_expensive_node():
@@ -128,18 +516,43 @@ def create_lazy_node(node_factory: Callable[[], Callable]) -> Callable:
         >>> graph.add_node("expensive", lazy_node)
     """
     _instance = None
+    _lock = threading.Lock()
 
-    def lazy_wrapper(*args, **kwargs):
+    def get_instance() -> Callable:
         nonlocal _instance
         if _instance is None:
-            _instance = node_factory()
-        return _instance(*args, **kwargs)
-
-    return lazy_wrapper
+            with _lock:
+                # Re-check: another caller may have built it while we waited
+                if _instance is None:
+                    _instance = node_factory()
+        return _instance
+
+    def lazy_wrapper(state: dict[str, Any]) -> Any:
+        instance = get_instance()
+        if isinstance(instance, Runnable):
+            return instance.invoke(state)
+        result = instance(state)
+        if inspect.isawaitable(result):
+            if inspect.iscoroutine(result):
+                result.close()
+            raise TypeError("Lazy node is async-only; call it with ainvoke")
+        return result
+
+    async def alazy_wrapper(state: dict[str, Any]) -> Any:
+        instance = get_instance()
+        if isinstance(instance, Runnable):
+            return await instance.ainvoke(state)
+        result = instance(state)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    return RunnableLambda(lazy_wrapper, afunc=alazy_wrapper, name="lazy_node")
 
 
 # Singleton pattern for global node instances
 _node_instances: dict[str, Callable] = {}
+_node_instances_lock = threading.Lock()
 
 
 def get_or_create_node(node_name: str, factory: Callable[[], Callable]) -> Callable:
@@ -147,7 +560,11 @@ def get_or_create_node(node_name: str, factory: Callable[[], Callable]) -> Calla
     Get cached node instance or create new one.
 
     Implements singleton pattern for node instances to avoid
-    recreating expensive resources (LLM clients, etc.).
+    recreating expensive resources (LLM clients, etc.). The cached
+    node is returned as-is (nodes from create_simple_node and
+    create_lazy_node are RunnableLambdas with sync and async paths).
+    Lookups are lock-free; creation is serialized so concurrent cold
+    starts call the factory only once.
 
     Args:
         node_name: Unique identifier for this node
@@ -168,7 +585,15 @@ def get_or_create_node(node_name: str, factory: Callable[[], Callable]) -> Calla
         ... )
         >>> assert calculator is same_calculator
     """
-    if node_name not in _node_instances:
-        _node_instances[node_name] = factory()
-        logger.bind(event="NODE_CACHE").debug(f"Created and cached node: {node_name}")
-    return _node_instances[node_name]
+    node = _node_instances.get(node_name)
+    if node is not None:
+        return node
+
+    with _node_instances_lock:
+        # Re-check: another thread may have created it while we waited
+        node = _node_instances.get(node_name)
+        if node is None:
+            node = factory()
+            _node_instances[node_name] = node
+            _cache_logger.debug(f"Created and cached node: {node_name}")
+    return node
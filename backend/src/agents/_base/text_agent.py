@@ -0,0 +1,268 @@
+"""
+Shared node/tool machinery for text-in/text-out subagents.
+
+Corrector and translator only differ in their instructions, config loader
+and tool signature; TextAgent holds everything else (config, model, system
+message, node, model calls used by the tool) once per agent.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable
+from functools import cached_property
+from typing import Any, Callable
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable, RunnableLambda
+from langchain_litellm import ChatLiteLLM
+from loguru import logger
+
+from .node import cacheable_system_message, create_model_invoker
+
+# Tool completions kept per agent (LRU + TTL), by exact prompt
+_COMPLETION_CACHE_MAX_SIZE = 1024
+_COMPLETION_CACHE_TTL = 3600.0
+
+
+class TextAgent:
+    """
+    Lazily built config, model and node for one text subagent.
+
+    Config, ChatLiteLLM and the (provider-aware) system message are built on
+    first use and shared by the node and the tool.
+
+    Example:
+        >>> corrector = TextAgent(
+        ...     "corrector",
+        ...     load_corrector_config,
+        ...     _get_corrector_instructions(),
+        ...     empty_reply="No text to correct",
+        ...     completed_message="Correction completed",
+        ... )
+        >>> builder.add_node("corrector", corrector.create_node())
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config_loader: Callable[[], Any],
+        instructions: str,
+        empty_reply: str,
+        completed_message: str,
+    ):
+        """
+        Args:
+            name: Agent name (logging events and node name)
+            config_loader: load_*_config function from models_config
+            instructions: System instructions (sent byte-for-byte)
+            empty_reply: Reply for empty/whitespace-only input (no LLM call)
+            completed_message: Log message after a successful call
+        """
+        self.name = name
+        self._config_loader = config_loader
+        self._instructions = SystemMessage(content=instructions)
+        self._empty_reply = empty_reply
+        self._completed_message = completed_message
+
+        self._node_logger = logger.bind(event=f"LANGGRAPH|{name.upper()}_NODE")
+        self._tool_logger = logger.bind(event=f"LANGGRAPH|{name.upper()}_TOOL")
+
+        self._node_instance: Runnable | None = None
+        self._node_lock = threading.Lock()
+
+        self._completions: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._completions_lock = threading.Lock()
+
+    @cached_property
+    def config(self) -> Any:
+        """Agent configuration, loaded once."""
+        return self._config_loader()
+
+    @cached_property
+    def model(self) -> ChatLiteLLM:
+        """ChatLiteLLM shared by the node and the tool."""
+        return ChatLiteLLM(
+            model=self.config.get_litellm_model_path(),
+            temperature=self.config.temperature,
+            max_tokens=self.config.max_tokens,
+        )
+
+    @cached_property
+    def system_message(self) -> SystemMessage:
+        """System instructions, tagged for prompt caching if the provider needs it."""
+        return cacheable_system_message(self._instructions, self.config)
+
+    def create_node(self) -> Runnable:
+        """
+        Create the LangGraph node for this agent.
+
+        The node runs natively on both graph paths: model.invoke under
+        graph.invoke, model.ainvoke under graph.ainvoke/astream.
+
+        Returns:
+            Runnable node compatible with StateGraph.add_node()
+        """
+        config = self.config
+        model_path = config.get_litellm_model_path()
+        litellm_model = self.model
+        system_message = self.system_message
+        node_logger = self._node_logger
+        empty_reply = self._empty_reply
+        completed_message = self._completed_message
+
+        logger.bind(event="LANGGRAPH|NODE_INIT").info(
+            f"{self.name.capitalize()} node created",
+            model=model_path,
+            provider=config.provider,
+        )
+
+        def build_prompt(state: dict[str, Any]) -> list[BaseMessage] | None:
+            """System message + history, or None when there is no text."""
+            messages = state["messages"]
+            # Empty or whitespace-only input: answer without a model round-trip
+            if not messages or not str(messages[-1].content).strip():
+                node_logger.warning("No text in state")
+                return None
+
+            prompt_messages = [system_message, *messages]
+
+            node_logger.debug(
+                f"Invoking {self.name} model",
+                model=model_path,
+                message_count=len(prompt_messages),
+            )
+            return prompt_messages
+
+        def node_function(state: dict[str, Any]) -> dict[str, Any]:
+            """
+            Text subagent LangGraph node function.
+
+            Args:
+                state: Current VoxyState with message history
+
+            Returns:
+                State update dict with the agent response
+            """
+            prompt_messages = build_prompt(state)
+            if prompt_messages is None:
+                return {"messages": [AIMessage(content=empty_reply)]}
+
+            response = litellm_model.invoke(prompt_messages)
+
+            node_logger.info(completed_message, response_length=len(response.content))
+
+            return {"messages": [response]}
+
+        async def anode_function(state: dict[str, Any]) -> dict[str, Any]:
+            """Async node_function (graph.ainvoke/astream)."""
+            prompt_messages = build_prompt(state)
+            if prompt_messages is None:
+                return {"messages": [AIMessage(content=empty_reply)]}
+
+            response = await litellm_model.ainvoke(prompt_messages)
+
+            node_logger.info(completed_message, response_length=len(response.content))
+
+            return {"messages": [response]}
+
+        return RunnableLambda(
+            node_function, afunc=anode_function, name=f"{self.name}_node"
+        )
+
+    def get_node(self) -> Runnable:
+        """Global node instance for this agent (lazy initialization)."""
+        if self._node_instance is None:
+            with self._node_lock:
+                if self._node_instance is None:
+                    self._node_instance = self.create_node()
+        return self._node_instance
+
+    @cached_property
+    def _invoke_model(self) -> Callable[[list[BaseMessage]], Awaitable[AIMessage]]:
+        """Async model call for the tool (micro-batched if VOXY_LLM_MICROBATCH=1)."""
+        return create_model_invoker(self.model, self.name)
+
+    @cached_property
+    def _cache_completions(self) -> bool:
+        """Tool results are only reused when sampling is deterministic."""
+        return self.config.temperature == 0
+
+    def _cached_completion(self, prompt: str) -> str | None:
+        """Unexpired cached response text for prompt, if any."""
+        if not self._cache_completions:
+            return None
+
+        with self._completions_lock:
+            entry = self._completions.get(prompt)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            self._completions.move_to_end(prompt)
+
+        self._tool_logger.debug(f"{self.name} completion cache hit")
+        return entry[1]
+
+    def _store_completion(self, prompt: str, result_text: str) -> None:
+        """Cache a response text, evicting the least recently used entries."""
+        if not self._cache_completions:
+            return
+
+        with self._completions_lock:
+            self._completions[prompt] = (
+                time.monotonic() + _COMPLETION_CACHE_TTL,
+                result_text,
+            )
+            self._completions.move_to_end(prompt)
+            while len(self._completions) > _COMPLETION_CACHE_MAX_SIZE:
+                self._completions.popitem(last=False)
+
+    def complete(self, prompt: str, **log_fields: Any) -> str:
+        """
+        Run this agent's model on a tool prompt (sync tool path).
+
+        With temperature 0, results are cached by prompt for an hour
+        (failures are not cached).
+
+        Args:
+            prompt: User prompt sent after the system instructions
+            **log_fields: Extra fields for the tool log records
+
+        Returns:
+            Response text
+        """
+        cached = self._cached_completion(prompt)
+        if cached is not None:
+            return cached
+
+        self._tool_logger.debug(f"Calling {self.name} model", **log_fields)
+
+        response = self.model.invoke(
+            [self.system_message, HumanMessage(content=prompt)]
+        )
+
+        return self._completion_text(prompt, response, log_fields)
+
+    async def acomplete(self, prompt: str, **log_fields: Any) -> str:
+        """Async complete; concurrent calls may be micro-batched."""
+        cached = self._cached_completion(prompt)
+        if cached is not None:
+            return cached
+
+        self._tool_logger.debug(f"Calling {self.name} model", **log_fields)
+
+        response = await self._invoke_model(
+            [self.system_message, HumanMessage(content=prompt)]
+        )
+
+        return self._completion_text(prompt, response, log_fields)
+
+    def _completion_text(
+        self, prompt: str, response: AIMessage, log_fields: dict[str, Any]
+    ) -> str:
+        """Log a finished tool call, cache it and return the response text."""
+        result_text = response.content
+        self._tool_logger.info(
+            self._completed_message, result_length=len(result_text), **log_fields
+        )
+        self._store_completion(prompt, result_text)
+        return result_text
@@ -21,6 +21,10 @@ from loguru import logger
 from src.shared.config.models_config import load_calculator_config
 from src.voxy.graph_state import VoxyState
 
+_init_logger = logger.bind(event="LANGGRAPH|NODE_INIT")
+_node_logger = logger.bind(event="LANGGRAPH|CALCULATOR_NODE")
+_tool_logger = logger.bind(event="LANGGRAPH|CALCULATOR_TOOL")
+
 
 def _get_calculator_instructions() -> str:
     """Get specialized instructions for calculator."""
@@ -85,7 +89,7 @@ def create_calculator_node() -> Callable:
         max_tokens=config.max_tokens,
     )
 
-    logger.bind(event="LANGGRAPH|NODE_INIT").info(
+    _init_logger.info(
         "Calculator node created",
         model=config.get_litellm_model_path(),
         provider=config.provider,
@@ -115,9 +119,7 @@ def create_calculator_node() -> Callable:
         # Extract latest user message
         messages = state["messages"]
         if not messages:
-            logger.bind(event="LANGGRAPH|CALCULATOR_NODE").warning(
-                "No messages in state"
-            )
+            _node_logger.warning("No messages in state")
             return {"messages": [AIMessage(content="No calculation to perform")]}
 
         # Build prompt with instructions + user message
@@ -125,7 +127,7 @@ def create_calculator_node() -> Callable:
         prompt_messages = [system_message] + messages
 
         # Invoke LiteLLM model
-        logger.bind(event="LANGGRAPH|CALCULATOR_NODE").debug(
+        _node_logger.debug(
             "Invoking calculator model",
             model=config.get_litellm_model_path(),
             message_count=len(prompt_messages),
@@ -133,7 +135,7 @@ def create_calculator_node() -> Callable:
 
         response = litellm_model.invoke(prompt_messages)
 
-        logger.bind(event="LANGGRAPH|CALCULATOR_NODE").info(
+        _node_logger.info(
             "Calculation completed",
             response_length=(
                 len(response.content) if hasattr(response, "content") else 0
@@ -200,7 +202,7 @@ def create_calculator_tool():
         messages_list = [system_message, user_message]
 
         # Invoke model
-        logger.bind(event="LANGGRAPH|CALCULATOR_TOOL").debug(
+        _tool_logger.debug(
             "Calculating expression",
             expression_length=len(expression),
         )
@@ -212,7 +214,7 @@ def create_calculator_tool():
             response.content if hasattr(response, "content") else str(response)
         )
 
-        logger.bind(event="LANGGRAPH|CALCULATOR_TOOL").info(
+        _tool_logger.info(
             "Calculation completed",
             expression_length=len(expression),
             result_length=len(result_text),
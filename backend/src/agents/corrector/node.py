@@ -6,20 +6,19 @@ Migrated to new clean architecture (agents/corrector/).
 
 Architecture:
 - Uses same LiteLLM configuration (load_corrector_config)
+- Node, model and config come from the shared TextAgent (_base/text_agent.py)
 - Maintains 100% feature parity with previous implementation
 - Returns VoxyState-compatible updates
 - Can be used as standalone node or supervisor tool
 """
 
-from typing import Any, Callable
+import inspect
 
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
-from langchain_core.tools import tool
-from langchain_litellm import ChatLiteLLM
-from loguru import logger
+from langchain_core.runnables import Runnable
+from langchain_core.tools import StructuredTool
 
+from src.agents._base import TextAgent
 from src.shared.config.models_config import load_corrector_config
-from src.voxy.graph_state import VoxyState
 
 
 def _get_corrector_instructions() -> str:
@@ -60,7 +59,23 @@ def _get_corrector_instructions() -> str:
     """
 
 
-def create_corrector_node() -> Callable:
+# Config, model and system message are built on first use and shared by
+# the node and the tool
+_corrector_agent = TextAgent(
+    "corrector",
+    load_corrector_config,
+    _get_corrector_instructions(),
+    empty_reply="No text to correct",
+    completed_message="Correction completed",
+)
+
+
+def _correction_prompt(text: str) -> str:
+    """Build the correction prompt sent by the tool."""
+    return f"Correct the following text (spelling and grammar):\n\n{text}"
+
+
+def create_corrector_node() -> Runnable:
     """
     Factory function to create a corrector LangGraph node.
 
@@ -73,83 +88,16 @@ def create_corrector_node() -> Callable:
         >>> corrector_node = create_corrector_node()
         >>> builder.add_node("corrector", corrector_node)
     """
-    # Load configuration once during node creation
-    config = load_corrector_config()
-
-    # Create ChatLiteLLM for LangChain integration
-    litellm_model = ChatLiteLLM(
-        model=config.get_litellm_model_path(),
-        temperature=config.temperature,
-        max_tokens=config.max_tokens,
-    )
-
-    logger.bind(event="LANGGRAPH|NODE_INIT").info(
-        "Corrector node created",
-        model=config.get_litellm_model_path(),
-        provider=config.provider,
-    )
-
-    def corrector_node(state: VoxyState) -> dict[str, Any]:
-        """
-        Corrector LangGraph node function.
-
-        Args:
-            state: Current VoxyState with message history
-
-        Returns:
-            State update dict with corrector response
-
-        Example:
-            >>> state = {
-            ...     "messages": [
-            ...         {"role": "user", "content": "Correct: 'Eu foi na loja'"}
-            ...     ],
-            ...     "context": {"thread_id": "123"}
-            ... }
-            >>> result = corrector_node(state)
-            >>> result["messages"][-1].content
-            'Eu fui à loja'
-        """
-        # Extract latest user message
-        messages = state["messages"]
-        if not messages:
-            logger.bind(event="LANGGRAPH|CORRECTOR_NODE").warning(
-                "No messages in state"
-            )
-            return {"messages": [AIMessage(content="No text to correct")]}
-
-        # Build prompt with instructions + user message
-        system_message = SystemMessage(content=_get_corrector_instructions())
-        prompt_messages = [system_message] + messages
-
-        # Invoke LiteLLM model
-        logger.bind(event="LANGGRAPH|CORRECTOR_NODE").debug(
-            "Invoking corrector model",
-            model=config.get_litellm_model_path(),
-            message_count=len(prompt_messages),
-        )
-
-        response = litellm_model.invoke(prompt_messages)
-
-        logger.bind(event="LANGGRAPH|CORRECTOR_NODE").info(
-            "Correction completed",
-            response_length=(
-                len(response.content) if hasattr(response, "content") else 0
-            ),
-        )
-
-        # Return state update with AI response
-        return {"messages": [response]}
-
-    return corrector_node
+    return _corrector_agent.create_node()
 
 
 def create_corrector_tool():
     """
-    Create a LangChain @tool for supervisor agent to call corrector.
+    Create a LangChain tool for supervisor agent to call corrector.
 
     Returns:
-        Tool instance for create_react_agent tools list
+        StructuredTool (sync func and async coroutine) for create_react_agent
+        tools list
 
     Example:
         >>> from langgraph.prebuilt import create_react_agent
@@ -159,17 +107,7 @@ def create_corrector_tool():
         ...     tools=[corrector_tool],
         ... )
     """
-    # Load configuration once during tool creation
-    config = load_corrector_config()
-
-    # Create ChatLiteLLM for LangChain integration
-    litellm_model = ChatLiteLLM(
-        model=config.get_litellm_model_path(),
-        temperature=config.temperature,
-        max_tokens=config.max_tokens,
-    )
 
-    @tool
     def correct_text(text: str) -> str:
         """
         Correct spelling and grammar errors in text.
@@ -187,50 +125,36 @@ def create_corrector_tool():
             >>> correct_text("Os menino brinca no parque")
             'Os meninos brincam no parque'
         """
-        # Build correction prompt
-        prompt = f"Correct the following text (spelling and grammar):\n\n{text}"
-
-        # Build messages
-        system_message = SystemMessage(content=_get_corrector_instructions())
-        user_message = HumanMessage(content=prompt)
-        messages_list = [system_message, user_message]
-
-        # Invoke model
-        logger.bind(event="LANGGRAPH|CORRECTOR_TOOL").debug(
-            "Correcting text",
-            text_length=len(text),
-        )
-
-        response = litellm_model.invoke(messages_list)
-
-        # Extract content from AIMessage
-        result_text = (
-            response.content if hasattr(response, "content") else str(response)
-        )
+        if not text.strip():
+            return text
 
-        logger.bind(event="LANGGRAPH|CORRECTOR_TOOL").info(
-            "Correction completed",
-            text_length=len(text),
-            result_length=len(result_text),
+        return _corrector_agent.complete(
+            _correction_prompt(text), text_length=len(text)
         )
 
-        return result_text
-
-    return correct_text
+    async def acorrect_text(text: str) -> str:
+        """Async correct_text (graph.ainvoke/astream)."""
+        if not text.strip():
+            return text
 
+        # Concurrent calls may be micro-batched (VOXY_LLM_MICROBATCH=1)
+        return await _corrector_agent.acomplete(
+            _correction_prompt(text), text_length=len(text)
+        )
 
-# Global node instance (lazy initialization pattern)
-_corrector_node_instance = None
+    return StructuredTool.from_function(
+        func=correct_text,
+        coroutine=acorrect_text,
+        name="correct_text",
+        description=inspect.getdoc(correct_text),
+    )
 
 
-def get_corrector_node() -> Callable:
+def get_corrector_node() -> Runnable:
     """
     Get the global corrector node instance using lazy initialization.
 
     Returns:
         Corrector node function
     """
-    global _corrector_node_instance
-    if _corrector_node_instance is None:
-        _corrector_node_instance = create_corrector_node()
-    return _corrector_node_instance
+    return _corrector_agent.get_node()
@@ -6,20 +6,19 @@ Migrated to new clean architecture (agents/translator/).
 
 Architecture:
 - Uses same LiteLLM configuration (load_translator_config)
+- Node, model and config come from the shared TextAgent (_base/text_agent.py)
 - Maintains 100% feature parity with previous implementation
 - Returns VoxyState-compatible updates
 - Can be used as standalone node or supervisor tool
 """
 
-from typing import Any, Callable
+import inspect
 
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
-from langchain_core.tools import tool
-from langchain_litellm import ChatLiteLLM
-from loguru import logger
+from langchain_core.runnables import Runnable
+from langchain_core.tools import StructuredTool
 
+from src.agents._base import TextAgent
 from src.shared.config.models_config import load_translator_config
-from src.voxy.graph_state import VoxyState
 
 
 def _get_translator_instructions() -> str:
@@ -55,7 +54,25 @@ def _get_translator_instructions() -> str:
     """
 
 
-def create_translator_node() -> Callable:
+# Config, model and system message are built on first use and shared by
+# the node and the tool
+_translator_agent = TextAgent(
+    "translator",
+    load_translator_config,
+    _get_translator_instructions(),
+    empty_reply="No message to translate",
+    completed_message="Translation completed",
+)
+
+
+def _translation_prompt(text: str, target_language: str, source_language: str) -> str:
+    """Build the translation prompt sent by the tool."""
+    if source_language == "auto":
+        return f"Translate the following text to {target_language}:\n\n{text}"
+    return f"Translate the following text from {source_language} to {target_language}:\n\n{text}"
+
+
+def create_translator_node() -> Runnable:
     """
     Factory function to create a translator LangGraph node.
 
@@ -68,83 +85,16 @@ def create_translator_node() -> Callable:
         >>> translator_node = create_translator_node()
         >>> builder.add_node("translator", translator_node)
     """
-    # Load configuration once during node creation
-    config = load_translator_config()
-
-    # Create ChatLiteLLM for LangChain integration
-    litellm_model = ChatLiteLLM(
-        model=config.get_litellm_model_path(),
-        temperature=config.temperature,
-        max_tokens=config.max_tokens,
-    )
-
-    logger.bind(event="LANGGRAPH|NODE_INIT").info(
-        "Translator node created",
-        model=config.get_litellm_model_path(),
-        provider=config.provider,
-    )
-
-    def translator_node(state: VoxyState) -> dict[str, Any]:
-        """
-        Translator LangGraph node function.
-
-        Args:
-            state: Current VoxyState with message history
-
-        Returns:
-            State update dict with translator response
-
-        Example:
-            >>> state = {
-            ...     "messages": [
-            ...         {"role": "user", "content": "Translate 'Hello' to French"}
-            ...     ],
-            ...     "context": {"thread_id": "123"}
-            ... }
-            >>> result = translator_node(state)
-            >>> result["messages"][-1].content
-            'Bonjour'
-        """
-        # Extract latest user message
-        messages = state["messages"]
-        if not messages:
-            logger.bind(event="LANGGRAPH|TRANSLATOR_NODE").warning(
-                "No messages in state"
-            )
-            return {"messages": [AIMessage(content="No message to translate")]}
-
-        # Build prompt with instructions + user message
-        system_message = SystemMessage(content=_get_translator_instructions())
-        prompt_messages = [system_message] + messages
-
-        # Invoke LiteLLM model
-        logger.bind(event="LANGGRAPH|TRANSLATOR_NODE").debug(
-            "Invoking translator model",
-            model=config.get_litellm_model_path(),
-            message_count=len(prompt_messages),
-        )
-
-        response = litellm_model.invoke(prompt_messages)
-
-        logger.bind(event="LANGGRAPH|TRANSLATOR_NODE").info(
-            "Translation completed",
-            response_length=(
-                len(response.content) if hasattr(response, "content") else 0
-            ),
-        )
-
-        # Return state update with AI response
-        return {"messages": [response]}
-
-    return translator_node
+    return _translator_agent.create_node()
 
 
 def create_translator_tool():
     """
-    Create a LangChain @tool for supervisor agent to call translator.
+    Create a LangChain tool for supervisor agent to call translator.
 
     Returns:
-        Tool instance for create_react_agent tools list
+        StructuredTool (sync func and async coroutine) for create_react_agent
+        tools list
 
     Example:
         >>> from langgraph.prebuilt import create_react_agent
@@ -154,17 +104,7 @@ def create_translator_tool():
         ...     tools=[translator_tool],
         ... )
     """
-    # Load configuration once during tool creation
-    config = load_translator_config()
-
-    # Create ChatLiteLLM for LangChain integration
-    litellm_model = ChatLiteLLM(
-        model=config.get_litellm_model_path(),
-        temperature=config.temperature,
-        max_tokens=config.max_tokens,
-    )
 
-    @tool
     def translate_text(
         text: str, target_language: str, source_language: str = "auto"
     ) -> str:
@@ -186,55 +126,42 @@ def create_translator_tool():
             >>> translate_text("Bom dia", "English")
             'Good morning'
         """
-        # Build translation prompt
-        if source_language == "auto":
-            prompt = f"Translate the following text to {target_language}:\n\n{text}"
-        else:
-            prompt = f"Translate the following text from {source_language} to {target_language}:\n\n{text}"
-
-        # Build messages
-        system_message = SystemMessage(content=_get_translator_instructions())
-        user_message = HumanMessage(content=prompt)
-        messages_list = [system_message, user_message]
-
-        # Invoke model
-        logger.bind(event="LANGGRAPH|TRANSLATOR_TOOL").debug(
-            "Translating text",
+        if not text.strip():
+            return text
+
+        return _translator_agent.complete(
+            _translation_prompt(text, target_language, source_language),
             text_length=len(text),
             target_language=target_language,
         )
 
-        response = litellm_model.invoke(messages_list)
-
-        # Extract content from AIMessage
-        result_text = (
-            response.content if hasattr(response, "content") else str(response)
-        )
+    async def atranslate_text(
+        text: str, target_language: str, source_language: str = "auto"
+    ) -> str:
+        """Async translate_text (graph.ainvoke/astream)."""
+        if not text.strip():
+            return text
 
-        logger.bind(event="LANGGRAPH|TRANSLATOR_TOOL").info(
-            "Translation completed",
+        # Concurrent calls may be micro-batched (VOXY_LLM_MICROBATCH=1)
+        return await _translator_agent.acomplete(
+            _translation_prompt(text, target_language, source_language),
             text_length=len(text),
-            result_length=len(result_text),
             target_language=target_language,
         )
 
-        return result_text
-
-    return translate_text
-
-
-# Global node instance (lazy initialization pattern)
-_translator_node_instance = None
+    return StructuredTool.from_function(
+        func=translate_text,
+        coroutine=atranslate_text,
+        name="translate_text",
+        description=inspect.getdoc(translate_text),
+    )
 
 
-def get_translator_node() -> Callable:
+def get_translator_node() -> Runnable:
     """
     Get the global translator node instance using lazy initialization.
 
     Returns:
         Translator node function
     """
-    global _translator_node_instance
-    if _translator_node_instance is None:
-        _translator_node_instance = create_translator_node()
-    return _translator_node_instance
+    return _translator_agent.get_node()
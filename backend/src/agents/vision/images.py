@@ -0,0 +1,200 @@
+"""
+Vision image preparation.
+
+Images sent inline as base64 data URIs are downscaled when larger than the
+configured edge (fewer bytes on the wire, fewer image tokens billed).
+Remote URLs are passed through unchanged: the provider fetches them, the
+backend never downloads user-supplied URLs.
+"""
+
+import asyncio
+import base64
+import binascii
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+
+from loguru import logger
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+_image_logger = logger.bind(event="LANGGRAPH|VISION_IMAGE")
+
+# Prepared data URIs by (digest of the original URI, max edge, JPEG quality)
+# (LRU, bounded by entries and total size)
+_DATA_URI_CACHE: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+_DATA_URI_CACHE_MAX_ENTRIES = 128
+_DATA_URI_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_data_uri_cache_bytes = 0
+_data_uri_cache_lock = threading.Lock()
+
+# Inline images above these limits are sent unchanged instead of decoded:
+# encoded size is checked before base64 decoding, pixel count from the
+# image header before any pixel data is decompressed
+_MAX_INLINE_IMAGE_BYTES = 20 * 1024 * 1024
+_MAX_IMAGE_PIXELS = 50_000_000
+
+# Queries that need legible fine detail keep the original resolution
+_FULL_RESOLUTION_KEYWORDS = (
+    "ocr",
+    "extract text",
+    "extract the text",
+    "read the text",
+    "transcribe",
+    "extraia o texto",
+    "extrair o texto",
+    "extraia texto",
+    "leia o texto",
+    "transcreva",
+)
+
+
+def needs_full_resolution(query: str) -> bool:
+    """True if the query asks for text extraction (OCR-like tasks)."""
+    query_lower = query.lower()
+    return any(keyword in query_lower for keyword in _FULL_RESOLUTION_KEYWORDS)
+
+
+def _cache_get(key: tuple[str, int, int]) -> str | None:
+    """Return the cached data URI for key, marking it recently used."""
+    with _data_uri_cache_lock:
+        data_uri = _DATA_URI_CACHE.get(key)
+        if data_uri is not None:
+            _DATA_URI_CACHE.move_to_end(key)
+        return data_uri
+
+
+def _cache_put(key: tuple[str, int, int], data_uri: str) -> None:
+    """Store a data URI, evicting least recently used entries over the limits."""
+    global _data_uri_cache_bytes
+
+    if len(data_uri) > _DATA_URI_CACHE_MAX_BYTES:
+        return
+
+    with _data_uri_cache_lock:
+        previous = _DATA_URI_CACHE.pop(key, None)
+        if previous is not None:
+            _data_uri_cache_bytes -= len(previous)
+
+        _DATA_URI_CACHE[key] = data_uri
+        _data_uri_cache_bytes += len(data_uri)
+
+        while (
+            len(_DATA_URI_CACHE) > _DATA_URI_CACHE_MAX_ENTRIES
+            or _data_uri_cache_bytes > _DATA_URI_CACHE_MAX_BYTES
+        ):
+            _, evicted = _DATA_URI_CACHE.popitem(last=False)
+            _data_uri_cache_bytes -= len(evicted)
+
+
+def _downscale(
+    data: bytes, mime_type: str, max_edge: int, jpeg_quality: int
+) -> tuple[bytes, str]:
+    """
+    Shrink the image so its longest edge is at most max_edge.
+
+    Images already within the limit, animated images, images over
+    _MAX_IMAGE_PIXELS (decompression bombs) and undecodable data are
+    returned unchanged. Images with transparency stay PNG; everything
+    else is recompressed as JPEG, with the EXIF orientation applied.
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            width, height = image.size
+            if width * height > _MAX_IMAGE_PIXELS:
+                _image_logger.warning(
+                    "Image not downscaled: too many pixels", width=width, height=height
+                )
+                return data, mime_type
+            if max(image.size) <= max_edge or getattr(image, "is_animated", False):
+                return data, mime_type
+
+            has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+            # Re-encoding drops EXIF, so apply the orientation to the pixels
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+
+            buffer = io.BytesIO()
+            if has_alpha:
+                image.save(buffer, "PNG", optimize=True)
+                resized_mime = "image/png"
+            else:
+                image.convert("RGB").save(
+                    buffer, "JPEG", quality=jpeg_quality, optimize=True
+                )
+                resized_mime = "image/jpeg"
+    except (Image.DecompressionBombError, UnidentifiedImageError, OSError) as e:
+        _image_logger.debug(f"Image not downscaled: {e}")
+        return data, mime_type
+
+    resized = buffer.getvalue()
+    if len(resized) >= len(data):
+        return data, mime_type
+    return resized, resized_mime
+
+
+def prepare_image_url(
+    image_url: str, max_edge: int | None = None, jpeg_quality: int = 85
+) -> str:
+    """
+    Return the image URL to send to the vision model.
+
+    Base64 data URIs are downscaled so their longest edge is at most
+    max_edge; remote URLs, data URIs over _MAX_INLINE_IMAGE_BYTES and
+    undecodable data URIs are returned unchanged.
+
+    Args:
+        image_url: Remote image URL (https://...) or data URI
+        max_edge: Downscale so the longest edge is at most this many pixels
+            (None keeps the original resolution)
+        jpeg_quality: JPEG quality used when a downscaled image is recompressed
+
+    Returns:
+        data:<mime>;base64,<payload> URI, or image_url unchanged
+    """
+    if not max_edge or not image_url.startswith("data:"):
+        return image_url
+
+    header, _, payload = image_url.partition(",")
+    if not header.endswith(";base64"):
+        return image_url
+    if len(payload) * 3 // 4 > _MAX_INLINE_IMAGE_BYTES:
+        _image_logger.debug("Image not downscaled: payload over size limit")
+        return image_url
+
+    digest = hashlib.blake2b(image_url.encode("ascii", "replace"), digest_size=16)
+    cache_key = (digest.hexdigest(), max_edge, jpeg_quality)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        data = base64.b64decode(payload, validate=True)
+    except (binascii.Error, ValueError):
+        return image_url
+
+    mime_type = header[len("data:") : -len(";base64")] or "image/jpeg"
+    resized, resized_mime = _downscale(data, mime_type, max_edge, jpeg_quality)
+    if resized is data:
+        data_uri = image_url
+    else:
+        _image_logger.debug(
+            "Image downscaled",
+            original_bytes=len(data),
+            resized_bytes=len(resized),
+            max_edge=max_edge,
+        )
+        encoded = base64.b64encode(resized).decode("ascii")
+        data_uri = f"data:{resized_mime};base64,{encoded}"
+
+    _cache_put(cache_key, data_uri)
+    return data_uri
+
+
+async def aprepare_image_url(
+    image_url: str, max_edge: int | None = None, jpeg_quality: int = 85
+) -> str:
+    """Async prepare_image_url: decoding and resizing run in a worker thread."""
+    if not max_edge or not image_url.startswith("data:"):
+        return image_url
+    return await asyncio.to_thread(prepare_image_url, image_url, max_edge, jpeg_quality)
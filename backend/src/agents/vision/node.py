@@ -12,16 +12,26 @@ Architecture:
 - Supports reasoning-capable models (GPT-5, Claude thinking)
 """
 
-from typing import Any, Callable
+import inspect
+from functools import lru_cache
+from typing import Any
 
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
-from langchain_core.tools import tool
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable, RunnableLambda
+from langchain_core.tools import StructuredTool
 from langchain_litellm import ChatLiteLLM
 from loguru import logger
 
-from src.shared.config.models_config import load_vision_config
+from src.agents._base import cacheable_system_message
+from src.shared.config.models_config import VisionModelConfig, load_vision_config
 from src.voxy.graph_state import VoxyState
 
+from .images import aprepare_image_url, needs_full_resolution, prepare_image_url
+
+_init_logger = logger.bind(event="LANGGRAPH|NODE_INIT")
+_node_logger = logger.bind(event="LANGGRAPH|VISION_NODE")
+_tool_logger = logger.bind(event="LANGGRAPH|VISION_TOOL")
+
 
 def _get_vision_instructions() -> str:
     """Get specialized instructions for image analysis."""
@@ -64,15 +74,23 @@ def _get_vision_instructions() -> str:
     """
 
 
-def create_vision_node() -> Callable:
-    """
-    Factory function to create a vision LangGraph node.
+# Used when the user sends an image with an empty/whitespace-only question
+_DEFAULT_QUERY = "Describe this image"
 
-    Returns:
-        Node function compatible with StateGraph.add_node()
-    """
-    # Load configuration once during node creation
-    config = load_vision_config()
+# Built once at import and shared by the node and the tool
+_VISION_SYSTEM_MESSAGE = SystemMessage(content=_get_vision_instructions())
+
+
+@lru_cache(maxsize=1)
+def _get_vision_config() -> VisionModelConfig:
+    """Load the vision configuration once (node and tool share it)."""
+    return load_vision_config()
+
+
+@lru_cache(maxsize=1)
+def _get_vision_model() -> ChatLiteLLM:
+    """ChatLiteLLM shared by the vision node and tool."""
+    config = _get_vision_config()
 
     # Create ChatLiteLLM for LangChain integration
     # Model-agnostic configuration: all limits come from .env
@@ -93,44 +111,75 @@ def create_vision_node() -> Callable:
                 "reasoning": {"max_tokens": config.reasoning_max_tokens}
             }
 
-    litellm_model = ChatLiteLLM(**litellm_kwargs)  # type: ignore[arg-type]
+    return ChatLiteLLM(**litellm_kwargs)  # type: ignore[arg-type]
+
+
+@lru_cache(maxsize=1)
+def _get_vision_system_message() -> SystemMessage:
+    """System instructions, tagged for prompt caching if the provider needs it."""
+    return cacheable_system_message(_VISION_SYSTEM_MESSAGE, _get_vision_config())
+
+
+def _image_options(query: str) -> tuple[int | None, int]:
+    """
+    (max_edge, jpeg_quality) used to downscale inline (data URI) images.
+
+    OCR-like queries keep the original resolution for legibility. Remote
+    URLs are sent unchanged for the provider to fetch.
+    """
+    config = _get_vision_config()
+    max_edge = None if needs_full_resolution(query) else config.image_max_edge
+    return max_edge, config.image_jpeg_quality
+
+
+def _multimodal_message(query: str, image_url: str) -> HumanMessage:
+    """User message with the query text and the image (LangChain format)."""
+    # Reference: https://python.langchain.com/docs/how_to/multimodal_inputs/
+    return HumanMessage(
+        content=[
+            {"type": "text", "text": query},
+            {"type": "image_url", "image_url": {"url": image_url}},
+        ]
+    )
+
+
+def create_vision_node() -> Runnable:
+    """
+    Factory function to create a vision LangGraph node.
+
+    The node runs natively on both graph paths: model.invoke under
+    graph.invoke, model.ainvoke under graph.ainvoke/astream.
 
-    logger.bind(event="LANGGRAPH|NODE_INIT").info(
+    Returns:
+        Runnable node compatible with StateGraph.add_node()
+    """
+    # Shared config and model (built once per process)
+    config = _get_vision_config()
+    litellm_model = _get_vision_model()
+    system_message = _get_vision_system_message()
+
+    _init_logger.info(
         "Vision node created",
         model=config.get_litellm_model_path(),
         provider=config.provider,
         max_tokens=config.max_tokens if config.max_tokens else "unlimited",
     )
 
-    def vision_node(state: VoxyState) -> dict[str, Any]:
-        """
-        Vision LangGraph node function with multimodal support.
-
-        Args:
-            state: Current VoxyState with message history and context (image_url)
-
-        Returns:
-            State update dict with vision analysis response
-        """
+    def read_request(state: VoxyState) -> tuple[str, str] | AIMessage:
+        """(query, image_url) from the state, or the reply when one is missing."""
         # Extract latest user message and image_url
         messages = state["messages"]
         image_url = state.get("context", {}).get("image_url")
 
         if not messages:
-            logger.bind(event="LANGGRAPH|VISION_NODE").warning("No messages in state")
-            return {"messages": [AIMessage(content="No query to analyze")]}
+            _node_logger.warning("No messages in state")
+            return AIMessage(content="No query to analyze")
 
         if not image_url:
-            logger.bind(event="LANGGRAPH|VISION_NODE").warning(
-                "No image_url in context"
+            _node_logger.warning("No image_url in context")
+            return AIMessage(
+                content="No image provided for analysis. Please include an image URL."
             )
-            return {
-                "messages": [
-                    AIMessage(
-                        content="No image provided for analysis. Please include an image URL."
-                    )
-                ]
-            }
 
         # Get user query
         last_message = messages[-1]
@@ -144,44 +193,36 @@ def create_vision_node() -> Callable:
         # Ensure query is string (handle list case)
         if isinstance(query, list):
             query = " ".join(str(item) for item in query)
+        if not query.strip():
+            query = _DEFAULT_QUERY
 
-        # Build multimodal message (LangChain format)
-        # Reference: https://python.langchain.com/docs/how_to/multimodal_inputs/
-        system_message = SystemMessage(content=_get_vision_instructions())
-
-        # Create multimodal user message with text and image
-        multimodal_message = HumanMessage(
-            content=[
-                {"type": "text", "text": query},
-                {"type": "image_url", "image_url": {"url": image_url}},
-            ]
-        )
-
-        prompt_messages = [system_message, multimodal_message]
+        return query, image_url
 
-        # Invoke LiteLLM model
-        logger.bind(event="LANGGRAPH|VISION_NODE").debug(
+    def build_prompt(query: str, image_url: str) -> list[BaseMessage]:
+        """System message + multimodal user message."""
+        _node_logger.debug(
             "Invoking vision model (multimodal)",
             model=config.get_litellm_model_path(),
             image_url_length=len(image_url),
             query_length=len(query),
         )
+        return [system_message, _multimodal_message(query, image_url)]
 
-        response = litellm_model.invoke(prompt_messages)
-
+    def finish(response: AIMessage) -> dict[str, Any]:
+        """Log response metadata and build the state update."""
         # Log response metadata for debugging (especially for reasoning models like GPT-5)
         if hasattr(response, "response_metadata"):
             metadata = response.response_metadata
             finish_reason = metadata.get("finish_reason", "unknown")
 
-            logger.bind(event="LANGGRAPH|VISION_NODE").info(
+            _node_logger.info(
                 f"Vision response: finish_reason={finish_reason}, "
                 f"content_length={len(response.content) if hasattr(response, 'content') else 0}"
             )
 
             # Warn if response was truncated due to token limit
             if finish_reason == "length":
-                logger.bind(event="LANGGRAPH|VISION_NODE").warning(
+                _node_logger.warning(
                     "⚠️  Vision response truncated due to max_tokens limit! "
                     "Set VISION_MAX_TOKENS to higher value or remove limit entirely."
                 )
@@ -189,15 +230,48 @@ def create_vision_node() -> Callable:
         # Return state update with AI response
         return {"messages": [response]}
 
-    return vision_node
+    def vision_node(state: VoxyState) -> dict[str, Any]:
+        """
+        Vision LangGraph node function with multimodal support.
+
+        Args:
+            state: Current VoxyState with message history and context (image_url)
+
+        Returns:
+            State update dict with vision analysis response
+        """
+        request = read_request(state)
+        if isinstance(request, AIMessage):
+            return {"messages": [request]}
+
+        query, image_url = request
+        image_url = prepare_image_url(image_url, *_image_options(query))
+
+        response = litellm_model.invoke(build_prompt(query, image_url))
+        return finish(response)
+
+    async def avision_node(state: VoxyState) -> dict[str, Any]:
+        """Async vision_node (graph.ainvoke/astream)."""
+        request = read_request(state)
+        if isinstance(request, AIMessage):
+            return {"messages": [request]}
+
+        query, image_url = request
+        image_url = await aprepare_image_url(image_url, *_image_options(query))
+
+        response = await litellm_model.ainvoke(build_prompt(query, image_url))
+        return finish(response)
+
+    return RunnableLambda(vision_node, afunc=avision_node, name="vision_node")
 
 
 def create_vision_tool():
     """
-    Create a LangChain @tool for supervisor agent to call vision analysis.
+    Create a LangChain tool for supervisor agent to call vision analysis.
 
     Returns:
-        Tool instance for create_react_agent tools list
+        StructuredTool (sync func and async coroutine) for create_react_agent
+        tools list
 
     Example:
         >>> from langgraph.prebuilt import create_react_agent
@@ -207,34 +281,46 @@ def create_vision_tool():
         ...     tools=[vision_tool],
         ... )
     """
-    # Load configuration once during tool creation
-    config = load_vision_config()
+    # Shared model (built once per process)
+    litellm_model = _get_vision_model()
+    system_message = _get_vision_system_message()
 
-    # Create ChatLiteLLM for LangChain integration
-    # Model-agnostic configuration: all limits come from .env
-    litellm_kwargs: dict[str, Any] = {
-        "model": config.get_litellm_model_path(),
-        "temperature": config.temperature,
-    }
-
-    # Add max_tokens only if configured in .env
-    if config.max_tokens is not None:
-        litellm_kwargs["max_tokens"] = config.max_tokens
+    def build_prompt(image_url: str, query: str) -> list[BaseMessage]:
+        """System message + multimodal user message."""
+        _tool_logger.debug(
+            "Analyzing image",
+            image_url_length=len(image_url),
+            query_length=len(query),
+        )
+        return [system_message, _multimodal_message(query, image_url)]
+
+    def result_text(response: AIMessage) -> str:
+        """Text of the model reply (str, or list of multimodal blocks)."""
+        content = response.content
+        if isinstance(content, str):
+            analysis_result = content
+        elif isinstance(content, list):
+            analysis_result = " ".join(
+                (
+                    block["text"]
+                    if isinstance(block, dict) and "text" in block
+                    else str(block)
+                )
+                for block in content
+            )
+        else:
+            analysis_result = str(content)
 
-    # For OpenRouter provider: configure reasoning tokens if specified
-    if config.provider == "openrouter" and hasattr(config, "reasoning_max_tokens"):
-        if config.reasoning_max_tokens is not None:
-            litellm_kwargs["extra_body"] = {
-                "reasoning": {"max_tokens": config.reasoning_max_tokens}
-            }
+        # Lazy: the preview slice is only built when INFO is enabled
+        _tool_logger.opt(lazy=True).info(
+            "🔍 Vision tool result: type=str, length={length}, preview={preview}...",
+            length=lambda: len(analysis_result),
+            preview=lambda: analysis_result[:200],
+        )
 
-    litellm_model = ChatLiteLLM(**litellm_kwargs)  # type: ignore[arg-type]
+        return analysis_result
 
-    @tool
-    def analyze_image(
-        image_url: str,
-        query: str = "Analyze this image",
-    ) -> str:
+    def analyze_image(image_url: str, query: str = "Analyze this image") -> str:
         """
         Analyze an image using multimodal vision AI with detailed descriptions.
 
@@ -252,70 +338,37 @@ def create_vision_tool():
             >>> analyze_image("https://example.com/document.jpg", "Extract the text")
             'Text extracted:\n1. ...\n2. ...'
         """
-        logger.bind(event="LANGGRAPH|VISION_TOOL").debug(
-            "Analyzing image",
-            image_url_length=len(image_url),
-            query_length=len(query),
-        )
+        if not query.strip():
+            query = _DEFAULT_QUERY
 
-        # Build multimodal message
-        system_message = SystemMessage(content=_get_vision_instructions())
+        image_url = prepare_image_url(image_url, *_image_options(query))
 
-        multimodal_message = HumanMessage(
-            content=[
-                {"type": "text", "text": query},
-                {"type": "image_url", "image_url": {"url": image_url}},
-            ]
-        )
+        response = litellm_model.invoke(build_prompt(image_url, query))
+        return result_text(response)
 
-        messages_list = [system_message, multimodal_message]
-
-        # Invoke model
-        response = litellm_model.invoke(messages_list)
-
-        # Extract content from AIMessage with robust handling
-        if hasattr(response, "content"):
-            content = response.content
-
-            # Handle list content (multimodal blocks)
-            if isinstance(content, list):
-                text_parts = []
-                for block in content:
-                    if isinstance(block, dict) and "text" in block:
-                        text_parts.append(block["text"])
-                    elif isinstance(block, str):
-                        text_parts.append(block)
-                    else:
-                        text_parts.append(str(block))
-                analysis_result = " ".join(text_parts)
-
-            # Handle string content (normal case)
-            elif isinstance(content, str):
-                analysis_result = content
-
-            # Fallback
-            else:
-                analysis_result = str(content)
-        else:
-            analysis_result = str(response)
+    async def aanalyze_image(image_url: str, query: str = "Analyze this image") -> str:
+        """Async analyze_image (graph.ainvoke/astream)."""
+        if not query.strip():
+            query = _DEFAULT_QUERY
 
-        logger.bind(event="LANGGRAPH|VISION_TOOL").info(
-            f"🔍 Vision tool result: "
-            f"type={type(analysis_result).__name__}, "
-            f"length={len(analysis_result)}, "
-            f"preview={analysis_result[:200]}..."
-        )
+        image_url = await aprepare_image_url(image_url, *_image_options(query))
 
-        return analysis_result
+        response = await litellm_model.ainvoke(build_prompt(image_url, query))
+        return result_text(response)
 
-    return analyze_image
+    return StructuredTool.from_function(
+        func=analyze_image,
+        coroutine=aanalyze_image,
+        name="analyze_image",
+        description=inspect.getdoc(analyze_image),
+    )
 
 
 # Global node instance (lazy initialization pattern)
 _vision_node_instance = None
 
 
-def get_vision_node() -> Callable:
+def get_vision_node() -> Runnable:
     """
     Get the global vision node instance using lazy initialization.
 
@@ -8,11 +8,18 @@ Public API:
     - create_weather_node(): Factory for LangGraph node
     - create_weather_tool(): Tool for supervisor agent
     - get_weather_node(): Lazy-initialized global instance
+    - close_weather_client(): Close the shared HTTP client (shutdown)
 """
 
-from .node import create_weather_node, create_weather_tool, get_weather_node
+from .node import (
+    close_weather_client,
+    create_weather_node,
+    create_weather_tool,
+    get_weather_node,
+)
 
 __all__ = [
+    "close_weather_client",
     "create_weather_node",
     "create_weather_tool",
     "get_weather_node",
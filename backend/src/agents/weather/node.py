@@ -12,18 +12,85 @@ Architecture:
 - Can be used as standalone node or supervisor tool
 """
 
+import asyncio
+import atexit
+import inspect
 import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any, Callable
 
 import httpx
 from langchain_core.messages import AIMessage, SystemMessage
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
 from langchain_litellm import ChatLiteLLM
 from loguru import logger
 
+from src.agents._base import cacheable_system_message
 from src.shared.config.models_config import load_weather_config
 from src.voxy.graph_state import VoxyState
 
+_init_logger = logger.bind(event="LANGGRAPH|NODE_INIT")
+_node_logger = logger.bind(event="LANGGRAPH|WEATHER_NODE")
+_tool_logger = logger.bind(event="LANGGRAPH|WEATHER_TOOL")
+
+# Shared OpenWeatherMap clients: keep-alive pooling instead of a new
+# connection per lookup. The sync one serves graph.invoke (tool.func); async
+# ones (tool.coroutine) are kept per event loop, since pooled connections
+# belong to the loop that opened them.
+_WEATHER_BASE_URL = "http://api.openweathermap.org"
+_WEATHER_TIMEOUT = httpx.Timeout(5.0, connect=2.0)
+_WEATHER_LIMITS = httpx.Limits(
+    max_keepalive_connections=20, max_connections=100, keepalive_expiry=300
+)
+
+_HTTP_CLIENT = httpx.Client(
+    base_url=_WEATHER_BASE_URL, timeout=_WEATHER_TIMEOUT, limits=_WEATHER_LIMITS
+)
+atexit.register(_HTTP_CLIENT.close)
+
+# Entries go away with their loop
+_ASYNC_CLIENTS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+_async_clients_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class _WeatherReading:
+    """Current conditions parsed from an OpenWeatherMap response."""
+
+    temp: float
+    feels_like: float
+    humidity: int
+    description: str
+    wind_speed: float
+
+    @classmethod
+    def from_response(cls, data: dict[str, Any]) -> "_WeatherReading":
+        """Parse a /data/2.5/weather JSON body."""
+        return cls(
+            temp=data["main"]["temp"],
+            feels_like=data["main"]["feels_like"],
+            humidity=data["main"]["humidity"],
+            description=data["weather"][0]["description"],
+            wind_speed=data["wind"]["speed"],
+        )
+
+
+# Parsed readings by (city, country) (LRU + TTL; weather changes slowly).
+# Replies are formatted per call: the key is case-insensitive, the reply
+# names the city as the caller wrote it.
+_WEATHER_CACHE: OrderedDict[tuple[str, str], tuple[float, _WeatherReading]] = (
+    OrderedDict()
+)
+_WEATHER_CACHE_MAX_ENTRIES = 1024
+_WEATHER_TTL = 300
+_weather_cache_lock = threading.Lock()
+
 
 def _get_weather_instructions() -> str:
     """Get specialized instructions for weather information."""
@@ -65,7 +132,105 @@ def _get_weather_instructions() -> str:
     """
 
 
-def _get_weather_api(city: str, country: str = "BR") -> str:
+# Built once at import
+_WEATHER_SYSTEM_MESSAGE = SystemMessage(content=_get_weather_instructions())
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Shared AsyncClient for the running event loop (lazy initialization)."""
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        client = _ASYNC_CLIENTS.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=_WEATHER_BASE_URL,
+                timeout=_WEATHER_TIMEOUT,
+                limits=_WEATHER_LIMITS,
+            )
+            _ASYNC_CLIENTS[loop] = client
+    return client
+
+
+async def close_weather_client() -> None:
+    """Close the running loop's shared AsyncClient (FastAPI shutdown)."""
+    with _async_clients_lock:
+        client = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _weather_cache_key(city: str, country: str) -> tuple[str, str]:
+    """Case-insensitive cache key ("são paulo", "BR")."""
+    return city.strip().lower(), country.strip().upper()
+
+
+def _cache_get(key: tuple[str, str]) -> _WeatherReading | None:
+    """Return the cached reading for key if still fresh, marking it recently used."""
+    with _weather_cache_lock:
+        entry = _WEATHER_CACHE.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= _WEATHER_TTL:
+            del _WEATHER_CACHE[key]
+            return None
+        _WEATHER_CACHE.move_to_end(key)
+        return entry[1]
+
+
+def _cache_put(key: tuple[str, str], reading: _WeatherReading) -> None:
+    """Store a reading, evicting the least recently used entry over the limit."""
+    with _weather_cache_lock:
+        _WEATHER_CACHE[key] = (time.monotonic(), reading)
+        _WEATHER_CACHE.move_to_end(key)
+        if len(_WEATHER_CACHE) > _WEATHER_CACHE_MAX_ENTRIES:
+            _WEATHER_CACHE.popitem(last=False)
+
+
+def _weather_params(city: str, country: str, api_key: str) -> dict[str, str]:
+    """OpenWeatherMap query parameters (params= handles percent-encoding)."""
+    return {
+        "q": f"{city},{country}",
+        "appid": api_key,
+        "units": "metric",
+        "lang": "pt",
+    }
+
+
+def _format_weather(city: str, reading: _WeatherReading) -> str:
+    """Format a reading as the tool's reply, named as the caller wrote the city."""
+    return f"🌤️ {city}: {reading.temp}°C ({reading.description}), sensação térmica {reading.feels_like}°C, umidade {reading.humidity}%, vento {reading.wind_speed}m/s"
+
+
+def _lookup_params(city: str, country: str) -> str | dict[str, str]:
+    """Reply that needs no HTTP call (no API key, cache hit), else query params."""
+    api_key = os.getenv("OPENWEATHER_API_KEY")
+    if not api_key:
+        return f"⚠️ API de clima não configurada para {city}"
+
+    cached = _cache_get(_weather_cache_key(city, country))
+    if cached is not None:
+        return _format_weather(city, cached)
+
+    return _weather_params(city, country, api_key)
+
+
+def _lookup_reply(city: str, country: str, response: httpx.Response) -> str:
+    """Format an OpenWeatherMap response, caching successful lookups."""
+    if response.status_code != 200:
+        return f"❌ Não foi possível obter o clima para {city}"
+
+    reading = _WeatherReading.from_response(response.json())
+    _cache_put(_weather_cache_key(city, country), reading)
+    return _format_weather(city, reading)
+
+
+def _lookup_error(e: Exception) -> str:
+    """Log a failed lookup and build the tool's error reply."""
+    logger.error(f"Weather API error: {e}")
+    return f"⚠️ Erro ao consultar clima: {str(e)}"
+
+
+async def _get_weather_api(city: str, country: str = "BR") -> str:
     """
     Get weather information from OpenWeatherMap API.
 
@@ -76,41 +241,39 @@ def _get_weather_api(city: str, country: str = "BR") -> str:
     Returns:
         Weather information as formatted string
     """
-    api_key = os.getenv("OPENWEATHER_API_KEY")
-    if not api_key:
-        return f"⚠️ API de clima não configurada para {city}"
+    params = _lookup_params(city, country)
+    if isinstance(params, str):
+        return params
 
     try:
-        # OpenWeatherMap API call
-        url = f"http://api.openweathermap.org/data/2.5/weather?q={city},{country}&appid={api_key}&units=metric&lang=pt"
+        response = await _get_client().get("/data/2.5/weather", params=params)
+        return _lookup_reply(city, country, response)
 
-        with httpx.Client() as client:
-            response = client.get(url)
+    except Exception as e:
+        return _lookup_error(e)
 
-        if response.status_code == 200:
-            data = response.json()
 
-            temp = data["main"]["temp"]
-            feels_like = data["main"]["feels_like"]
-            humidity = data["main"]["humidity"]
-            description = data["weather"][0]["description"]
-            wind_speed = data["wind"]["speed"]
+def _get_weather_api_sync(city: str, country: str = "BR") -> str:
+    """Blocking variant of _get_weather_api (sync graph.invoke path)."""
+    params = _lookup_params(city, country)
+    if isinstance(params, str):
+        return params
 
-            return f"🌤️ {city}: {temp}°C ({description}), sensação térmica {feels_like}°C, umidade {humidity}%, vento {wind_speed}m/s"
-        else:
-            return f"❌ Não foi possível obter o clima para {city}"
+    try:
+        response = _HTTP_CLIENT.get("/data/2.5/weather", params=params)
+        return _lookup_reply(city, country, response)
 
     except Exception as e:
-        logger.error(f"Weather API error: {e}")
-        return f"⚠️ Erro ao consultar clima: {str(e)}"
+        return _lookup_error(e)
 
 
 def create_weather_tool():
     """
-    Create a LangChain @tool for supervisor agent to call weather.
+    Create a LangChain tool for supervisor agent to call weather.
 
     Returns:
-        Tool instance for create_react_agent tools list
+        StructuredTool (sync func and async coroutine) for create_react_agent
+        tools list
 
     Example:
         >>> from langgraph.prebuilt import create_react_agent
@@ -121,7 +284,6 @@ def create_weather_tool():
         ... )
     """
 
-    @tool
     def get_weather(city: str, country: str = "BR") -> str:
         """
         Get current weather information for a city.
@@ -140,23 +302,31 @@ def create_weather_tool():
             >>> get_weather("London", "UK")
             '🌧️ London: 15°C (chuva leve), sensação térmica 14°C, umidade 80%, vento 4.5m/s'
         """
-        logger.bind(event="LANGGRAPH|WEATHER_TOOL").debug(
-            "Fetching weather",
-            city=city,
-            country=country,
-        )
+        # Sync entry point (graph.invoke) on the shared blocking client
+        _tool_logger.debug("Fetching weather", city=city, country=country)
 
-        result = _get_weather_api(city, country)
+        result = _get_weather_api_sync(city, country)
 
-        logger.bind(event="LANGGRAPH|WEATHER_TOOL").info(
-            "Weather fetched",
-            city=city,
-            result_length=len(result),
-        )
+        _tool_logger.info("Weather fetched", city=city, result_length=len(result))
 
         return result
 
-    return get_weather
+    async def aget_weather(city: str, country: str = "BR") -> str:
+        """Async get_weather (graph.ainvoke/astream)."""
+        _tool_logger.debug("Fetching weather", city=city, country=country)
+
+        result = await _get_weather_api(city, country)
+
+        _tool_logger.info("Weather fetched", city=city, result_length=len(result))
+
+        return result
+
+    return StructuredTool.from_function(
+        func=get_weather,
+        coroutine=aget_weather,
+        name="get_weather",
+        description=inspect.getdoc(get_weather),
+    )
 
 
 def create_weather_node() -> Callable:
@@ -179,7 +349,11 @@ def create_weather_node() -> Callable:
         max_tokens=config.max_tokens,
     )
 
-    logger.bind(event="LANGGRAPH|NODE_INIT").info(
+    # Static prefix marked for provider prompt caching where supported
+    # (Anthropic/Bedrock); the user messages are never marked
+    system_message = cacheable_system_message(_WEATHER_SYSTEM_MESSAGE, config)
+
+    _init_logger.info(
         "Weather node created",
         model=config.get_litellm_model_path(),
         provider=config.provider,
@@ -200,15 +374,14 @@ def create_weather_node() -> Callable:
         """
         messages = state["messages"]
         if not messages:
-            logger.bind(event="LANGGRAPH|WEATHER_NODE").warning("No messages in state")
+            _node_logger.warning("No messages in state")
             return {"messages": [AIMessage(content="No weather query provided")]}
 
         # Build prompt with instructions + user message
-        system_message = SystemMessage(content=_get_weather_instructions())
-        prompt_messages = [system_message] + messages
+        prompt_messages = [system_message, *messages]
 
         # Invoke LiteLLM model
-        logger.bind(event="LANGGRAPH|WEATHER_NODE").debug(
+        _node_logger.debug(
             "Invoking weather model",
             model=config.get_litellm_model_path(),
             message_count=len(prompt_messages),
@@ -216,7 +389,7 @@ def create_weather_node() -> Callable:
 
         response = litellm_model.invoke(prompt_messages)
 
-        logger.bind(event="LANGGRAPH|WEATHER_NODE").info(
+        _node_logger.info(
             "Weather query completed",
             response_length=(
                 len(response.content) if hasattr(response, "content") else 0
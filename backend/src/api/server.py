@@ -19,6 +19,7 @@ from fastapi import Depends, FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 
+from src.agents.weather import close_weather_client
 from src.shared.config.models_config import load_orchestrator_config
 from src.voxy.main import get_voxy_system
 
@@ -61,6 +62,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.bind(event="SHUTDOWN").info("🛑 VOXY Agents API Server shutting down...")
+    await close_weather_client()
 
 
 # FastAPI application
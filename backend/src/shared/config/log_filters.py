@@ -20,6 +20,35 @@ SENSITIVE_PATTERNS = {
 }
 
 
+def _replacement_for(pattern_name: str) -> str:
+    """Texto de substituição de cada padrão de SENSITIVE_PATTERNS."""
+    if pattern_name == "jwt":
+        return r"eyJ...[MASKED_JWT]"
+    if pattern_name == "email":
+        # Preserva domínio, mascara usuário
+        return r"***@\2"
+    if pattern_name.startswith("api_key"):
+        return r"[MASKED_API_KEY]"
+    return r"[MASKED]"
+
+
+# (padrão, substituição) resolvidos uma vez, aplicados em sequência na
+# ordem de SENSITIVE_PATTERNS
+_SUBSTITUTIONS = tuple(
+    (pattern, _replacement_for(pattern_name))
+    for pattern_name, pattern in SENSITIVE_PATTERNS.items()
+)
+
+SENSITIVE_EXTRA_KEYS = (
+    "password",
+    "token",
+    "api_key",
+    "secret",
+    "authorization",
+    "bearer",
+)
+
+
 def mask_sensitive_data(record: dict) -> bool:
     """
     Filtra dados sensíveis de mensagens de log.
@@ -36,30 +65,16 @@ def mask_sensitive_data(record: dict) -> bool:
     message = record["message"]
 
     # Aplicar regex patterns
-    for pattern_name, pattern in SENSITIVE_PATTERNS.items():
-        if pattern_name == "jwt":
-            message = pattern.sub(r"eyJ...[MASKED_JWT]", message)
-        elif pattern_name == "email":
-            # Preserva domínio, mascara usuário
-            message = pattern.sub(r"***@\2", message)
-        elif pattern_name.startswith("api_key"):
-            message = pattern.sub(r"[MASKED_API_KEY]", message)
-        else:
-            message = pattern.sub(r"[MASKED]", message)
+    for pattern, replacement in _SUBSTITUTIONS:
+        message = pattern.sub(replacement, message)
+
+    record["message"] = message
 
     # Mascarar campos 'extra' sensíveis
-    if "extra" in record:
-        sensitive_keys = [
-            "password",
-            "token",
-            "api_key",
-            "secret",
-            "authorization",
-            "bearer",
-        ]
-        for key in sensitive_keys:
-            if key in record["extra"]:
-                record["extra"][key] = "***MASKED***"
+    extra = record.get("extra")
+    if extra:
+        for key in SENSITIVE_EXTRA_KEYS:
+            if key in extra:
+                extra[key] = "***MASKED***"
 
-    record["message"] = message
     return True
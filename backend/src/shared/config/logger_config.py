@@ -9,11 +9,18 @@ import inspect
 import logging
 import os
 import sys
+import zipfile
+from datetime import datetime
 from pathlib import Path
 
 from dotenv import load_dotenv
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # opcional: sem orjson, o sink JSON usa serialize=True
+    orjson = None
+
 # Load .env file BEFORE reading any environment variables
 # override=True ensures .env values take precedence over shell exports
 load_dotenv(override=True)
@@ -66,6 +73,101 @@ class InterceptHandler(logging.Handler):
         ).opt(depth=depth, exception=record.exc_info).log(level, escaped_message)
 
 
+def _serialize_record(record) -> bytes:
+    """
+    Linha JSON do registro via orjson (mesmo schema do serialize=True).
+
+    Só lê o registro: o dict é compartilhado com os demais sinks.
+    """
+    exception = record["exception"]
+    if exception is not None:
+        exception = {
+            "type": exception.type.__name__ if exception.type else None,
+            "value": str(exception.value) if exception.value else None,
+            "traceback": bool(exception.traceback),
+        }
+
+    serializable = {
+        "text": record["message"],
+        "record": {
+            "elapsed": {
+                "repr": str(record["elapsed"]),
+                "seconds": record["elapsed"].total_seconds(),
+            },
+            "exception": exception,
+            "extra": record["extra"],
+            "file": {"name": record["file"].name, "path": record["file"].path},
+            "function": record["function"],
+            "level": {
+                "icon": record["level"].icon,
+                "name": record["level"].name,
+                "no": record["level"].no,
+            },
+            "line": record["line"],
+            "message": record["message"],
+            "module": record["module"],
+            "name": record["name"],
+            "process": {"id": record["process"].id, "name": record["process"].name},
+            "thread": {"id": record["thread"].id, "name": record["thread"].name},
+            "time": {
+                "repr": str(record["time"]),
+                "timestamp": record["time"].timestamp(),
+            },
+        },
+    }
+    return orjson.dumps(serializable, default=str, option=orjson.OPT_APPEND_NEWLINE)
+
+
+class JsonFileSink:
+    """
+    Sink de arquivo JSON (uma linha orjson por registro).
+
+    Escreve os bytes direto no arquivo, sem passar pelo template do Loguru,
+    então o registro compartilhado não é alterado. Como o sink de arquivo do
+    Loguru, rotaciona por tamanho, compacta o arquivo rotacionado em .zip e
+    mantém só os `retention` mais recentes.
+    """
+
+    def __init__(self, path: Path, max_bytes: int, retention: int):
+        self._path = Path(path)
+        self._max_bytes = max_bytes
+        self._retention = retention
+        self._file = self._path.open("ab")
+        self._size = self._file.tell()
+
+    def write(self, message) -> None:
+        line = _serialize_record(message.record)
+        if self._size and self._size + len(line) > self._max_bytes:
+            self._rotate()
+        self._file.write(line)
+        self._size += len(line)
+
+    def stop(self) -> None:
+        self._file.close()
+
+    def _rotate(self) -> None:
+        self._file.close()
+
+        # Mesmo padrão de nome do Loguru: voxy_structured.<data>.json.zip
+        stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f")
+        rotated = self._path.with_name(f"{self._path.stem}.{stamp}{self._path.suffix}")
+        self._path.rename(rotated)
+        with zipfile.ZipFile(
+            rotated.with_name(f"{rotated.name}.zip"), "w", zipfile.ZIP_DEFLATED
+        ) as archive:
+            archive.write(rotated, rotated.name)
+        rotated.unlink()
+
+        archives = sorted(
+            self._path.parent.glob(f"{self._path.stem}.*{self._path.suffix}.zip")
+        )
+        for archive_path in archives[: -self._retention]:
+            archive_path.unlink()
+
+        self._file = self._path.open("ab")
+        self._size = 0
+
+
 def setup_stdlib_intercept():
     """
     Configura InterceptHandler para capturar logs de bibliotecas stdlib.
@@ -311,18 +413,30 @@ def configure_logger():
     )
 
     # SINK 5: JSON estruturado (opcional)
+    # Com orjson, serializa via JsonFileSink (bem mais rápido que o json da
+    # stdlib usado por serialize=True); sem ele, mantém o padrão
     if enable_json:
-        logger.add(
-            log_dir / "voxy_structured.json",
-            format="{message}",
-            level="INFO",
-            rotation="100 MB",
-            retention=7,
-            compression="zip",
-            serialize=True,
-            enqueue=True,
-            filter=mask_sensitive_data,
-        )
+        json_path = log_dir / "voxy_structured.json"
+        if orjson is not None:
+            logger.add(
+                JsonFileSink(json_path, max_bytes=100 * 1024 * 1024, retention=7),
+                level="INFO",
+                format="{message}",
+                enqueue=True,
+                filter=mask_sensitive_data,
+            )
+        else:
+            logger.add(
+                json_path,
+                level="INFO",
+                format="{message}",
+                serialize=True,
+                rotation="100 MB",
+                retention=7,
+                compression="zip",
+                enqueue=True,
+                filter=mask_sensitive_data,
+            )
 
     # SINK 6: Sentry (se configurado)
     sentry_dsn = os.getenv("VOXY_LOG_SENTRY_DSN")
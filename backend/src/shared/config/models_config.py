@@ -349,12 +349,17 @@ class VisionModelConfig(SubagentModelConfig):
         reasoning_max_tokens: Max tokens for reasoning (OpenRouter reasoning models only)
         enable_postprocessing: Enable conversational post-processing
         cache_ttl_base: Base TTL for cache entries in seconds
+        image_max_edge: Longest image edge sent to the model in pixels
+                        (None = original resolution)
+        image_jpeg_quality: JPEG quality for downscaled images
     """
 
     reasoning_effort: str = "medium"
     reasoning_max_tokens: int | None = None
     enable_postprocessing: bool = True
     cache_ttl_base: int = 600
+    image_max_edge: int | None = 1024
+    image_jpeg_quality: int = 85
 
 
 def load_vision_config() -> VisionModelConfig:
@@ -372,6 +377,9 @@ def load_vision_config() -> VisionModelConfig:
         VISION_REASONING_EFFORT: Reasoning level (default: "medium")
         VISION_CACHE_TTL: Cache TTL in seconds (default: 600)
         ENABLE_VISION_POSTPROCESSING: Enable post-processing (default: true)
+        VISION_IMAGE_MAX_EDGE: Downscale images to this longest edge in pixels
+                               (default: 1024; 0 keeps original resolution)
+        VISION_IMAGE_JPEG_QUALITY: JPEG quality for downscaled images (default: 85)
 
     Returns:
         VisionModelConfig: Vision agent configuration
@@ -430,6 +438,8 @@ def load_vision_config() -> VisionModelConfig:
     enable_postprocessing = (
         os.getenv("ENABLE_VISION_POSTPROCESSING", "true").lower() == "true"
     )
+    image_max_edge = int(os.getenv("VISION_IMAGE_MAX_EDGE", "1024")) or None
+    image_jpeg_quality = int(os.getenv("VISION_IMAGE_JPEG_QUALITY", "85"))
 
     return VisionModelConfig(
         provider=provider,
@@ -443,6 +453,8 @@ def load_vision_config() -> VisionModelConfig:
         reasoning_max_tokens=reasoning_max_tokens,
         cache_ttl_base=cache_ttl_base,
         enable_postprocessing=enable_postprocessing,
+        image_max_edge=image_max_edge,
+        image_jpeg_quality=image_jpeg_quality,
     )
 
 
@@ -9,6 +9,7 @@ Public API:
     - VoxyState: State management for LangGraph
     - CheckpointerType: Checkpointer types (memory, sqlite, postgres)
     - create_phase2_graph: Graph builder function
+    - get_or_build_graph: Cached compiled graph accessor
 
 Modules:
     - orchestrator: Main orchestration service
@@ -21,7 +22,7 @@ Modules:
 """
 
 from .checkpointer import CheckpointerType, create_checkpointer
-from .graph_builder import create_phase2_graph
+from .graph_builder import create_phase2_graph, get_or_build_graph
 from .graph_state import VoxyState, create_initial_state
 from .main import VOXYSystem, get_voxy_system
 from .orchestrator import LangGraphOrchestrator
@@ -34,6 +35,7 @@ __all__ = [
     "CheckpointerType",
     "create_checkpointer",
     "create_phase2_graph",
+    "get_or_build_graph",
     "entry_router",
     "vision_bypass_node",
     "VOXYSystem",
@@ -20,6 +20,19 @@ if TYPE_CHECKING:
     from langgraph.checkpoint.base import BaseCheckpointSaver
 
 
+# Connection tuning for on-disk SQLite checkpoints: WAL makes commits small
+# appends (readers don't block writers), NORMAL sync skips the per-commit
+# fsync of the main DB file, busy_timeout waits instead of raising
+# "database is locked" when writes overlap.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+
 class CheckpointerType(str, Enum):
     """Supported checkpointer types."""
 
@@ -42,6 +55,7 @@ def create_checkpointer(
                            Default: SQLITE (Phase 4C)
         db_path: Database path for persistent checkpointers (SQLite/Postgres)
                  Default: from LANGGRAPH_DB_PATH env var or "data/voxy_langgraph.db"
+                 SQLite also accepts "file:" URIs (e.g. shared in-memory DBs)
 
     Returns:
         BaseCheckpointSaver instance
@@ -104,8 +118,15 @@ def create_checkpointer(
             ) from e
 
         # Phase 4E Fix: Create connection manually and pass to SqliteSaver
-        # This avoids context manager issues and keeps connection open
-        conn = sqlite3.connect(resolved_db_path, check_same_thread=False)
+        # This avoids context manager issues and keeps connection open.
+        # "file:" paths are SQLite URIs, e.g. a shared in-memory database:
+        # "file:voxy_test?mode=memory&cache=shared"
+        is_uri = resolved_db_path.startswith("file:")
+        conn = sqlite3.connect(resolved_db_path, check_same_thread=False, uri=is_uri)
+        in_memory = resolved_db_path == ":memory:" or "mode=memory" in resolved_db_path
+        if not in_memory:
+            for pragma in SQLITE_PRAGMAS:
+                conn.execute(pragma)
         checkpointer = SqliteSaver(conn)
 
         logger.bind(event="CHECKPOINTER|SETUP").debug(
@@ -38,6 +38,9 @@ Reference: LangGraph Supervisor Multi-Agent Pattern
 https://langchain-ai.github.io/langgraph/concepts/multi_agent/
 """
 
+from functools import lru_cache
+
+from langchain_core.runnables import RunnableLambda
 from langchain_litellm import ChatLiteLLM
 from langgraph.graph import END, START, StateGraph
 from langgraph.prebuilt import create_react_agent
@@ -52,7 +55,7 @@ from src.shared.config.models_config import load_orchestrator_config
 
 from .checkpointer import CheckpointerType, create_checkpointer
 from .graph_state import VoxyState
-from .routing import entry_router, vision_bypass_node
+from .routing import avision_bypass_node, entry_router, vision_bypass_node
 
 
 def _get_supervisor_instructions() -> str:
@@ -213,9 +216,7 @@ class SupervisorGraphBuilder:
             Self for method chaining
         """
 
-        # Wrap vision bypass to add route tracking
-        def vision_bypass_with_routing(state):
-            result = vision_bypass_node(state)
+        def with_route(state, result):
             # Ensure route_taken is set (vision_bypass_node should set it)
             if "context" not in result or "route_taken" not in result.get(
                 "context", {}
@@ -227,7 +228,22 @@ class SupervisorGraphBuilder:
                 result = {**result, **updated}
             return result
 
-        self.builder.add_node("vision_bypass", vision_bypass_with_routing)
+        # Wrap vision bypass to add route tracking (sync for graph.invoke,
+        # async for graph.ainvoke/astream)
+        def vision_bypass_with_routing(state):
+            return with_route(state, vision_bypass_node(state))
+
+        async def avision_bypass_with_routing(state):
+            return with_route(state, await avision_bypass_node(state))
+
+        self.builder.add_node(
+            "vision_bypass",
+            RunnableLambda(
+                vision_bypass_with_routing,
+                afunc=avision_bypass_with_routing,
+                name="vision_bypass",
+            ),
+        )
         self.builder.add_edge("vision_bypass", END)
 
         self._nodes_added.add("vision_bypass")
@@ -270,18 +286,32 @@ class SupervisorGraphBuilder:
         """
         supervisor_agent = _create_supervisor_react_agent()
 
-        # Wrap supervisor to add route tracking
-        def supervisor_with_routing(state):
-            result = supervisor_agent.invoke(state)
+        def with_route(state, result):
             # Add PATH_2 marker to context
             from .graph_state import update_context
 
             updated = update_context(state, route_taken="PATH_2")
             return {**result, **updated}
 
+        # Wrap supervisor to add route tracking. graph.invoke runs the ReAct
+        # loop (and its tools) sync; graph.ainvoke/astream awaits it, so
+        # tool calls from one assistant turn run concurrently
+        def supervisor_with_routing(state):
+            return with_route(state, supervisor_agent.invoke(state))
+
+        async def asupervisor_with_routing(state):
+            return with_route(state, await supervisor_agent.ainvoke(state))
+
         # Add the supervisor ReAct agent as a node (wrapped)
         # create_react_agent returns a compiled graph that we add as a subgraph
-        self.builder.add_node("supervisor", supervisor_with_routing)
+        self.builder.add_node(
+            "supervisor",
+            RunnableLambda(
+                supervisor_with_routing,
+                afunc=asupervisor_with_routing,
+                name="supervisor",
+            ),
+        )
 
         # Supervisor now handles tool calling internally via ReAct loop
         # It goes to END when done
@@ -399,3 +429,31 @@ def create_phase3_graph(
     )
 
     return graph
+
+
+@lru_cache(maxsize=4)
+def _build_phase3_graph(checkpointer_type: CheckpointerType, db_path: str | None):
+    """Compile the Phase 3 graph once per (checkpointer_type, db_path)."""
+    return create_phase3_graph(checkpointer_type, db_path)
+
+
+def get_or_build_graph(
+    checkpointer_type: CheckpointerType | str = CheckpointerType.MEMORY,
+    db_path: str | None = None,
+):
+    """
+    Get the compiled Phase 3 graph, building it on first use.
+
+    Graphs are cached per (checkpointer_type, db_path), so repeated callers
+    (orchestrator instances, test scripts) skip tool registration and graph
+    compilation. Callers sharing a graph also share its checkpointer; threads
+    stay isolated by thread_id.
+
+    Args:
+        checkpointer_type: Type of checkpointer (memory, sqlite, postgres)
+        db_path: Database path for persistent checkpointers (optional)
+
+    Returns:
+        Compiled graph ready for invocation
+    """
+    return _build_phase3_graph(CheckpointerType(checkpointer_type), db_path)
@@ -28,6 +28,10 @@ Phase 3+ Usage:
 Reference: backend/src/voxy_agents/core/voxy_orchestrator.py (SDK version)
 """
 
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from uuid import uuid4
 
@@ -37,14 +41,16 @@ from loguru import logger
 from src.shared.utils.usage_tracker import log_usage_metrics
 
 from .checkpointer import CheckpointerType, get_checkpoint_config
-from .graph_builder import create_phase2_graph
+from .graph_builder import get_or_build_graph
 from .graph_state import VoxyState, create_initial_state
 from .usage_callback import UsageCallbackHandler
-from .usage_extractor import (
-    aggregate_costs_by_model,
-    extract_tool_invocations,
-    extract_usage_from_state,
-)
+from .usage_extractor import walk_state_once
+
+# Bounded pool for the blocking graph.invoke call: the event loop keeps
+# serving other requests meanwhile, and at most this many graph runs hit
+# the LLM providers at once. Nodes and tools run their sync paths
+# (model.invoke) in these threads; no event loop is created per call.
+_GRAPH_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix="voxy-graph")
 
 
 class LangGraphOrchestrator:
@@ -87,8 +93,8 @@ class LangGraphOrchestrator:
         self.checkpointer_type = checkpointer_type
         self.db_path = db_path
 
-        # Create Phase 2 graph (entry router + vision stub + translator + supervisor stub)
-        self.graph = create_phase2_graph(
+        # Compiled graph, shared by orchestrators with the same checkpointer config
+        self.graph = get_or_build_graph(
             checkpointer_type=checkpointer_type,
             db_path=db_path,
         )
@@ -239,8 +245,14 @@ class LangGraphOrchestrator:
             message_length=len(message),
         )
 
-        # Invoke graph
-        result: VoxyState = self.graph.invoke(state, config=config)
+        # Invoke graph off the event loop (the SQLite checkpointer is sync-only,
+        # so graph.ainvoke is not an option); contextvars keep the log context
+        run_graph = functools.partial(
+            contextvars.copy_context().run, self.graph.invoke, state, config=config
+        )
+        result: VoxyState = await asyncio.get_running_loop().run_in_executor(
+            _GRAPH_EXECUTOR, run_graph
+        )
 
         # Extract response with robust content handling
         response_message = result["messages"][-1]
@@ -288,14 +300,12 @@ class LangGraphOrchestrator:
         # Extract vision analysis if present (PATH1)
         vision_analysis = result.get("context", {}).get("vision_analysis")
 
-        # Phase 4A: Extract usage metrics
-        usage = extract_usage_from_state(result, usage_handler)
-
-        # Phase 4B: Extract tool invocations for hierarchical logging
-        subagents = extract_tool_invocations(result, usage_handler)
-
-        # Phase 4D: Calculate multi-model cost
-        total_cost = aggregate_costs_by_model(result, usage_handler)
+        # Phase 4A/4B/4D: usage, tool invocations and multi-model cost,
+        # collected in a single pass over the result messages
+        report = walk_state_once(result, usage_handler)
+        usage = report.usage
+        subagents = report.subagents
+        total_cost = report.total_cost
         if usage and total_cost is not None:
             usage.estimated_cost_usd = total_cost
 
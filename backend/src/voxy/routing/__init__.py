@@ -7,15 +7,16 @@ Implements dual-path architecture:
 
 Public API:
     - entry_router: Main routing function (PATH1 vs PATH2)
-    - vision_bypass_node: PATH1 implementation
+    - vision_bypass_node / avision_bypass_node: PATH1 implementation
     - detect_vision_bypass: Vision detection logic
 """
 
 from .entry_router import detect_vision_bypass, entry_router
-from .vision_bypass import vision_bypass_node
+from .vision_bypass import avision_bypass_node, vision_bypass_node
 
 __all__ = [
     "entry_router",
     "vision_bypass_node",
+    "avision_bypass_node",
     "detect_vision_bypass",
 ]
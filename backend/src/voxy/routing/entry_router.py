@@ -16,6 +16,8 @@ from loguru import logger
 
 from voxy.graph_state import VoxyState
 
+_router_logger = logger.bind(event="LANGGRAPH|ENTRY_ROUTER")
+
 
 def detect_vision_bypass(message: str, image_url: str | None) -> bool:
     """
@@ -51,7 +53,7 @@ def detect_vision_bypass(message: str, image_url: str | None) -> bool:
     # SIMPLIFIED LOGIC: If image_url is present, ALWAYS route to vision
     # Rationale: User sent an image = wants vision analysis
     # This avoids missing vision requests due to keyword limitations
-    logger.bind(event="LANGGRAPH|ENTRY_ROUTER").info(
+    _router_logger.info(
         "Vision bypass detected (image_url present)",
         has_image_url=True,
         message_preview=message[:50] if len(message) > 50 else message,
@@ -80,7 +82,7 @@ def entry_router(state: VoxyState) -> Literal["vision_bypass", "supervisor"]:
     # Extract latest user message
     messages = state["messages"]
     if not messages:
-        logger.bind(event="LANGGRAPH|ENTRY_ROUTER").warning("No messages in state")
+        _router_logger.warning("No messages in state")
         return "supervisor"
 
     # Get last message content
@@ -104,14 +106,14 @@ def entry_router(state: VoxyState) -> Literal["vision_bypass", "supervisor"]:
     should_bypass = detect_vision_bypass(message_content, image_url)
 
     if should_bypass:
-        logger.bind(event="LANGGRAPH|ENTRY_ROUTER").info(
+        _router_logger.info(
             "Routing to PATH1 (vision bypass)",
             message_length=len(message_content),
             has_image=bool(image_url),
         )
         return "vision_bypass"
     else:
-        logger.bind(event="LANGGRAPH|ENTRY_ROUTER").info(
+        _router_logger.info(
             "Routing to PATH2 (supervisor)",
             message_length=len(message_content),
             has_image=bool(image_url),
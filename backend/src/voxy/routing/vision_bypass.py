@@ -10,55 +10,38 @@ from typing import Any
 from langchain_core.messages import AIMessage
 from loguru import logger
 
-from src.agents.vision import create_vision_node
+from src.agents.vision import get_vision_node
 from voxy.graph_state import VoxyState, update_context
 
+_bypass_logger = logger.bind(event="LANGGRAPH|VISION_BYPASS")
 
-def vision_bypass_node(state: VoxyState) -> dict[str, Any]:
-    """
-    Vision bypass node - PATH1 direct execution with actual Vision Agent.
-
-    Invokes the Vision Agent node directly for image analysis without
-    going through the supervisor orchestrator.
 
-    Args:
-        state: Current VoxyState with image_url in context
-
-    Returns:
-        State update with vision analysis result
-
-    Example:
-        >>> state = {
-        ...     "messages": [{"role": "user", "content": "What is this?"}],
-        ...     "context": {"image_url": "https://example.com/img.jpg"}
-        ... }
-        >>> result = vision_bypass_node(state)
-        >>> "vision_analysis" in result["context"]
-        True
-    """
+def _missing_image_reply(state: VoxyState) -> dict[str, Any] | None:
+    """Log the bypass start; state update for a request without image_url."""
     # Extract image_url from context
     image_url = state.get("context", {}).get("image_url")
 
-    logger.bind(event="LANGGRAPH|VISION_BYPASS").info(
+    _bypass_logger.info(
         "Vision bypass node executing (PATH1 - direct to Vision Agent)",
         has_image_url=bool(image_url),
     )
 
-    if not image_url:
-        # No image URL - return error message
-        response = AIMessage(
-            content="I notice you want image analysis, but no image URL was provided. Please provide an image URL."
-        )
+    if image_url:
+        return None
 
-        logger.bind(event="LANGGRAPH|VISION_BYPASS").warning(
-            "No image URL in context for vision bypass"
-        )
+    # No image URL - return error message
+    response = AIMessage(
+        content="I notice you want image analysis, but no image URL was provided. Please provide an image URL."
+    )
 
-        return {"messages": [response]}
+    _bypass_logger.warning("No image URL in context for vision bypass")
+
+    return {"messages": [response]}
 
-    # Invoke actual Vision Agent node
-    vision_node = create_vision_node()
-    result = vision_node(state)
+
+def _bypass_update(state: VoxyState, result: dict[str, Any]) -> dict[str, Any]:
+    """Record the vision node result as the PATH1 analysis in context."""
+    image_url = state["context"]["image_url"]
 
     # Extract vision analysis from response
     if result.get("messages"):
@@ -76,7 +59,7 @@ def vision_bypass_node(state: VoxyState) -> dict[str, Any]:
             "result": analysis_content,
         }
 
-        logger.bind(event="LANGGRAPH|VISION_BYPASS").info(
+        _bypass_logger.info(
             "Vision bypass completed",
             image_url_length=len(image_url),
             analysis_length=len(analysis_content),
@@ -95,7 +78,47 @@ def vision_bypass_node(state: VoxyState) -> dict[str, Any]:
         }
     else:
         # Fallback if no messages returned
-        logger.bind(event="LANGGRAPH|VISION_BYPASS").warning(
-            "Vision node returned no messages"
-        )
+        _bypass_logger.warning("Vision node returned no messages")
         return result
+
+
+def vision_bypass_node(state: VoxyState) -> dict[str, Any]:
+    """
+    Vision bypass node - PATH1 direct execution with actual Vision Agent.
+
+    Invokes the Vision Agent node directly for image analysis without
+    going through the supervisor orchestrator.
+
+    Args:
+        state: Current VoxyState with image_url in context
+
+    Returns:
+        State update with vision analysis result
+
+    Example:
+        >>> state = {
+        ...     "messages": [{"role": "user", "content": "What is this?"}],
+        ...     "context": {"image_url": "https://example.com/img.jpg"}
+        ... }
+        >>> result = vision_bypass_node(state)
+        >>> "vision_analysis" in result["context"]
+        True
+    """
+    reply = _missing_image_reply(state)
+    if reply is not None:
+        return reply
+
+    # Invoke actual Vision Agent node
+    result = get_vision_node().invoke(state)
+    return _bypass_update(state, result)
+
+
+async def avision_bypass_node(state: VoxyState) -> dict[str, Any]:
+    """Async vision_bypass_node (graph.ainvoke/astream): awaits the vision node."""
+    reply = _missing_image_reply(state)
+    if reply is not None:
+        return reply
+
+    # Invoke actual Vision Agent node
+    result = await get_vision_node().ainvoke(state)
+    return _bypass_update(state, result)
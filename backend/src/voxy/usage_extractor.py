@@ -12,8 +12,13 @@ Architecture:
 Phase 4A: extract_usage_from_state() - Token usage from VoxyState
 Phase 4B: extract_tool_invocations() - Subagent calls for hierarchical logs
 Phase 4D: aggregate_costs_by_model() - Multi-model cost calculation
+
+walk_state_once() collects all three in a single traversal of state["messages"];
+the functions above are thin adapters over the same helpers.
 """
 
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from typing import Any
 
 from langchain_core.messages import AIMessage, ToolMessage
@@ -38,56 +43,103 @@ except ImportError:
     )
 
 
-def extract_usage_from_state(
-    state: VoxyState, callback_handler: UsageCallbackHandler | None = None
-) -> UsageMetrics | None:
+@dataclass
+class UsageReport:
     """
-    Extract token usage metrics from LangGraph VoxyState.
+    Usage, tool invocations and cost collected in one pass over VoxyState.
 
-    Traverses state["messages"] to find AIMessage objects with usage_metadata,
-    aggregates tokens across all LLM calls, and returns UsageMetrics compatible
-    with usage_tracker.py.
+    Attributes:
+        usage: Aggregated token usage, or None if no usage data found
+        subagents: SubagentInfo list for log_usage_metrics()
+        total_cost: Total estimated cost in USD, or None if unavailable
+    """
 
-    Args:
-        state: VoxyState after graph execution
-        callback_handler: Optional callback handler with additional telemetry
+    usage: UsageMetrics | None = None
+    subagents: list[SubagentInfo] = field(default_factory=list)
+    total_cost: float | None = None
 
-    Returns:
-        UsageMetrics with aggregated token counts, or None if no usage data found
 
-    Example:
-        >>> result = graph.invoke(state, config=config)
-        >>> usage = extract_usage_from_state(result)
-        >>> if usage:
-        ...     print(f"Total: {usage.total_tokens} tokens")
+@dataclass
+class _MessageScan:
+    """Accumulators filled by a single traversal of state["messages"]."""
+
+    message_count: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    requests: int = 0
+    tool_messages: list[ToolMessage] = field(default_factory=list)
+    models_used: dict[str, dict[str, int]] = field(default_factory=dict)
+
+
+def _scan_messages(state: VoxyState) -> _MessageScan:
+    """
+    Walk state["messages"] once, accumulating tokens, tool messages and
+    per-model usage.
     """
     messages = state.get("messages", [])
+    scan = _MessageScan(message_count=len(messages))
 
-    if not messages:
+    for message in messages:
+        if isinstance(message, ToolMessage):
+            scan.tool_messages.append(message)
+            continue
+
+        if not isinstance(message, AIMessage):
+            continue
+
+        # LangGraph/LangChain attaches usage_metadata to AIMessage
+        metadata = getattr(message, "usage_metadata", None)
+        if not metadata:
+            continue
+
+        input_tokens = metadata.get("input_tokens", 0)
+        output_tokens = metadata.get("output_tokens", 0)
+        scan.input_tokens += input_tokens
+        scan.output_tokens += output_tokens
+        scan.requests += 1
+
+        logger.bind(event="USAGE_EXTRACTOR|AI_MESSAGE_USAGE").debug(
+            f"Found usage in AIMessage: {input_tokens} in + {output_tokens} out"
+        )
+
+        # LangGraph may store model in response_metadata or message attributes
+        model_name = None
+        if hasattr(message, "response_metadata"):
+            model_name = message.response_metadata.get("model_name")
+
+        # Fallback: try to get from additional_kwargs
+        if not model_name and hasattr(message, "additional_kwargs"):
+            model_name = message.additional_kwargs.get("model")
+
+        # Without a model name the message still counts for tokens, not cost
+        if not model_name:
+            logger.bind(event="USAGE_EXTRACTOR|NO_MODEL_NAME").debug(
+                "AIMessage has usage but no model name, skipping cost"
+            )
+            continue
+
+        model_usage = scan.models_used.setdefault(
+            model_name, {"input_tokens": 0, "output_tokens": 0}
+        )
+        model_usage["input_tokens"] += input_tokens
+        model_usage["output_tokens"] += output_tokens
+
+    return scan
+
+
+def _usage_from_scan(
+    scan: _MessageScan, callback_handler: UsageCallbackHandler | None
+) -> UsageMetrics | None:
+    """Build UsageMetrics from a message scan, falling back to the callback."""
+    if not scan.message_count:
         logger.bind(event="USAGE_EXTRACTOR|NO_MESSAGES").debug(
             "No messages in state, cannot extract usage"
         )
         return None
 
-    # Aggregate usage from AIMessage.usage_metadata
-    total_input_tokens = 0
-    total_output_tokens = 0
-    total_requests = 0
-
-    for message in messages:
-        if isinstance(message, AIMessage):
-            # LangGraph/LangChain attaches usage_metadata to AIMessage
-            if hasattr(message, "usage_metadata") and message.usage_metadata:
-                metadata = message.usage_metadata
-                total_input_tokens += metadata.get("input_tokens", 0)
-                total_output_tokens += metadata.get("output_tokens", 0)
-                total_requests += 1
-
-                logger.bind(event="USAGE_EXTRACTOR|AI_MESSAGE_USAGE").debug(
-                    f"Found usage in AIMessage: "
-                    f"{metadata.get('input_tokens', 0)} in + "
-                    f"{metadata.get('output_tokens', 0)} out"
-                )
+    total_input_tokens = scan.input_tokens
+    total_output_tokens = scan.output_tokens
+    total_requests = scan.requests
 
     # Fallback: try callback handler if state didn't have usage
     if total_requests == 0 and callback_handler:
@@ -125,6 +177,63 @@ def extract_usage_from_state(
     return usage
 
 
+def walk_state_once(
+    state: VoxyState, callback_handler: UsageCallbackHandler | None = None
+) -> UsageReport:
+    """
+    Extract usage, tool invocations and multi-model cost in a single pass.
+
+    Equivalent to calling extract_usage_from_state(), extract_tool_invocations()
+    and aggregate_costs_by_model() with the same arguments, but traverses
+    state["messages"] only once.
+
+    Args:
+        state: VoxyState after graph execution
+        callback_handler: Optional callback handler with additional telemetry
+
+    Returns:
+        UsageReport with usage, subagents and total_cost
+
+    Example:
+        >>> report = walk_state_once(result, handler)
+        >>> if report.usage and report.total_cost is not None:
+        ...     report.usage.estimated_cost_usd = report.total_cost
+    """
+    scan = _scan_messages(state)
+
+    return UsageReport(
+        usage=_usage_from_scan(scan, callback_handler),
+        subagents=_build_subagents(state, callback_handler, scan.tool_messages),
+        total_cost=_total_cost(scan.models_used),
+    )
+
+
+def extract_usage_from_state(
+    state: VoxyState, callback_handler: UsageCallbackHandler | None = None
+) -> UsageMetrics | None:
+    """
+    Extract token usage metrics from LangGraph VoxyState.
+
+    Traverses state["messages"] to find AIMessage objects with usage_metadata,
+    aggregates tokens across all LLM calls, and returns UsageMetrics compatible
+    with usage_tracker.py.
+
+    Args:
+        state: VoxyState after graph execution
+        callback_handler: Optional callback handler with additional telemetry
+
+    Returns:
+        UsageMetrics with aggregated token counts, or None if no usage data found
+
+    Example:
+        >>> result = graph.invoke(state, config=config)
+        >>> usage = extract_usage_from_state(result)
+        >>> if usage:
+        ...     print(f"Total: {usage.total_tokens} tokens")
+    """
+    return _usage_from_scan(_scan_messages(state), callback_handler)
+
+
 def extract_usage_from_callback(
     callback_handler: UsageCallbackHandler,
 ) -> UsageMetrics | None:
@@ -177,6 +286,21 @@ def extract_tool_invocations(
         >>> for tool in tools:
         ...     print(f"{tool.name}: {tool.model}")
     """
+    # Lazy: only consumed when the callback handler has no invocations
+    tool_messages = (
+        message
+        for message in state.get("messages", [])
+        if isinstance(message, ToolMessage)
+    )
+    return _build_subagents(state, callback_handler, tool_messages)
+
+
+def _build_subagents(
+    state: VoxyState,
+    callback_handler: UsageCallbackHandler | None,
+    tool_messages: Iterable[ToolMessage],
+) -> list[SubagentInfo]:
+    """Build SubagentInfo list from the callback, falling back to ToolMessages."""
     subagents: list[SubagentInfo] = []
 
     # Primary source: callback handler (has full data)
@@ -192,12 +316,10 @@ def extract_tool_invocations(
         return subagents
 
     # Fallback: parse ToolMessage from state messages
-    messages = state.get("messages", [])
-    for message in messages:
-        if isinstance(message, ToolMessage):
-            subagent_info = _build_subagent_info_from_tool_message(message, state)
-            if subagent_info:
-                subagents.append(subagent_info)
+    for message in tool_messages:
+        subagent_info = _build_subagent_info_from_tool_message(message, state)
+        if subagent_info:
+            subagents.append(subagent_info)
 
     logger.bind(event="USAGE_EXTRACTOR|TOOLS_FROM_STATE").debug(
         f"Extracted {len(subagents)} tool invocations from state messages"
@@ -331,47 +453,18 @@ def aggregate_costs_by_model(
         >>> total_cost = aggregate_costs_by_model(result)
         >>> print(f"Total: ${total_cost:.6f}")
     """
+    return _total_cost(_scan_messages(state).models_used)
+
+
+def _total_cost(models_used: dict[str, dict[str, int]]) -> float | None:
+    """Sum LiteLLM cost over per-model token usage from a message scan."""
     if not LITELLM_AVAILABLE:
         logger.bind(event="USAGE_EXTRACTOR|LITELLM_UNAVAILABLE").warning(
             "LiteLLM not available, cannot calculate costs"
         )
         return None
 
-    messages = state.get("messages", [])
     total_cost = 0.0
-    models_used: dict[str, dict[str, int]] = (
-        {}
-    )  # model -> {input_tokens, output_tokens}
-
-    for message in messages:
-        if isinstance(message, AIMessage) and hasattr(message, "usage_metadata"):
-            metadata = message.usage_metadata
-            if not metadata:
-                continue
-
-            # Extract model name
-            # LangGraph may store model in response_metadata or message attributes
-            model_name = None
-            if hasattr(message, "response_metadata"):
-                model_name = message.response_metadata.get("model_name")
-
-            # Fallback: try to get from additional_kwargs or context
-            if not model_name and hasattr(message, "additional_kwargs"):
-                model_name = message.additional_kwargs.get("model")
-
-            # If still no model, skip cost calculation for this message
-            if not model_name:
-                logger.bind(event="USAGE_EXTRACTOR|NO_MODEL_NAME").debug(
-                    "AIMessage has usage but no model name, skipping cost"
-                )
-                continue
-
-            # Aggregate usage per model
-            if model_name not in models_used:
-                models_used[model_name] = {"input_tokens": 0, "output_tokens": 0}
-
-            models_used[model_name]["input_tokens"] += metadata.get("input_tokens", 0)
-            models_used[model_name]["output_tokens"] += metadata.get("output_tokens", 0)
 
     # Calculate cost per model
     for model_name, usage in models_used.items():
@@ -0,0 +1 @@
+"""Tests for the LangGraph agents (src/agents)."""
@@ -0,0 +1,25 @@
+"""
+Import setup and fixtures for the src/agents tests.
+
+The routing modules import ``voxy.*`` with src/ on sys.path. It is appended,
+not prepended, so src/platform does not shadow the stdlib ``platform``.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.append(str(SRC_DIR))
+
+# src.voxy builds the graph from the agent packages; loading it first avoids
+# the partially initialised src.agents.* <-> src.voxy import cycle
+import src.voxy  # noqa: E402, F401
+
+
+@pytest.fixture(autouse=True)
+def cleanup_global_state():
+    """Override the root fixture, which resets legacy src.voxy_agents singletons."""
+    yield
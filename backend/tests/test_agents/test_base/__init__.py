@@ -0,0 +1 @@
+"""Tests for the shared agent/node machinery."""
@@ -0,0 +1,459 @@
+"""
+Unit tests for the LangGraph node factories in src/agents/_base/node.py.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
+
+from src.agents._base import node as node_module
+from src.agents._base.node import (
+    _empty_response,
+    _response_cache_key,
+    create_batched_invoke,
+    create_lazy_node,
+    create_model_invoker,
+    create_simple_node,
+    get_or_create_node,
+)
+from src.shared.config.models_config import SubagentModelConfig
+
+
+class FakeModel:
+    """Stand-in for ChatLiteLLM that echoes the last prompt message."""
+
+    def __init__(self):
+        self.calls: list[tuple[str, list]] = []
+
+    @staticmethod
+    def reply(prompt) -> AIMessage:
+        return AIMessage(
+            content=f"reply: {prompt[-1].content}",
+            usage_metadata={"input_tokens": 3, "output_tokens": 2, "total_tokens": 5},
+        )
+
+    def invoke(self, prompt, **kwargs):
+        self.calls.append(("invoke", prompt))
+        return self.reply(prompt)
+
+    async def ainvoke(self, prompt, **kwargs):
+        self.calls.append(("ainvoke", prompt))
+        return self.reply(prompt)
+
+    def stream(self, prompt, **kwargs):
+        self.calls.append(("stream", prompt))
+        for word in self.reply(prompt).content.split(" "):
+            yield AIMessageChunk(content=word + " ")
+
+    async def astream(self, prompt, **kwargs):
+        self.calls.append(("astream", prompt))
+        for word in self.reply(prompt).content.split(" "):
+            yield AIMessageChunk(content=word + " ")
+
+
+class FakeBatchModel(FakeModel):
+    """FakeModel with abatch; prompts containing "fail" raise."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    async def ainvoke(self, prompt, **kwargs):
+        self.calls.append(("ainvoke", prompt))
+        if "fail" in prompt[-1].content:
+            raise ValueError(prompt[-1].content)
+        return self.reply(prompt)
+
+    async def abatch(self, prompts, return_exceptions=False, **kwargs):
+        self.batches.append([prompt[-1].content for prompt in prompts])
+        return [
+            (
+                ValueError(prompt[-1].content)
+                if "fail" in prompt[-1].content
+                else self.reply(prompt)
+            )
+            for prompt in prompts
+        ]
+
+
+def make_config(temperature: float = 0.0) -> SubagentModelConfig:
+    return SubagentModelConfig(
+        provider="openai",
+        model_name="test-model",
+        api_key="test",
+        temperature=temperature,
+    )
+
+
+@pytest.fixture
+def fake_model():
+    """Patch ChatLiteLLM in the node module so factories build a FakeModel."""
+    model = FakeModel()
+    with patch.object(node_module, "ChatLiteLLM", return_value=model):
+        yield model
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Isolate the module-level response cache between tests."""
+    node_module._RESPONSE_CACHE.clear()
+    yield
+    node_module._RESPONSE_CACHE.clear()
+
+
+def make_node(**kwargs):
+    return create_simple_node(
+        "calculator", lambda: "You are a calculator.", make_config(), **kwargs
+    )
+
+
+class TestCreateSimpleNode:
+    """Test suite for create_simple_node sync and async paths."""
+
+    def test_invoke_uses_sync_model_call(self, fake_model):
+        """node.invoke calls model.invoke with system + history."""
+        node = make_node()
+
+        result = node.invoke({"messages": [HumanMessage(content="2+2")]})
+
+        assert result["messages"][0].content == "reply: 2+2"
+        method, prompt = fake_model.calls[0]
+        assert method == "invoke"
+        assert prompt[0].content == "You are a calculator."
+
+    async def test_ainvoke_uses_async_model_call(self, fake_model):
+        """node.ainvoke calls model.ainvoke."""
+        node = make_node()
+
+        result = await node.ainvoke({"messages": [HumanMessage(content="2+2")]})
+
+        assert result["messages"][0].content == "reply: 2+2"
+        assert [method for method, _ in fake_model.calls] == ["ainvoke"]
+
+    async def test_streaming_folds_chunks_on_both_paths(self, fake_model):
+        """streaming=True uses stream/astream and returns the full message."""
+        node = make_node(streaming=True)
+        state = {"messages": [HumanMessage(content="2+2")]}
+
+        sync_reply = node.invoke(state)["messages"][0]
+        async_reply = (await node.ainvoke(state))["messages"][0]
+
+        assert sync_reply.content.strip() == "reply: 2+2"
+        assert async_reply.content.strip() == "reply: 2+2"
+        assert [method for method, _ in fake_model.calls] == ["stream", "astream"]
+
+    def test_empty_state_skips_model(self, fake_model):
+        """States without messages get the canned reply, not an LLM call."""
+        result = make_node().invoke({"messages": []})
+
+        assert result["messages"][0].content == "No input to process"
+        assert fake_model.calls == []
+
+
+class TestCreateLazyNode:
+    """Test suite for create_lazy_node."""
+
+    async def test_runnable_node_through_invoke_and_ainvoke(self, fake_model):
+        """A lazily built simple node runs on both paths; factory runs once."""
+        factory_calls = []
+
+        def factory():
+            factory_calls.append(1)
+            return make_node()
+
+        lazy_node = create_lazy_node(factory)
+        assert factory_calls == []
+
+        state = {"messages": [HumanMessage(content="3*3")]}
+        sync_reply = lazy_node.invoke(state)["messages"][0]
+        async_reply = (await lazy_node.ainvoke(state))["messages"][0]
+
+        assert sync_reply.content == async_reply.content == "reply: 3*3"
+        assert [method for method, _ in fake_model.calls] == ["invoke", "ainvoke"]
+        assert factory_calls == [1]
+
+    async def test_plain_sync_function(self):
+        """Plain sync node functions are called on both paths."""
+        lazy_node = create_lazy_node(lambda: lambda state: {"seen": state["x"]})
+
+        assert lazy_node.invoke({"x": 1}) == {"seen": 1}
+        assert await lazy_node.ainvoke({"x": 2}) == {"seen": 2}
+
+    async def test_async_function_is_async_only(self):
+        """Coroutine node functions are awaited by ainvoke, rejected by invoke."""
+
+        async def node(state):
+            return {"seen": state["x"]}
+
+        lazy_node = create_lazy_node(lambda: node)
+
+        assert await lazy_node.ainvoke({"x": 1}) == {"seen": 1}
+        with pytest.raises(TypeError):
+            lazy_node.invoke({"x": 1})
+
+
+class TestGetOrCreateNode:
+    """Test suite for get_or_create_node."""
+
+    def test_factory_runs_once_per_name(self):
+        """The cached instance is returned on later calls."""
+        created = []
+
+        def factory():
+            created.append(object())
+            return created[-1]
+
+        with patch.dict(node_module._node_instances, clear=True):
+            first = get_or_create_node("test_node", factory)
+            second = get_or_create_node("test_node", factory)
+
+        assert first is second
+        assert len(created) == 1
+
+
+def run_concurrently(invoke, texts: list[str]) -> list:
+    """
+    Call invoke once per text concurrently in a fresh event loop.
+
+    The loop is private (not set as current, unlike asyncio.run) so the
+    pytest-asyncio session loop stays usable by later async tests.
+    """
+
+    async def main():
+        calls = [invoke([HumanMessage(content=text)]) for text in texts]
+        return await asyncio.wait_for(
+            asyncio.gather(*calls, return_exceptions=True), timeout=5
+        )
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(main())
+    finally:
+        # Stop the batcher's drain task before closing its loop
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.close()
+
+
+class TestCreateBatchedInvoke:
+    """Test suite for create_batched_invoke (micro-batching)."""
+
+    def test_concurrent_calls_share_one_abatch(self):
+        """N concurrent callers are sent as a single abatch call."""
+        model = FakeBatchModel()
+        invoke = create_batched_invoke(model, "calculator", max_wait_ms=50)
+
+        run_concurrently(invoke, ["a", "b", "c", "d"])
+
+        assert model.batches == [["a", "b", "c", "d"]]
+        assert model.calls == []
+
+    def test_results_map_back_to_callers(self):
+        """Each caller gets the reply to its own prompt, in call order."""
+        model = FakeBatchModel()
+        invoke = create_batched_invoke(model, "calculator", max_wait_ms=50)
+
+        results = run_concurrently(invoke, ["a", "b", "c"])
+
+        assert [result.content for result in results] == [
+            "reply: a",
+            "reply: b",
+            "reply: c",
+        ]
+
+    def test_failure_only_affects_its_caller(self):
+        """A failed item raises for its caller; the others still succeed."""
+        model = FakeBatchModel()
+        invoke = create_batched_invoke(model, "calculator", max_wait_ms=50)
+
+        results = run_concurrently(invoke, ["a", "fail", "c"])
+
+        assert results[0].content == "reply: a"
+        assert isinstance(results[1], ValueError)
+        assert results[2].content == "reply: c"
+
+    def test_batch_size_is_capped(self):
+        """Callers beyond max_batch_size go into the next batch."""
+        model = FakeBatchModel()
+        invoke = create_batched_invoke(
+            model, "calculator", max_batch_size=2, max_wait_ms=50
+        )
+
+        run_concurrently(invoke, ["a", "b", "c"])
+
+        assert model.batches[0] == ["a", "b"]
+        assert [method for method, _ in model.calls] == ["ainvoke"]
+
+    def test_lone_call_uses_ainvoke(self):
+        """A single prompt skips abatch."""
+        model = FakeBatchModel()
+        invoke = create_batched_invoke(model, "calculator", max_wait_ms=1)
+
+        (result,) = run_concurrently(invoke, ["a"])
+
+        assert result.content == "reply: a"
+        assert model.batches == []
+
+    def test_new_event_loop_gets_fresh_queue(self):
+        """The queue/drain task are rebuilt when called from another loop."""
+        model = FakeBatchModel()
+        invoke = create_batched_invoke(model, "calculator", max_wait_ms=50)
+
+        first = run_concurrently(invoke, ["a", "b"])
+        # The first loop (and its drain task) is closed; this must not hang
+        second = run_concurrently(invoke, ["c", "d"])
+
+        assert [result.content for result in first + second] == [
+            "reply: a",
+            "reply: b",
+            "reply: c",
+            "reply: d",
+        ]
+        assert model.batches == [["a", "b"], ["c", "d"]]
+
+
+class TestCreateModelInvoker:
+    """Test suite for create_model_invoker."""
+
+    def test_plain_ainvoke_by_default(self, monkeypatch):
+        """Without VOXY_LLM_MICROBATCH the model's ainvoke is returned."""
+        monkeypatch.delenv("VOXY_LLM_MICROBATCH", raising=False)
+        model = FakeBatchModel()
+
+        assert create_model_invoker(model, "calculator") == model.ainvoke
+
+    def test_microbatch_env_enables_batching(self, monkeypatch):
+        """VOXY_LLM_MICROBATCH=1 returns a batched invoker."""
+        monkeypatch.setenv("VOXY_LLM_MICROBATCH", "1")
+        model = FakeBatchModel()
+        invoke = create_model_invoker(model, "calculator", max_wait_ms=50)
+
+        run_concurrently(invoke, ["a", "b"])
+
+        assert model.batches == [["a", "b"]]
+
+
+class TestResponseCache:
+    """Test suite for the create_simple_node response cache."""
+
+    def test_key_is_stable(self):
+        """Equal prompts hash to the same key across calls."""
+        messages = [HumanMessage(content="2+2")]
+
+        key = _response_cache_key("calculator", "openai/m", "instr", messages)
+
+        assert key == _response_cache_key(
+            "calculator", "openai/m", "instr", [HumanMessage(content="2+2")]
+        )
+        assert len(key) == 32
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            ("translator", "openai/m", "instr", "2+2"),
+            ("calculator", "openai/other", "instr", "2+2"),
+            ("calculator", "openai/m", "other", "2+2"),
+            ("calculator", "openai/m", "instr", "2+3"),
+        ],
+    )
+    def test_key_covers_every_part(self, changed):
+        """Agent, model, instructions and content all change the key."""
+        agent, model, instructions, text = changed
+        base = _response_cache_key(
+            "calculator", "openai/m", "instr", [HumanMessage(content="2+2")]
+        )
+
+        assert base != _response_cache_key(
+            agent, model, instructions, [HumanMessage(content=text)]
+        )
+
+    def test_key_includes_tool_calls(self):
+        """Assistant turns differing only in tool calls get different keys."""
+
+        def history(expression: str) -> list:
+            return [
+                HumanMessage(content="calc"),
+                AIMessage(
+                    content="",
+                    tool_calls=[
+                        {"name": "calc", "args": {"x": expression}, "id": "call_1"}
+                    ],
+                ),
+            ]
+
+        assert _response_cache_key(
+            "calculator", "openai/m", "instr", history("1+1")
+        ) != _response_cache_key("calculator", "openai/m", "instr", history("2+2"))
+
+    def test_hit_skips_model_and_drops_usage(self, fake_model):
+        """Repeated prompts are served from the cache without usage/id."""
+        node = make_node(cache=True)
+        state = {"messages": [HumanMessage(content="2+2")]}
+
+        first = node.invoke(state)["messages"][0]
+        second = node.invoke(state)["messages"][0]
+
+        assert len(fake_model.calls) == 1
+        assert second.content == first.content
+        assert second.usage_metadata is None
+        assert second.id is None
+        # The cached original keeps its usage for the call that paid for it
+        (cached,) = node_module._RESPONSE_CACHE.values()
+        assert cached.usage_metadata["total_tokens"] == 5
+
+    async def test_cache_shared_by_sync_and_async_paths(self, fake_model):
+        """A reply cached by invoke is a hit for ainvoke."""
+        node = make_node(cache=True)
+        state = {"messages": [HumanMessage(content="2+2")]}
+
+        node.invoke(state)
+        await node.ainvoke(state)
+
+        assert [method for method, _ in fake_model.calls] == ["invoke"]
+
+    def test_no_cache_when_sampling(self, fake_model):
+        """temperature > 0 disables the cache even with cache=True."""
+        node = create_simple_node(
+            "calculator", lambda: "instr", make_config(temperature=0.7), cache=True
+        )
+        state = {"messages": [HumanMessage(content="2+2")]}
+
+        node.invoke(state)
+        node.invoke(state)
+
+        assert len(fake_model.calls) == 2
+        assert len(node_module._RESPONSE_CACHE) == 0
+
+    def test_lru_bound(self, fake_model):
+        """The cache keeps at most _RESPONSE_CACHE_MAX_SIZE entries, LRU first out."""
+        node = make_node(cache=True)
+
+        with patch.object(node_module, "_RESPONSE_CACHE_MAX_SIZE", 2):
+            for text in ("a", "b"):
+                node.invoke({"messages": [HumanMessage(content=text)]})
+            # Touch "a" so "b" is the least recently used
+            node.invoke({"messages": [HumanMessage(content="a")]})
+            node.invoke({"messages": [HumanMessage(content="c")]})
+            assert len(node_module._RESPONSE_CACHE) == 2
+
+            fake_model.calls.clear()
+            node.invoke({"messages": [HumanMessage(content="a")]})
+            node.invoke({"messages": [HumanMessage(content="b")]})
+
+        assert [prompt[-1].content for _, prompt in fake_model.calls] == ["b"]
+
+    def test_empty_response_is_a_fresh_copy(self):
+        """Callers get id-less copies, never the shared _EMPTY_RESPONSE."""
+        first = _empty_response()
+        first.id = "assigned-by-add-messages"
+
+        second = _empty_response()
+
+        assert second is not node_module._EMPTY_RESPONSE
+        assert second.id is None
+        assert node_module._EMPTY_RESPONSE.id is None
+        assert second.content == "No input to process"
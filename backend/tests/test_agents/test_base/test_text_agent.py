@@ -0,0 +1,139 @@
+"""
+Unit tests for the TextAgent tool completion cache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from src.agents._base import text_agent as text_agent_module
+from src.agents._base.text_agent import TextAgent
+from src.shared.config.models_config import SubagentModelConfig
+
+
+class CountingModel:
+    """Stand-in for ChatLiteLLM: numbered replies, optional failures."""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    def _reply(self, prompt) -> AIMessage:
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("provider error")
+        return AIMessage(content=f"{prompt[-1].content} #{self.calls}")
+
+    def invoke(self, prompt, **kwargs):
+        return self._reply(prompt)
+
+    async def ainvoke(self, prompt, **kwargs):
+        return self._reply(prompt)
+
+
+def make_agent(temperature: float = 0.0) -> tuple[TextAgent, CountingModel]:
+    config = SubagentModelConfig(
+        provider="openai",
+        model_name="test-model",
+        api_key="test",
+        temperature=temperature,
+    )
+    agent = TextAgent(
+        "corrector",
+        lambda: config,
+        "Correct the text.",
+        empty_reply="No text to correct",
+        completed_message="Correction completed",
+    )
+    model = CountingModel()
+    # cached_property: the instance attribute replaces the ChatLiteLLM
+    agent.model = model
+    return agent, model
+
+
+@pytest.fixture(autouse=True)
+def no_microbatch(monkeypatch):
+    """acomplete calls model.ainvoke directly."""
+    monkeypatch.delenv("VOXY_LLM_MICROBATCH", raising=False)
+
+
+class TestCompletionCache:
+    """Test suite for TextAgent._cached_completion / _store_completion."""
+
+    def test_hit_within_ttl(self):
+        """A repeated prompt is answered from the cache."""
+        agent, model = make_agent()
+
+        first = agent.complete("Eu foi")
+        second = agent.complete("Eu foi")
+
+        assert first == second == "Eu foi #1"
+        assert model.calls == 1
+
+    async def test_hit_shared_by_sync_and_async_paths(self):
+        """complete and acomplete share one cache."""
+        agent, model = make_agent()
+
+        agent.complete("Eu foi")
+
+        assert await agent.acomplete("Eu foi") == "Eu foi #1"
+        assert model.calls == 1
+
+    def test_miss_after_expiry(self):
+        """Entries older than _COMPLETION_CACHE_TTL are recomputed."""
+        agent, model = make_agent()
+        ttl = text_agent_module._COMPLETION_CACHE_TTL
+
+        with patch.object(text_agent_module.time, "monotonic", return_value=1000.0):
+            agent.complete("Eu foi")
+        with patch.object(
+            text_agent_module.time, "monotonic", return_value=1000.0 + ttl - 1
+        ):
+            assert agent.complete("Eu foi") == "Eu foi #1"
+        with patch.object(
+            text_agent_module.time, "monotonic", return_value=1000.0 + ttl
+        ):
+            assert agent.complete("Eu foi") == "Eu foi #2"
+
+        assert model.calls == 2
+
+    def test_eviction_past_max_size(self):
+        """The least recently used prompt is evicted past the size limit."""
+        agent, model = make_agent()
+
+        with patch.object(text_agent_module, "_COMPLETION_CACHE_MAX_SIZE", 2):
+            agent.complete("a")
+            agent.complete("b")
+            # Touch "a" so "b" is the least recently used
+            agent.complete("a")
+            agent.complete("c")
+
+            assert list(agent._completions) == ["a", "c"]
+            assert agent.complete("b") == "b #4"
+
+        assert model.calls == 4
+
+    def test_no_caching_when_sampling(self):
+        """temperature > 0 makes every call hit the model."""
+        agent, model = make_agent(temperature=0.7)
+
+        agent.complete("Eu foi")
+        agent.complete("Eu foi")
+
+        assert model.calls == 2
+        assert len(agent._completions) == 0
+
+    async def test_failures_are_not_cached(self):
+        """A failed call raises and the next call retries the model."""
+        agent, model = make_agent()
+        model.fail = True
+
+        with pytest.raises(RuntimeError):
+            agent.complete("Eu foi")
+        with pytest.raises(RuntimeError):
+            await agent.acomplete("Eu foi")
+        assert len(agent._completions) == 0
+
+        model.fail = False
+        assert agent.complete("Eu foi") == "Eu foi #3"
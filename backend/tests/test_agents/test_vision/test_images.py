@@ -0,0 +1,199 @@
+"""
+Unit tests for the vision image preparation (downscaling before the model call).
+"""
+
+import base64
+import io
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from src.agents.vision import images
+from src.agents.vision.images import (
+    _downscale,
+    needs_full_resolution,
+    prepare_image_url,
+)
+from src.agents.vision.node import _image_options
+from src.shared.config.models_config import VisionModelConfig
+
+# EXIF tag 0x0112; value 6 = stored sideways, display rotated 90° clockwise
+_EXIF_ORIENTATION = 0x0112
+
+
+def _noise(width: int, height: int, mode: str = "RGB") -> Image.Image:
+    """Noisy image, so the downscaled encoding is reliably smaller."""
+    return Image.effect_noise((width, height), 64).convert(mode)
+
+
+def _encode(image: Image.Image, fmt: str, **params) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, fmt, **params)
+    return buffer.getvalue()
+
+
+def _data_uri(data: bytes, mime_type: str) -> str:
+    return f"data:{mime_type};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+@pytest.fixture(autouse=True)
+def clear_data_uri_cache():
+    """Isolate the module-level data URI cache between tests."""
+    images._DATA_URI_CACHE.clear()
+    images._data_uri_cache_bytes = 0
+    yield
+    images._DATA_URI_CACHE.clear()
+    images._data_uri_cache_bytes = 0
+
+
+class TestDownscale:
+    """Test suite for _downscale."""
+
+    def test_within_max_edge_is_unchanged(self):
+        """Images already within max_edge are returned as the same bytes."""
+        data = _encode(_noise(64, 32), "JPEG")
+
+        resized, mime_type = _downscale(data, "image/jpeg", 128, 85)
+
+        assert resized is data
+        assert mime_type == "image/jpeg"
+
+    def test_opaque_image_is_recompressed_as_jpeg(self):
+        """Opaque images are shrunk to max_edge and re-encoded as JPEG."""
+        data = _encode(_noise(400, 200), "PNG")
+
+        resized, mime_type = _downscale(data, "image/png", 100, 85)
+
+        assert mime_type == "image/jpeg"
+        with Image.open(io.BytesIO(resized)) as image:
+            assert image.format == "JPEG"
+            assert image.size == (100, 50)
+
+    def test_alpha_is_kept_as_png(self):
+        """Images with transparency stay PNG instead of losing alpha to JPEG."""
+        data = _encode(_noise(400, 400, "RGBA"), "PNG")
+
+        resized, mime_type = _downscale(data, "image/png", 100, 85)
+
+        assert mime_type == "image/png"
+        with Image.open(io.BytesIO(resized)) as image:
+            assert image.format == "PNG"
+            assert image.mode == "RGBA"
+            assert image.size == (100, 100)
+
+    def test_pixel_bomb_guard(self):
+        """Images over _MAX_IMAGE_PIXELS are returned without being decoded."""
+        data = _encode(_noise(400, 200), "JPEG")
+
+        with (
+            patch.object(images, "_MAX_IMAGE_PIXELS", 400 * 200 - 1),
+            patch.object(Image.Image, "thumbnail") as thumbnail,
+        ):
+            resized, mime_type = _downscale(data, "image/jpeg", 100, 85)
+
+        assert resized is data
+        assert mime_type == "image/jpeg"
+        thumbnail.assert_not_called()
+
+    def test_animated_image_is_unchanged(self):
+        """Animated GIFs pass through (thumbnail would keep only frame one)."""
+        frames = [_noise(300, 300, "P"), _noise(300, 300, "P")]
+        data = _encode(frames[0], "GIF", save_all=True, append_images=frames[1:])
+
+        resized, mime_type = _downscale(data, "image/gif", 100, 85)
+
+        assert resized is data
+        assert mime_type == "image/gif"
+
+    def test_undecodable_data_is_unchanged(self):
+        """Data Pillow cannot identify is returned as is."""
+        data = b"not an image"
+
+        assert _downscale(data, "image/png", 100, 85) == (data, "image/png")
+
+    def test_exif_orientation_is_applied(self):
+        """EXIF-rotated photos come out upright (re-encoding drops the tag)."""
+        exif = Image.Exif()
+        exif[_EXIF_ORIENTATION] = 6
+        data = _encode(_noise(400, 200), "JPEG", exif=exif)
+
+        resized, _ = _downscale(data, "image/jpeg", 100, 85)
+
+        with Image.open(io.BytesIO(resized)) as image:
+            assert image.size == (50, 100)
+            assert image.getexif().get(_EXIF_ORIENTATION) in (None, 1)
+
+
+class TestPrepareImageUrl:
+    """Test suite for prepare_image_url."""
+
+    def test_remote_url_is_unchanged(self):
+        """Remote URLs are left for the provider to fetch."""
+        url = "https://example.com/photo.jpg"
+
+        assert prepare_image_url(url, max_edge=100) == url
+
+    def test_no_max_edge_is_unchanged(self):
+        """max_edge=None keeps data URIs at their original resolution."""
+        uri = _data_uri(_encode(_noise(400, 200), "JPEG"), "image/jpeg")
+
+        assert prepare_image_url(uri, max_edge=None) is uri
+
+    def test_data_uri_is_downscaled_and_cached(self):
+        """Large data URIs are re-encoded once and then served from the cache."""
+        uri = _data_uri(_encode(_noise(400, 200), "PNG"), "image/png")
+
+        prepared = prepare_image_url(uri, max_edge=100)
+
+        header, _, payload = prepared.partition(",")
+        assert header == "data:image/jpeg;base64"
+        with Image.open(io.BytesIO(base64.b64decode(payload))) as image:
+            assert image.size == (100, 50)
+
+        with patch.object(images, "_downscale") as downscale:
+            assert prepare_image_url(uri, max_edge=100) == prepared
+        downscale.assert_not_called()
+
+    def test_small_data_uri_is_unchanged(self):
+        """Data URIs already within max_edge are returned as is."""
+        uri = _data_uri(_encode(_noise(64, 32), "JPEG"), "image/jpeg")
+
+        assert prepare_image_url(uri, max_edge=100) is uri
+
+    def test_invalid_base64_is_unchanged(self):
+        """Malformed payloads are sent unchanged rather than raising."""
+        uri = "data:image/png;base64,not*valid*base64"
+
+        assert prepare_image_url(uri, max_edge=100) == uri
+
+
+class TestFullResolutionBypass:
+    """OCR-like queries keep the original image resolution."""
+
+    @pytest.mark.parametrize(
+        "query",
+        ["Extract the text from this receipt", "Faça OCR", "Transcreva a placa"],
+    )
+    def test_ocr_queries_need_full_resolution(self, query):
+        """Text extraction keywords (EN/PT) request the full resolution."""
+        assert needs_full_resolution(query)
+
+    def test_descriptive_query_does_not(self):
+        """Ordinary descriptions accept the downscaled image."""
+        assert not needs_full_resolution("What animal is in this picture?")
+
+    def test_image_options_skip_max_edge_for_ocr(self):
+        """_image_options drops max_edge for OCR queries only."""
+        config = VisionModelConfig(
+            provider="openrouter",
+            model_name="test/vision",
+            api_key="test",
+            max_tokens=256,
+            image_max_edge=512,
+            image_jpeg_quality=70,
+        )
+
+        with patch("src.agents.vision.node._get_vision_config", return_value=config):
+            assert _image_options("Describe this photo") == (512, 70)
+            assert _image_options("Extract the text") == (None, 70)
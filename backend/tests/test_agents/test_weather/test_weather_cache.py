@@ -0,0 +1,137 @@
+"""
+Unit tests for the weather lookup cache (TTL + LRU, successful lookups only).
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from src.agents.weather import node as weather_module
+from src.agents.weather.node import _get_weather_api, _get_weather_api_sync
+
+SAO_PAULO = {
+    "name": "São Paulo",
+    "main": {"temp": 23.0, "feels_like": 24.0, "humidity": 65},
+    "weather": [{"description": "céu limpo"}],
+    "wind": {"speed": 3.2},
+}
+
+
+def ok_response(data: dict = SAO_PAULO) -> httpx.Response:
+    return httpx.Response(200, json=data)
+
+
+@pytest.fixture(autouse=True)
+def weather_env(monkeypatch):
+    """API key set and an empty cache for every test."""
+    monkeypatch.setenv("OPENWEATHER_API_KEY", "test-key")
+    weather_module._WEATHER_CACHE.clear()
+    yield
+    weather_module._WEATHER_CACHE.clear()
+
+
+@pytest.fixture
+def http_get():
+    """Patch the shared sync client's get."""
+    with patch.object(
+        weather_module._HTTP_CLIENT, "get", return_value=ok_response()
+    ) as get:
+        yield get
+
+
+class TestWeatherCache:
+    """Test suite for the weather lookup cache."""
+
+    def test_repeat_lookup_is_cached(self, http_get):
+        """A second lookup for the same city makes no HTTP call."""
+        first = _get_weather_api_sync("São Paulo")
+        second = _get_weather_api_sync("São Paulo")
+
+        assert first == second
+        assert first.startswith("🌤️ São Paulo: 23.0°C (céu limpo)")
+        assert http_get.call_count == 1
+
+    def test_hit_uses_callers_city_spelling(self, http_get):
+        """The key ignores case, but each reply names the city as asked."""
+        _get_weather_api_sync("são paulo")
+
+        reply = _get_weather_api_sync("SÃO PAULO", "br")
+
+        assert reply.startswith("🌤️ SÃO PAULO: ")
+        assert http_get.call_count == 1
+
+    def test_miss_after_ttl(self, http_get):
+        """Entries older than _WEATHER_TTL are fetched again."""
+        ttl = weather_module._WEATHER_TTL
+
+        with patch.object(weather_module.time, "monotonic", return_value=1000.0):
+            _get_weather_api_sync("São Paulo")
+        with patch.object(
+            weather_module.time, "monotonic", return_value=1000.0 + ttl - 1
+        ):
+            _get_weather_api_sync("São Paulo")
+        assert http_get.call_count == 1
+
+        with patch.object(weather_module.time, "monotonic", return_value=1000.0 + ttl):
+            _get_weather_api_sync("São Paulo")
+        assert http_get.call_count == 2
+
+    def test_lru_eviction(self, http_get):
+        """The least recently used city is evicted past the entry limit."""
+        with patch.object(weather_module, "_WEATHER_CACHE_MAX_ENTRIES", 2):
+            _get_weather_api_sync("Recife")
+            _get_weather_api_sync("Natal")
+            # Touch Recife so Natal is the least recently used
+            _get_weather_api_sync("Recife")
+            _get_weather_api_sync("Belém")
+
+        assert list(weather_module._WEATHER_CACHE) == [
+            ("recife", "BR"),
+            ("belém", "BR"),
+        ]
+        assert http_get.call_count == 3
+
+    def test_only_successful_lookups_are_cached(self, http_get):
+        """Non-200 replies are returned but the next call retries the API."""
+        http_get.return_value = httpx.Response(404, json={"message": "not found"})
+
+        reply = _get_weather_api_sync("Atlantis")
+
+        assert reply == "❌ Não foi possível obter o clima para Atlantis"
+        assert len(weather_module._WEATHER_CACHE) == 0
+
+        http_get.return_value = ok_response()
+        _get_weather_api_sync("Atlantis")
+        assert http_get.call_count == 2
+
+    def test_transport_errors_are_not_cached(self, http_get):
+        """Exceptions produce the error reply and leave the cache empty."""
+        http_get.side_effect = httpx.ConnectError("offline")
+
+        reply = _get_weather_api_sync("São Paulo")
+
+        assert reply.startswith("⚠️ Erro ao consultar clima")
+        assert len(weather_module._WEATHER_CACHE) == 0
+
+    async def test_cache_shared_with_async_path(self, http_get):
+        """A lookup cached by the sync path is a hit for the async one."""
+        client = AsyncMock()
+        _get_weather_api_sync("São Paulo")
+
+        with patch.object(weather_module, "_get_client", return_value=client):
+            reply = await _get_weather_api("são paulo")
+
+        assert reply.startswith("🌤️ são paulo: ")
+        client.get.assert_not_called()
+
+    async def test_async_lookup_is_cached(self):
+        """The async path stores successful lookups too."""
+        client = AsyncMock()
+        client.get.return_value = ok_response()
+
+        with patch.object(weather_module, "_get_client", return_value=client):
+            await _get_weather_api("São Paulo")
+            await _get_weather_api("São Paulo")
+
+        assert client.get.await_count == 1
@@ -0,0 +1 @@
+"""Tests for shared configuration and utilities (src/shared)."""
@@ -0,0 +1,11 @@
+"""
+Fixtures for the src/shared tests.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cleanup_global_state():
+    """Override the root fixture, which resets legacy src.voxy_agents singletons."""
+    yield
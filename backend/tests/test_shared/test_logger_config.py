@@ -0,0 +1,134 @@
+"""
+Unit tests for the orjson JSON log sink (JsonFileSink).
+"""
+
+import io
+import json
+import zipfile
+
+import pytest
+from loguru import logger
+
+from src.shared.config.logger_config import JsonFileSink
+
+
+def key_tree(value):
+    """Nested key structure of a JSON value (leaves become None)."""
+    if isinstance(value, dict):
+        return {key: key_tree(item) for key, item in value.items()}
+    return None
+
+
+@pytest.fixture
+def only_test_records():
+    """Filter that keeps only records logged by the test."""
+    return lambda record: record["extra"].get("test_sink") is True
+
+
+def log_sample_records():
+    test_logger = logger.bind(test_sink=True, event="TEST", source="")
+    test_logger.info("plain {} message", "formatted")
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        test_logger.exception("with exception")
+
+
+class TestJsonFileSink:
+    """Test suite for JsonFileSink."""
+
+    def test_keys_match_loguru_serialize(self, tmp_path, only_test_records):
+        """Each line has the same key structure as serialize=True."""
+        reference = io.StringIO()
+        path = tmp_path / "structured.json"
+        ids = [
+            logger.add(
+                reference, format="{message}", serialize=True, filter=only_test_records
+            ),
+            logger.add(
+                JsonFileSink(path, max_bytes=1024 * 1024, retention=7),
+                format="{message}",
+                filter=only_test_records,
+            ),
+        ]
+        try:
+            log_sample_records()
+        finally:
+            for handler_id in ids:
+                logger.remove(handler_id)
+
+        expected = [json.loads(line) for line in reference.getvalue().splitlines()]
+        actual = [json.loads(line) for line in path.read_text().splitlines()]
+
+        assert len(actual) == len(expected) == 2
+        for got, want in zip(actual, expected):
+            assert key_tree(got) == key_tree(want)
+        assert actual[0]["record"]["message"] == "plain formatted message"
+        assert actual[1]["record"]["exception"]["type"] == "ValueError"
+
+    def test_shared_record_is_not_modified(self, tmp_path, only_test_records):
+        """Sinks added after the JSON sink see no extra 'serialized' key."""
+        seen_extra = []
+        ids = [
+            logger.add(
+                JsonFileSink(tmp_path / "structured.json", 1024 * 1024, 7),
+                format="{message}",
+                filter=only_test_records,
+            ),
+            logger.add(
+                lambda message: seen_extra.append(dict(message.record["extra"])),
+                filter=only_test_records,
+            ),
+        ]
+        try:
+            log_sample_records()
+        finally:
+            for handler_id in ids:
+                logger.remove(handler_id)
+
+        assert seen_extra
+        assert all("serialized" not in extra for extra in seen_extra)
+
+    def test_enqueued_writes(self, tmp_path, only_test_records):
+        """Works with enqueue=True (records serialized in the writer thread)."""
+        path = tmp_path / "structured.json"
+        handler_id = logger.add(
+            JsonFileSink(path, 1024 * 1024, 7),
+            format="{message}",
+            enqueue=True,
+            filter=only_test_records,
+        )
+        try:
+            log_sample_records()
+            logger.complete()
+        finally:
+            logger.remove(handler_id)
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["record"]["extra"]["event"] for line in lines] == [
+            "TEST",
+            "TEST",
+        ]
+
+    def test_rotation_compression_and_retention(self, tmp_path, only_test_records):
+        """Full files are zipped alongside and only `retention` archives remain."""
+        path = tmp_path / "structured.json"
+        handler_id = logger.add(
+            JsonFileSink(path, max_bytes=1, retention=2),
+            format="{message}",
+            filter=only_test_records,
+        )
+        test_logger = logger.bind(test_sink=True)
+        try:
+            for i in range(5):
+                test_logger.info(f"record {i}")
+        finally:
+            logger.remove(handler_id)
+
+        archives = sorted(tmp_path.glob("structured.*.json.zip"))
+        assert len(archives) == 2
+        with zipfile.ZipFile(archives[-1]) as archive:
+            (name,) = archive.namelist()
+            rotated = json.loads(archive.read(name))
+        assert rotated["record"]["message"] == "record 3"
+        assert json.loads(path.read_text())["record"]["message"] == "record 4"
@@ -11,8 +11,10 @@ from voxy_agents.langgraph.usage_callback import (
     UsageCallbackHandler,
 )
 from voxy_agents.langgraph.usage_extractor import (
+    UsageReport,
     extract_tool_invocations,
     extract_usage_from_state,
+    walk_state_once,
 )
 from voxy_agents.utils.usage_tracker import SubagentInfo, UsageMetrics
 
@@ -217,6 +219,47 @@ class TestExtractToolInvocations:
             assert expected_name in agent_names
 
 
+class TestWalkStateOnce:
+    """Test suite for walk_state_once()."""
+
+    def test_matches_individual_extractors(self):
+        """Test single pass returns the same usage and tools as the adapters."""
+        ai_msg = AIMessage(content="Bonjour")
+        ai_msg.usage_metadata = {
+            "input_tokens": 120,
+            "output_tokens": 30,
+            "total_tokens": 150,
+        }
+        tool_msg = ToolMessage(
+            content="Bonjour",
+            name="translate_text",
+            tool_call_id="call_123",
+        )
+
+        state = create_initial_state(
+            messages=[HumanMessage(content="Translate 'Hello'"), tool_msg, ai_msg]
+        )
+
+        report = walk_state_once(state)
+
+        assert isinstance(report, UsageReport)
+        assert report.usage == extract_usage_from_state(state)
+        assert report.usage.total_tokens == 150
+        assert [s.name for s in report.subagents] == [
+            s.name for s in extract_tool_invocations(state)
+        ]
+
+    def test_empty_state(self):
+        """Test returns an empty report when state has no messages."""
+        state = create_initial_state(messages=[])
+
+        report = walk_state_once(state)
+
+        assert report.usage is None
+        assert report.subagents == []
+        assert report.total_cost is None
+
+
 class TestUsageExtractorIntegration:
     """Integration tests for full usage extraction flow."""
 